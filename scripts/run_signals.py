@@ -13,7 +13,14 @@ import time
 import random
 from datetime import datetime, timedelta
 
-from src.signals import LinkedInSignalMonitor, ExternalSignalAggregator, SignalEvent
+import numpy as np
+
+from src.signals import LinkedInSignalMonitor, ExternalSignalAggregator, SignalEvent, SignalType, SignalSource
+from src.enrichment import (
+    LeadEnricher, ICPMatcher, EnrichedLead, EnrichedCompany, EnrichedContact, SeniorityLevel,
+)
+from src.scoring import IntentScorer
+from src.engagement import HighIntentFilter, ConversationStarter
 
 
 def print_banner():
@@ -117,8 +124,6 @@ def interactive_demo():
     print("\n\n📊 Demo 7: Lead Enrichment (Block 1.5)")
     print("-" * 40)
     
-    from src.enrichment import LeadEnricher, ICPMatcher, Industry
-    
     enricher = LeadEnricher()
     icp_matcher = ICPMatcher()
     
@@ -153,10 +158,6 @@ def interactive_demo():
     print("\n\n📊 Demo 9: Intent Scoring (Block 2.5)")
     print("-" * 40)
     
-    from src.scoring import IntentScorer, IntentScore, ScoringConfig
-    from src.signals import SignalEvent, SignalType, SignalSource
-    from datetime import datetime
-    
     scorer = IntentScorer()
     
     # 1. Hot Lead (Demo Request + Engagement)
@@ -186,9 +187,6 @@ def interactive_demo():
     print("\n\n📊 Demo 10: Engagement Pipeline (Block 3.5)")
     print("-" * 40)
     
-    from src.engagement import HighIntentFilter, ConversationStarter
-    from src.enrichment import EnrichedLead, EnrichedCompany, EnrichedContact, SeniorityLevel
-    
     # Setup
     intent_filter = HighIntentFilter()
     starter = ConversationStarter()
@@ -249,13 +247,34 @@ def simulate_signals():
     event_types = ["like", "comment", "share"]
     titles = ["VP of Sales", "CTO", "Director of Engineering", "Head of Product", "CEO"]
     
+    signal_kinds = ["engagement", "visit", "funding", "role", "event"]
+    
+    # Draw the per-signal choices in batches (one vectorized call per column)
+    # and walk the pre-drawn rows; refill when exhausted
+    rng = np.random.default_rng()
+    batch_size = 256
+    
+    def draw_batch():
+        return zip(
+            rng.integers(0, len(signal_kinds), size=batch_size).tolist(),
+            rng.integers(0, len(users), size=batch_size).tolist(),
+            rng.integers(0, len(companies), size=batch_size).tolist(),
+            rng.uniform(1.0, 3.0, size=batch_size).tolist(),
+        )
+    
     signal_count = 0
+    batch = draw_batch()
     
     try:
         while True:
-            signal_type = random.choice(["engagement", "visit", "funding", "role", "event"])
-            user_id, user_name = random.choice(users)
-            company = random.choice(companies)
+            row = next(batch, None)
+            if row is None:
+                batch = draw_batch()
+                row = next(batch)
+            kind_idx, user_idx, company_idx, delay = row
+            signal_type = signal_kinds[kind_idx]
+            user_id, user_name = users[user_idx]
+            company = companies[company_idx]
             
             if signal_type == "engagement":
                 signal = monitor.parse_engagement({
@@ -303,7 +322,7 @@ def simulate_signals():
             print(f"\n   [Total signals collected: {signal_count}]")
             
             # Random delay between signals
-            time.sleep(random.uniform(1.0, 3.0))
+            time.sleep(delay)
             
     except KeyboardInterrupt:
         print(f"\n\n🛑 Stopped. Collected {signal_count} signals.")
@@ -311,8 +330,9 @@ def simulate_signals():
         # Show aggregation summary
         print("\n📈 Signal Summary by User:")
         print("-" * 40)
+        now = datetime.now()
         for user_id, user_name in users:
-            agg = monitor.aggregate_signals(user_id)
+            agg = monitor.aggregate_signals(user_id, now=now)
             if agg["total_count"] > 0:
                 print(f"   {user_name}: {agg['total_count']} signals, freq={agg['frequency_score']:.3f}")
 
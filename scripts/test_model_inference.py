@@ -28,7 +28,7 @@ def test_model_variance():
     
     checkpoint_path = "checkpoints/lead_scout_best.pth"
     if os.path.exists(checkpoint_path):
-        model.load_state_dict(torch.load(checkpoint_path))
+        model.load_state_dict(torch.load(checkpoint_path, map_location="cpu"))
         model.eval()
         print("✅ Model loaded successfully")
     else:
@@ -13,6 +13,14 @@ from ..signals.signal_event import SignalEvent
 from ..enrichment.data_classes import EnrichedLead, SeniorityLevel
 
 
+# Message templates, built once and filled with str.format per message
+_MESSAGE_TMPL = "Hi {first_name},\n\n{hook}\n\n{role_context}\n\nWorth a quick chat?\n\nBest,"
+_ENGAGEMENT_TMPL = "Saw you {action}ed our recent post on LinkedIn."
+_FUNDING_TMPL = "Huge congrats on the {round} funding round!"
+_ROLE_CHANGE_TMPL = "Congrats on the new role as {title}!"
+_EVENT_TMPL = "Saw you're also attending {event}."
+
+
 class ConversationStarter:
     """
     Conversation Starter (Agent 3.5B)
@@ -36,7 +44,7 @@ class ConversationStarter:
             OutreachMessage with body and subject
         """
         # 1. Select opening hook based on strongest recent signal
-        primary_signal = sorted(signals, key=lambda s: s.strength, reverse=True)[0] if signals else None
+        primary_signal = max(signals, key=lambda s: s.strength) if signals else None
         hook = self._get_opening_hook(primary_signal)
         
         # 2. Select value prop based on role/seniority
@@ -46,13 +54,7 @@ class ConversationStarter:
         first_name = lead.contact.name.split(" ")[0] if lead.contact and lead.contact.name else "there"
         company_name = lead.company.name if lead.company else "your company"
         
-        body = (
-            f"Hi {first_name},\n\n"
-            f"{hook}\n\n"
-            f"{role_context}\n\n"
-            f"Worth a quick chat?\n\n"
-            f"Best,"
-        )
+        body = _MESSAGE_TMPL.format(first_name=first_name, hook=hook, role_context=role_context)
         
         return OutreachMessage(
             body=body,
@@ -72,22 +74,22 @@ class ConversationStarter:
         
         if stype == "content_engagement":
             action = data.get("event_type", "post")
-            return f"Saw you {action}ed our recent post on LinkedIn."
+            return _ENGAGEMENT_TMPL.format(action=action)
             
         elif stype == "profile_visit":
             return "Thanks for stopping by my profile recently."
             
         elif stype == "funding_round":
             round_type = str(data.get("round_type", "")).replace("_", " ").title()
-            return f"Huge congrats on the {round_type} funding round!"
+            return _FUNDING_TMPL.format(round=round_type)
             
         elif stype == "role_change":
             new_title = data.get("new_title", "new role")
-            return f"Congrats on the new role as {new_title}!"
+            return _ROLE_CHANGE_TMPL.format(title=new_title)
             
         elif stype == "event_attendance":
             event = data.get("event_name", "the event")
-            return f"Saw you're also attending {event}."
+            return _EVENT_TMPL.format(event=event)
             
         elif stype == "demo_request":
              return "Thanks for requesting a demo with us."
@@ -7,7 +7,7 @@ Gates automated outreach to only high-quality, high-intent leads:
 - Applies exclusion rules (competitors, customers, etc.)
 """
 
-from typing import Optional
+from typing import FrozenSet, Iterable, Optional, Tuple
 from datetime import datetime
 
 from .data_classes import (
@@ -19,6 +19,27 @@ from ..scoring.data_classes import IntentScore
 from ..enrichment.data_classes import EnrichedLead
 
 
+def _term_index(terms: Iterable[str]) -> Tuple[FrozenSet[str], Tuple[int, ...]]:
+    """Lowercased term set plus the distinct term lengths, for _contains_any."""
+    lowered = frozenset(t.lower() for t in terms)
+    return lowered, tuple(sorted({len(t) for t in lowered}))
+
+
+def _contains_any(text: str, index: Tuple[FrozenSet[str], Tuple[int, ...]]) -> bool:
+    """
+    True if any indexed term is a substring of text (already lowercased).
+    
+    Checks each window of text per distinct term length against the set, so
+    cost grows with len(text) and the number of lengths, not the term count.
+    """
+    terms, lengths = index
+    for k in lengths:
+        for i in range(len(text) - k + 1):
+            if text[i:i + k] in terms:
+                return True
+    return False
+
+
 class HighIntentFilter:
     """
     High Intent Filter (Agent 3.5A)
@@ -29,6 +50,9 @@ class HighIntentFilter:
     def __init__(self, config: Optional[EngagementConfig] = None):
         """Initialize with config."""
         self.config = config or EngagementConfig()
+        # Exclusion indexes, built on first use (see _refresh_exclusion_indexes)
+        self._competitors_snapshot = None
+        self._excluded_domains_snapshot = None
     
     def evaluate_lead(
         self,
@@ -86,24 +110,42 @@ class HighIntentFilter:
                 decision_time=datetime.now().isoformat()
             )
     
+    def _refresh_exclusion_indexes(self) -> None:
+        """
+        Rebuild the competitor / excluded-domain indexes if the config lists changed.
+        
+        Exclusion lists can hold thousands of entries, so they are indexed
+        once rather than per lead; the lists are mutable config fields, so
+        each call compares them against the snapshot the index was built from.
+        """
+        competitors = tuple(self.config.competitors)
+        if competitors != self._competitors_snapshot:
+            self._competitor_index = _term_index(competitors)
+            self._competitors_snapshot = competitors
+        
+        excluded_domains = tuple(self.config.excluded_domains)
+        if excluded_domains != self._excluded_domains_snapshot:
+            self._excluded_domain_index = _term_index(excluded_domains)
+            self._excluded_domains_snapshot = excluded_domains
+    
     def _check_exclusions(self, lead: EnrichedLead) -> Optional[str]:
         """Check if lead matches any exclusion rules."""
         if not lead.company or not lead.company.website:
             return None
         
+        self._refresh_exclusion_indexes()
+        
         # Safety check: if company name is in competitor list
         company_name = lead.company.name.lower()
         
         # Check against competitors (name match)
-        for competitor in self.config.competitors:
-            if competitor.lower() in company_name:
-                return "Competitor detected"
+        if _contains_any(company_name, self._competitor_index):
+            return "Competitor detected"
                 
         # Check excluded domains
         if lead.company.website:
             domain = lead.company.website.lower()
-            for excluded in self.config.excluded_domains:
-                if excluded.lower() in domain:
-                    return "Excluded domain"
+            if _contains_any(domain, self._excluded_domain_index):
+                return "Excluded domain"
                 
         return None
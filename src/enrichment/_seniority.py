@@ -0,0 +1,35 @@
+"""
+Job title -> SeniorityLevel detection shared by the enricher, the ICP matcher
+and the external signal aggregator.
+
+Each level's keywords are one precompiled alternation, checked in priority
+order (substring match, no word boundaries). Titles repeat heavily across
+leads, so results are cached.
+"""
+
+import re
+from functools import lru_cache
+
+from .data_classes import SeniorityLevel
+
+
+# Checked in order: "director" first so it wins over the "cto" inside it
+_SENIORITY_PATTERNS = tuple(
+    (level, re.compile("|".join(re.escape(k) for k in keywords)))
+    for level, keywords in (
+        (SeniorityLevel.DIRECTOR, ("director",)),
+        (SeniorityLevel.C_LEVEL, ("ceo", "cto", "cfo", "coo", "chief", "founder", "co-founder")),
+        (SeniorityLevel.VP, ("vp", "vice president")),
+        (SeniorityLevel.MANAGER, ("manager", "lead", "head")),
+    )
+)
+
+
+@lru_cache(maxsize=4096)
+def detect_seniority(title: str) -> SeniorityLevel:
+    """Detect seniority level from a job title (any case)."""
+    title_lower = title.lower()
+    for level, pattern in _SENIORITY_PATTERNS:
+        if pattern.search(title_lower):
+            return level
+    return SeniorityLevel.INDIVIDUAL_CONTRIBUTOR
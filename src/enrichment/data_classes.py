@@ -34,7 +34,7 @@ class Industry(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedCompany:
     """
     Enriched company data.
@@ -78,7 +78,7 @@ class EnrichedCompany:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedContact:
     """
     Enriched contact/prospect data.
@@ -116,7 +116,7 @@ class EnrichedContact:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialGraph:
     """
     Social network analysis for a prospect.
@@ -184,7 +184,7 @@ class ICPConfig:
         return 0.99 <= total <= 1.01
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedLead:
     """
     Fully enriched lead combining all data.
@@ -19,6 +19,7 @@ from .data_classes import (
     SeniorityLevel,
     Industry,
 )
+from ._seniority import detect_seniority
 
 
 class ICPMatcher:
@@ -290,17 +291,4 @@ class ICPMatcher:
     
     def _detect_seniority(self, title: str) -> SeniorityLevel:
         """Detect seniority level from job title."""
-        title_lower = title.lower()
-        
-        # Check director first
-        if "director" in title_lower:
-            return SeniorityLevel.DIRECTOR
-        
-        if any(t in title_lower for t in ["ceo", "cto", "cfo", "coo", "chief", "founder", "co-founder"]):
-            return SeniorityLevel.C_LEVEL
-        elif any(t in title_lower for t in ["vp", "vice president"]):
-            return SeniorityLevel.VP
-        elif any(t in title_lower for t in ["manager", "lead", "head"]):
-            return SeniorityLevel.MANAGER
-        else:
-            return SeniorityLevel.INDIVIDUAL_CONTRIBUTOR
+        return detect_seniority(title)
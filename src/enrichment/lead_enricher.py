@@ -18,6 +18,12 @@ from .data_classes import (
     SeniorityLevel,
     Industry,
 )
+from ._seniority import detect_seniority
+
+
+# LinkedIn URL slugs: /company/acme-corp, /in/john-doe
+_COMPANY_SLUG_RE = re.compile(r'/company/([^/?]+)')
+_PROFILE_SLUG_RE = re.compile(r'/in/([^/?]+)')
 
 
 class LeadEnricher:
@@ -216,7 +222,7 @@ class LeadEnricher:
     def _extract_company_id(self, url: str) -> str:
         """Extract company ID from LinkedIn URL."""
         # Match patterns like /company/acme-corp or /company/12345
-        match = re.search(r'/company/([^/?]+)', url)
+        match = _COMPANY_SLUG_RE.search(url)
         if match:
             return f"company:{match.group(1)}"
         return f"company:{url.split('/')[-1]}"
@@ -224,14 +230,14 @@ class LeadEnricher:
     def _extract_user_id(self, url: str) -> str:
         """Extract user ID from LinkedIn profile URL."""
         # Match patterns like /in/john-doe
-        match = re.search(r'/in/([^/?]+)', url)
+        match = _PROFILE_SLUG_RE.search(url)
         if match:
             return f"urn:li:person:{match.group(1)}"
         return f"urn:li:person:{url.split('/')[-1]}"
     
     def _extract_name_from_url(self, url: str) -> str:
         """Extract a readable name from URL."""
-        match = re.search(r'/company/([^/?]+)', url)
+        match = _COMPANY_SLUG_RE.search(url)
         if match:
             # Convert slug to name: acme-corp -> Acme Corp
             slug = match.group(1)
@@ -250,17 +256,4 @@ class LeadEnricher:
     
     def _detect_seniority(self, title: str) -> SeniorityLevel:
         """Detect seniority level from job title."""
-        title_lower = title.lower()
-        
-        # Check director first (before co-founder)
-        if "director" in title_lower:
-            return SeniorityLevel.DIRECTOR
-        
-        if any(t in title_lower for t in ["ceo", "cto", "cfo", "coo", "chief", "founder", "co-founder"]):
-            return SeniorityLevel.C_LEVEL
-        elif any(t in title_lower for t in ["vp", "vice president"]):
-            return SeniorityLevel.VP
-        elif any(t in title_lower for t in ["manager", "lead", "head"]):
-            return SeniorityLevel.MANAGER
-        else:
-            return SeniorityLevel.INDIVIDUAL_CONTRIBUTOR
+        return detect_seniority(title)
@@ -1,5 +1,6 @@
 from .positional_encoding import PositionalEncoding
 from .attention import SelfAttention, MultiHeadAttention
+from .rms_norm import RMSNorm
 from .transformer_block import TransformerBlock
 from .lead_scout import LeadScoutModel
 
@@ -7,6 +8,7 @@ __all__ = [
     'PositionalEncoding',
     'SelfAttention',
     'MultiHeadAttention',
+    'RMSNorm',
     'TransformerBlock',
     'LeadScoutModel',
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import math
 
 class SelfAttention(nn.Module):
@@ -40,6 +41,7 @@ class SelfAttention(nn.Module):
             x: Input embeddings, shape [batch_size, seq_len, embed_dim]
                Example: [8, 6, 128] - 8 leads, 6 tokens each, 128 dims
             mask: Optional attention mask, shape [batch_size, seq_len, seq_len]
+                  (bool, or numeric with 0 = masked)
                   Used to prevent attending to padding tokens
         
         Returns:
@@ -128,17 +130,21 @@ class MultiHeadAttention(nn.Module):
         
         self.scale = math.sqrt(self.head_dim)
     
-    def forward(self, x, mask=None):
+    def forward(self, x, mask=None, need_weights=True):
         """
         Apply multi-head self-attention.
         
         Args:
             x: Input embeddings, shape [batch_size, seq_len, embed_dim]
             mask: Optional mask, shape [batch_size, 1, seq_len] or [batch_size, seq_len, seq_len]
+            need_weights: If False, use the fused scaled_dot_product_attention
+                          kernel (no [batch, heads, seq, seq] weights are
+                          materialized) and return None for the weights
         
         Returns:
             output: Attention output, shape [batch_size, seq_len, embed_dim]
             attention_weights: Average attention across heads, [batch_size, seq_len, seq_len]
+                               (None if need_weights is False)
         """
         batch_size, seq_len, embed_dim = x.shape
         
@@ -159,6 +165,19 @@ class MultiHeadAttention(nn.Module):
         K = K.transpose(1, 2)
         V = V.transpose(1, 2)
         
+        # Expand mask for multiple heads
+        if mask is not None and mask.dim() == 3:  # [batch_size, 1, seq_len] or [batch_size, seq_len, seq_len]
+            mask = mask.unsqueeze(1)  # [batch_size, 1, 1 or seq_len, seq_len]
+        
+        if not need_weights:
+            # Fused softmax(QK^T / sqrt(d)) V; boolean mask is True where attending is allowed
+            attn_mask = mask
+            if mask is not None and mask.dtype != torch.bool:
+                attn_mask = mask != 0
+            output = F.scaled_dot_product_attention(Q, K, V, attn_mask=attn_mask)
+            output = output.transpose(1, 2).contiguous().view(batch_size, seq_len, embed_dim)
+            return self.W_o(output), None
+        
         # Step 4: Calculate attention scores for all heads
         attention_scores = torch.matmul(Q, K.transpose(-2, -1))
         # Shape: [batch_size, num_heads, seq_len, seq_len]
@@ -168,9 +187,6 @@ class MultiHeadAttention(nn.Module):
         
         # Step 6: Apply mask (if provided)
         if mask is not None:
-            # Expand mask for multiple heads
-            if mask.dim() == 3:  # [batch_size, 1, seq_len]
-                mask = mask.unsqueeze(1)  # [batch_size, 1, 1, seq_len]
             attention_scores = attention_scores.masked_fill(mask == 0, float('-inf'))
         
         # Step 7: Softmax
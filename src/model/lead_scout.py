@@ -13,11 +13,25 @@ class LeadScoutModel(nn.Module):
     3. Transformer Encoder: Stack of TransformerBlocks (Self-Attention + FFN)
     4. Pooling: Use [START] token representation
     5. Classifier: Predict probability (0-1)
+    
+    With share_layers=True a single TransformerBlock is reused for every layer
+    (ALBERT-style), cutting block parameters by num_layers× for deployment.
+    
+    With return_logits=True the final sigmoid is skipped; since sigmoid is
+    monotonic, thresholds can be applied to the raw logit instead.
+    
+    norm selects the blocks' normalization ("layer" or "rms", see
+    TransformerBlock); existing checkpoints were trained with "layer".
     """
     
-    def __init__(self, vocab_size=17, embed_dim=128, num_heads=4, num_layers=3, ff_dim=256, dropout=0.1):
+    def __init__(self, vocab_size=17, embed_dim=128, num_heads=4, num_layers=3, ff_dim=256, dropout=0.1,
+                 share_layers=False, return_logits=False, norm="layer"):
         super().__init__()
         
+        self.share_layers = share_layers
+        self.return_logits = return_logits
+        self.norm = norm
+        
         # Phase 1: Embeddings
         # padding_idx=0 ensures [PAD] token (index 0) always has zero vector
         self.embedding = nn.Embedding(vocab_size, embed_dim, padding_idx=0)
@@ -26,10 +40,15 @@ class LeadScoutModel(nn.Module):
         self.pos_encoding = PositionalEncoding(embed_dim, max_len=32)
         
         # Phase 3-4: Stack Transformer blocks
-        self.transformer_blocks = nn.ModuleList([
-            TransformerBlock(embed_dim, num_heads, ff_dim, dropout)
-            for _ in range(num_layers)
-        ])
+        if share_layers:
+            # Same parameters applied num_layers times
+            shared_block = TransformerBlock(embed_dim, num_heads, ff_dim, dropout, norm)
+            self.transformer_blocks = nn.ModuleList([shared_block] * num_layers)
+        else:
+            self.transformer_blocks = nn.ModuleList([
+                TransformerBlock(embed_dim, num_heads, ff_dim, dropout, norm)
+                for _ in range(num_layers)
+            ])
         
         # Classification head
         self.classifier = nn.Sequential(
@@ -48,6 +67,50 @@ class LeadScoutModel(nn.Module):
             if p.dim() > 1:
                 nn.init.xavier_uniform_(p)
     
+    @classmethod
+    def from_trained(cls, model):
+        """
+        Build a weight-shared copy of a trained model for deployment.
+        
+        The independently trained blocks are averaged into one shared block;
+        embeddings and the classifier are copied as-is.
+        
+        Args:
+            model: Trained LeadScoutModel (share_layers=False)
+            
+        Returns:
+            LeadScoutModel with share_layers=True
+        """
+        first_block = model.transformer_blocks[0]
+        shared = cls(
+            vocab_size=model.embedding.num_embeddings,
+            embed_dim=model.embedding.embedding_dim,
+            num_heads=first_block.attention.num_heads,
+            num_layers=len(model.transformer_blocks),
+            ff_dim=first_block.ffn[0].out_features,
+            dropout=first_block.dropout.p,
+            share_layers=True,
+            return_logits=model.return_logits,
+            norm=model.norm,
+        )
+        
+        # Copy everything outside the transformer stack
+        state = {
+            k: v for k, v in model.state_dict().items()
+            if not k.startswith("transformer_blocks.")
+        }
+        shared.load_state_dict(state, strict=False)
+        
+        # Average block weights into the shared block
+        block_states = [block.state_dict() for block in model.transformer_blocks]
+        averaged = {
+            k: torch.stack([s[k] for s in block_states]).mean(dim=0)
+            for k in block_states[0]
+        }
+        shared.transformer_blocks[0].load_state_dict(averaged)
+        
+        return shared
+    
     def forward(self, token_ids, mask=None):
         """
         Forward pass.
@@ -58,6 +121,7 @@ class LeadScoutModel(nn.Module):
             
         Returns:
             probability: [batch_size, 1] - Probability of reply
+                         (raw logits if return_logits=True)
         """
         # Phase 1: Token embeddings
         x = self.embedding(token_ids)  # [batch, seq_len, embed_dim]
@@ -76,4 +140,7 @@ class LeadScoutModel(nn.Module):
         # Classify
         logits = self.classifier(cls_token)  # [batch, 1]
         
+        if self.return_logits:
+            return logits
+        
         return torch.sigmoid(logits)  # [batch, 1] - reply probability
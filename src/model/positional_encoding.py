@@ -1,6 +1,36 @@
 import torch
 import torch.nn as nn
 import math
+from functools import lru_cache
+
+
+@lru_cache(maxsize=16)
+def _build_pe(d_model, max_len):
+    """
+    Sinusoidal encoding table, shape [1, max_len, d_model].
+    
+    Cached per (d_model, max_len): models and tests rebuild the same table
+    over and over. Callers must clone before registering it on a module.
+    """
+    # Create positional encoding matrix
+    pe = torch.zeros(max_len, d_model)
+    
+    # Position indices: [0, 1, 2, ..., 31]
+    position = torch.arange(0, max_len, dtype=torch.float).unsqueeze(1)
+    
+    # Dimension scaling factors
+    div_term = torch.exp(torch.arange(0, d_model, 2).float() * 
+                        (-math.log(10000.0) / d_model))
+    
+    # Apply sin to even indices
+    pe[:, 0::2] = torch.sin(position * div_term)
+    
+    # Apply cos to odd indices
+    pe[:, 1::2] = torch.cos(position * div_term)
+    
+    # Add batch dimension: (32, 128) → (1, 32, 128)
+    return pe.unsqueeze(0)
+
 
 class PositionalEncoding(nn.Module):
     """
@@ -15,27 +45,9 @@ class PositionalEncoding(nn.Module):
     def __init__(self, d_model=128, max_len=32):
         super().__init__()
         
-        # Create positional encoding matrix
-        pe = torch.zeros(max_len, d_model)
-        
-        # Position indices: [0, 1, 2, ..., 31]
-        position = torch.arange(0, max_len, dtype=torch.float).unsqueeze(1)
-        
-        # Dimension scaling factors
-        div_term = torch.exp(torch.arange(0, d_model, 2).float() * 
-                            (-math.log(10000.0) / d_model))
-        
-        # Apply sin to even indices
-        pe[:, 0::2] = torch.sin(position * div_term)
-        
-        # Apply cos to odd indices
-        pe[:, 1::2] = torch.cos(position * div_term)
-        
-        # Add batch dimension: (32, 128) → (1, 32, 128)
-        pe = pe.unsqueeze(0)
-        
-        # Register as buffer (not trainable)
-        self.register_buffer('pe', pe)
+        # Register as buffer (not trainable); clone so in-place edits to one
+        # module's buffer never reach the shared cached table
+        self.register_buffer('pe', _build_pe(d_model, max_len).clone())
     
     def forward(self, x):
         """
@@ -0,0 +1,35 @@
+import torch
+import torch.nn as nn
+
+
+class RMSNorm(nn.Module):
+    """
+    Root Mean Square Layer Normalization.
+    
+    Like LayerNorm but without mean subtraction or bias: one reduction
+    instead of two per token. Under torch.compile the preceding residual
+    add is fused into the same kernel.
+    
+    Formula:
+        RMSNorm(x) = x / sqrt(mean(x^2) + eps) * weight
+    """
+    
+    def __init__(self, embed_dim, eps=1e-6):
+        """
+        Args:
+            embed_dim: Size of the last (normalized) dimension
+            eps: Small constant for numerical stability
+        """
+        super().__init__()
+        self.eps = eps
+        self.weight = nn.Parameter(torch.ones(embed_dim))
+    
+    def forward(self, x):
+        """
+        Args:
+            x: Input, shape [..., embed_dim]
+        
+        Returns:
+            Normalized tensor, same shape as input
+        """
+        return x * torch.rsqrt(x.pow(2).mean(-1, keepdim=True) + self.eps) * self.weight
@@ -1,6 +1,11 @@
 
 import torch.nn as nn
 from .attention import MultiHeadAttention
+from .rms_norm import RMSNorm
+
+
+# Normalization layer per TransformerBlock(norm=...) choice
+NORM_LAYERS = {"layer": nn.LayerNorm, "rms": RMSNorm}
 
 
 class TransformerBlock(nn.Module):
@@ -8,7 +13,11 @@ class TransformerBlock(nn.Module):
     Single Transformer block: Multi-Head Attention + Feed-Forward Network.
     
     Architecture:
-        x → LayerNorm → MultiHeadAttention → + (residual) → LayerNorm → FFN → + (residual) → output
+        x → Norm → MultiHeadAttention → + (residual) → Norm → FFN → + (residual) → output
+    
+    Norm is LayerNorm by default. norm="rms" uses RMSNorm (no mean
+    subtraction, no bias); its state dict has no norm biases, so LayerNorm
+    checkpoints do not load into it and it needs its own training run.
     
     For Lead Scout Model:
         - embed_dim=128: Embedding dimension
@@ -16,16 +25,20 @@ class TransformerBlock(nn.Module):
         - ff_dim=256: Feed-forward hidden dimension (2× embed_dim is common)
     """
     
-    def __init__(self, embed_dim=128, num_heads=4, ff_dim=256, dropout=0.1):
+    def __init__(self, embed_dim=128, num_heads=4, ff_dim=256, dropout=0.1, norm="layer"):
         """
         Args:
             embed_dim: Dimension of embeddings (must be divisible by num_heads)
             num_heads: Number of attention heads
             ff_dim: Hidden dimension of feed-forward network
             dropout: Dropout probability for regularization
+            norm: "layer" (LayerNorm) or "rms" (RMSNorm)
         """
         super().__init__()
         
+        if norm not in NORM_LAYERS:
+            raise ValueError(f"norm must be one of {sorted(NORM_LAYERS)}, got {norm!r}")
+        
         # Multi-Head Self-Attention
         self.attention = MultiHeadAttention(embed_dim, num_heads)
         
@@ -38,9 +51,10 @@ class TransformerBlock(nn.Module):
             nn.Dropout(dropout)
         )
         
-        # Layer Normalization (Pre-LN architecture for stability)
-        self.norm1 = nn.LayerNorm(embed_dim)
-        self.norm2 = nn.LayerNorm(embed_dim)
+        # Normalization (Pre-LN architecture for stability)
+        norm_layer = NORM_LAYERS[norm]
+        self.norm1 = norm_layer(embed_dim)
+        self.norm2 = norm_layer(embed_dim)
         
         # Dropout for attention output
         self.dropout = nn.Dropout(dropout)
@@ -60,7 +74,7 @@ class TransformerBlock(nn.Module):
         normed = self.norm1(x)
         
         # Multi-Head Attention
-        attn_output, _ = self.attention(normed, mask=mask)
+        attn_output, _ = self.attention(normed, mask=mask, need_weights=False)
         
         # Residual connection
         x = x + self.dropout(attn_output)
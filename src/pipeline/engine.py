@@ -10,10 +10,11 @@ Orchestrates the entire lead processing flow:
 """
 
 import logging
+import math
 from typing import Dict, Any, List, Optional
 
 
-from ..signals import SignalEvent
+from ..signals import SignalEvent, SignalType
 from ..enrichment import LeadEnricher, ICPMatcher
 from ..scoring import IntentScorer
 from ..engagement import HighIntentFilter, ConversationStarter
@@ -21,6 +22,7 @@ from ..context import SenderProfile, SemanticMatcher, AttentionSignalWeighter
 from .config import SystemConfig
 from .utils import LinkedInURL
 import torch
+import torch.nn as nn
 import os
 from ..model.lead_scout import LeadScoutModel
 from ..tokenizer.sales_tokenizer import SalesTokenizer
@@ -51,16 +53,28 @@ class PipelineEngine:
         # Initialize Neural Model
         self.tokenizer = SalesTokenizer()
         self.model = None
+        # Reusable input buffer: [batch, max_len] matching PositionalEncoding max_len
+        self._input_buf = torch.zeros(1, 32, dtype=torch.long)
         checkpoint_path = "checkpoints/lead_scout_best.pth"
         if os.path.exists(checkpoint_path):
             try:
                 # Re-init model with correct dims (must match training script)
                 self.model = LeadScoutModel(
                     vocab_size=len(self.tokenizer.vocab),
-                    embed_dim=64, num_heads=2, num_layers=2, ff_dim=128
+                    embed_dim=64, num_heads=2, num_layers=2, ff_dim=128,
+                    return_logits=True
+                )
+                self.model.load_state_dict(torch.load(checkpoint_path, map_location="cpu"))
+                
+                # int8 weights for every nn.Linear (attention, FFN, classifier)
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {nn.Linear}, dtype=torch.qint8
                 )
-                self.model.load_state_dict(torch.load(checkpoint_path))
                 self.model.eval()
+                
+                # AOT-specialize: trace once so inference skips eager-mode dispatch
+                example = torch.zeros(1, 6, dtype=torch.long)
+                self.model = torch.jit.trace(self.model, (example,))
                 logger.info("✅ LeadScout Neural Model Loaded")
             except Exception as e:
                 logger.error(f"❌ Failed to load model: {e}")
@@ -104,6 +118,12 @@ class PipelineEngine:
         # 4. Intent Scoring (Rule-Based + Neural)
         intent_result = self.scorer.calculate_intent_score(signals, lead)
         
+        # Latest funding amount from signals (used as tokenizer context)
+        funding_amount = 0
+        for s in signals:
+            if s.type is SignalType.FUNDING_ROUND:
+                funding_amount = s.data.get("amount", 0)
+        
         # Neural Inference
         neural_prob = 0.0
         if self.model:
@@ -114,21 +134,22 @@ class PipelineEngine:
                 # We need to adapt it.
                 lead_data_for_token = {
                     "months_in_role": 12, # Placeholder, enricher doesn't parse this yet
-                    "funding_amount": 0,  # Placeholder
+                    "funding_amount": funding_amount,
                     "own_views_3m": 0,
                     # We can try to map some real fields if available, otherwise defaults
                 }
                 
-                # Check for funding in signals to populate context
-                for s in signals:
-                    if s.type.value == "funding_round":
-                        lead_data_for_token["funding_amount"] = s.data.get("amount", 0)
+                _, token_ids = self.tokenizer.tokenize_lead(lead_data_for_token, signals, return_strings=False)
+                # Copy into the preallocated buffer instead of allocating per lead
+                n = len(token_ids)
+                self._input_buf.zero_()
+                self._input_buf[0, :n].copy_(torch.as_tensor(token_ids, dtype=torch.long))
                 
-                tokens, token_ids = self.tokenizer.tokenize_lead(lead_data_for_token, signals)
-                input_tensor = torch.tensor([token_ids], dtype=torch.long)
+                with torch.inference_mode():
+                    neural_logit = self.model(self._input_buf[:, :n]).item()
                 
-                with torch.no_grad():
-                    neural_prob = self.model(input_tensor).item() # 0.0 - 1.0
+                # Model returns raw logits; convert once for display (0.0 - 1.0)
+                neural_prob = 1.0 / (1.0 + math.exp(-neural_logit))
                     
                 # Blend or Override? 
                 # Let's simple average for now to be safe, or just use Neural if it's confident
@@ -4,14 +4,20 @@ Intent Scoring Engine (Block 2.5)
 This module provides multi-factor intent scoring for leads:
 - IntentScorer: Agent 2.5A - Calculate intent scores based on signals
 - IntentScore, ScoringConfig: Data classes for scoring
+- build_company_index: Per-company signal arrays for committee detection
+- scores_to_json: Bulk JSON export of IntentScore results
 """
 
 from .data_classes import IntentScore, ScoringConfig, IntentLabel
 from .intent_scorer import IntentScorer
+from .company_index import build_company_index
+from .export import scores_to_json
 
 __all__ = [
     'IntentScore',
     'IntentLabel',
     'ScoringConfig',
     'IntentScorer',
+    'build_company_index',
+    'scores_to_json',
 ]
@@ -0,0 +1,45 @@
+"""
+Company Signals Index
+
+Precomputed per-company view of signals used by buying committee detection.
+Each company maps to (user_ids, timestamps) arrays sorted by timestamp, so
+the "engaged in the last N days" query is a binary search and a slice
+instead of a full scan per lead.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ..signals.signal_event import SignalEvent
+
+
+CompanyIndex = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+def build_company_index(signals: List[SignalEvent]) -> CompanyIndex:
+    """
+    Group signals by company into timestamp-sorted arrays.
+    
+    Args:
+        signals: Signals from any number of companies (signals without
+                 a company_id or user_id are ignored, as in
+                 IntentScorer.detect_buying_committee)
+        
+    Returns:
+        {company_id: (user_ids, timestamps)} with timestamps as POSIX seconds
+        in ascending order
+    """
+    grouped: Dict[str, List[SignalEvent]] = defaultdict(list)
+    for signal in signals:
+        if signal.company_id and signal.user_id:
+            grouped[signal.company_id].append(signal)
+    
+    index: CompanyIndex = {}
+    for company_id, company_signals in grouped.items():
+        timestamps = np.array([s.ts_epoch for s in company_signals], dtype=np.float64)
+        user_ids = np.array([s.user_id for s in company_signals], dtype=object)
+        order = np.argsort(timestamps, kind="stable")
+        index[company_id] = (user_ids[order], timestamps[order])
+    return index
@@ -5,9 +5,11 @@ Structures for score results and configuration.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from enum import Enum
 
+from ..signals.signal_event import ACTION_KEYWORDS
+
 
 class IntentLabel(Enum):
     """Intent classification labels."""
@@ -16,10 +18,10 @@ class IntentLabel(Enum):
     LOW = "low"         # Low activity / cold lead
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntentScore:
     """
-    Result of intent scoring calculation.
+    Result of intent scoring calculation (immutable once built).
     
     Attributes:
         score: Composite score (0-100)
@@ -46,9 +48,23 @@ class IntentScore:
             "committee_factor": self.committee_factor,
             "breakdown": self.breakdown,
         }
+    
+    def to_record(self) -> Tuple[float, str, float, float, float]:
+        """
+        Flat tuple for bulk export (csv.writer, columnar builders).
+        
+        Field order matches columns(); breakdown is omitted.
+        """
+        return (self.score, self.label.value, self.signals_score,
+                self.recency_factor, self.committee_factor)
+    
+    @classmethod
+    def columns(cls) -> List[str]:
+        """Column names for to_record()."""
+        return ["score", "label", "signals_score", "recency_factor", "committee_factor"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringConfig:
     """
     Configuration for Intent Scoring.
@@ -64,7 +80,7 @@ class ScoringConfig:
         "pricing_page_visit": 35.0,    # High intent behavior
     })
     
-    # Modifiers for signal strength (e.g. share > like)
+    # Modifiers for signal strength (e.g. share > like), keyed by ACTION_KEYWORDS
     action_modifiers: Dict[str, float] = field(default_factory=lambda: {
         "like": 1.0,
         "comment": 2.0,
@@ -81,3 +97,20 @@ class ScoringConfig:
     # Thresholds for intent labels
     high_threshold: float = 70.0
     medium_threshold: float = 30.0
+    
+    def __post_init__(self):
+        validate_action_modifiers(self.action_modifiers)
+
+
+def validate_action_modifiers(action_modifiers: Dict[str, float]) -> None:
+    """
+    Raise ValueError for action_modifiers keys that are not ACTION_KEYWORDS.
+    
+    Signals only resolve actions against ACTION_KEYWORDS, so any other key
+    (e.g. "repost") could never apply and would be dropped silently.
+    """
+    unknown = sorted(set(action_modifiers) - set(ACTION_KEYWORDS))
+    if unknown:
+        raise ValueError(
+            f"Unknown action_modifiers keys: {unknown} (expected a subset of {list(ACTION_KEYWORDS)})"
+        )
@@ -0,0 +1,38 @@
+"""
+Bulk export of intent scores.
+
+Serializes many IntentScore results in one call from their flat
+to_record() tuples, skipping the per-score to_dict() intermediates.
+"""
+
+import json
+from typing import List
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used instead
+    orjson = None
+
+from .data_classes import IntentScore
+
+
+def scores_to_json(scores: List[IntentScore]) -> bytes:
+    """
+    Encode scores as a single JSON document.
+    
+    Layout is columnar-header + row tuples:
+        {"columns": [...], "rows": [[score, label, ...], ...]}
+    
+    Args:
+        scores: Results from IntentScorer
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    payload = {
+        "columns": IntentScore.columns(),
+        "rows": [score.to_record() for score in scores],
+    }
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
@@ -7,14 +7,110 @@ Calculates multi-factor intent scores for leads:
 - Buying committee detection
 """
 
-from typing import List, Optional
+import math
+import time
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from ..signals.signal_event import SignalEvent
-from .data_classes import IntentScore, IntentLabel, ScoringConfig
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: batch scoring falls back to NumPy
+    njit = None
+    prange = range
+
+from ..signals.signal_event import SignalEvent, SIGNAL_TYPE_IDS, ACTION_KEYWORDS
+from .data_classes import IntentScore, IntentLabel, ScoringConfig, validate_action_modifiers
+from .company_index import CompanyIndex
 from ..enrichment.data_classes import EnrichedLead
 
 
+# Sigmoid lookup table over [-8, 8] sampled every 1/16 (257 grid points).
+# Linear interpolation between points is accurate to ~5e-5; outside the
+# range the sigmoid saturates to 0/1.
+_LUT_X = np.linspace(-8.0, 8.0, 257)
+_LUT_Y = 1.0 / (1.0 + np.exp(-_LUT_X))
+_SIGMOID_LUT = _LUT_Y.tolist()
+
+# Decay 0.5 ** (age / half_life) is tabulated in steps of half_life / 64 for
+# the first 16 half-lives and interpolated linearly between entries, so the
+# relative error is below (ln 2 / 64) ** 2 / 8 ~ 1.5e-5 whatever the
+# half-life. The table depends only on age in half-lives, so it is shared by
+# every config; ages past its end (decay < 2e-5) use exp directly.
+_DECAY_STEPS = 64
+_DECAY_TABLE = 0.5 ** (np.arange(16 * _DECAY_STEPS + 1) / _DECAY_STEPS)
+_DECAY_TABLE32 = _DECAY_TABLE.astype(np.float32)
+_DECAY_LIST = _DECAY_TABLE.tolist()
+# Table position per (age_hours * decay_rate), i.e. steps per e-folding
+_DECAY_POS_SCALE = _DECAY_STEPS / math.log(2.0)
+
+# Fixed-point scales for the quantized batch accumulator
+_WEIGHT_Q = 10      # base weight, 0.1 resolution (int16)
+_MODIFIER_Q = 16    # action modifier, 1/16 resolution (int16)
+_UNIT_SHIFT = 8     # strength and decay in [0, 1], 1/256 resolution (int16)
+# Largest quantized base * modifier product whose product with a unit factor
+# (up to 1 << _UNIT_SHIFT) still fits in int32
+_PRODUCT_Q_MAX = np.iinfo(np.int32).max >> _UNIT_SHIFT
+
+# Label per np.digitize bucket over (medium_threshold, high_threshold)
+_LABELS = (IntentLabel.LOW, IntentLabel.MEDIUM, IntentLabel.HIGH)
+
+
+def _weight_kernel(ts_epoch, base_weight, modifier, strength, lead_idx,
+                   now_ts, decay_rate, decay_table, num_leads):
+    """
+    Fused decay + weighting + per-lead sum over flattened signal columns.
+    
+    Plain Python/NumPy so it runs anywhere; compiled with Numba when
+    available. Decay follows _calculate_decay (interpolated table, exp beyond).
+    
+    Returns:
+        (raw weight per lead, decay per signal)
+    """
+    raw_weight = np.zeros(num_leads)
+    decay = np.empty(ts_epoch.size)
+    last = decay_table.size - 1
+    for i in range(ts_epoch.size):
+        x = max(0.0, (now_ts - ts_epoch[i]) / 3600.0) * decay_rate
+        pos = x * _DECAY_POS_SCALE
+        k = int(pos)
+        if k < last:
+            d = decay_table[k] + (decay_table[k + 1] - decay_table[k]) * (pos - k)
+        else:
+            d = np.exp(-x)
+        decay[i] = d
+        raw_weight[lead_idx[i]] += base_weight[i] * modifier[i] * strength[i] * d
+    return raw_weight, decay
+
+
+# Serial on purpose: a prange over signals would race on raw_weight[lead]
+_jit_weight_kernel = njit(cache=True)(_weight_kernel) if njit is not None else None
+
+
+def _decay_kernel(ts_epoch, now_ts, decay_rate, decay_table):
+    """
+    Recency decay per signal (interpolated table, exp beyond), as _decay_at.
+    
+    Signals are independent, so the compiled version splits the loop
+    across threads with prange.
+    """
+    decay = np.empty(ts_epoch.size, dtype=decay_table.dtype)
+    last = decay_table.size - 1
+    for i in prange(ts_epoch.size):
+        x = max(0.0, (now_ts - ts_epoch[i]) / 3600.0) * decay_rate
+        pos = x * _DECAY_POS_SCALE
+        k = int(pos)
+        if k < last:
+            decay[i] = decay_table[k] + (decay_table[k + 1] - decay_table[k]) * (pos - k)
+        else:
+            decay[i] = np.exp(-x)
+    return decay
+
+
+_jit_decay_kernel = njit(cache=True, parallel=True)(_decay_kernel) if njit is not None else None
+
+
 class IntentScorer:
     """
     Intent Scorer (Agent 2.5A)
@@ -26,21 +122,31 @@ class IntentScorer:
     def __init__(self, config: Optional[ScoringConfig] = None):
         """Initialize the intent scorer."""
         self.config = config or ScoringConfig()
+        self._decay_half_life = None
+        self._refresh_decay_rate()
+        # Lookup tables, built on first use (see _refresh_weight_tables and
+        # _action_modifier_table)
+        self._weights_snapshot = None
+        self._modifiers_snapshot = None
     
         
     def _sigmoid(self, x: float) -> float:
-        """Convert logit to probability (0.0 - 1.0)."""
-        import math
-        # Sigmoid function: 1 / (1 + e^-x)
-        # We clamp x to avoid overflow/underflow
-        x = max(-50, min(50, x))
-        return 1.0 / (1.0 + math.exp(-x))
+        """Convert logit to probability (0.0 - 1.0) via the lookup table."""
+        pos = (x + 8.0) * 16.0
+        if pos < 0.0:
+            return 0.0
+        if pos > 256.0:
+            return 1.0
+        idx = min(int(pos), 255)
+        t = pos - idx
+        return _SIGMOID_LUT[idx] * (1.0 - t) + _SIGMOID_LUT[idx + 1] * t
 
     def calculate_intent_score(
         self,
         signals: List[SignalEvent],
         lead: Optional[EnrichedLead] = None,
         company_signals: Optional[List[SignalEvent]] = None,
+        include_breakdown: bool = False,
     ) -> IntentScore:
         """
         Calculate composite intent score using Sigmoid Probability.
@@ -49,6 +155,7 @@ class IntentScorer:
             signals: List of signals for the specific lead
             lead: Enriched lead data (optional, for committee detection)
             company_signals: All signals from lead's company (for committee detection)
+            include_breakdown: Add a per-signal entry list under breakdown["signals"]
             
         Returns:
             IntentScore object
@@ -56,7 +163,7 @@ class IntentScorer:
         # 1. Base Signal Score (accumulate logits)
         # Default bias (negative means "start cold")
         logits = -3.0 
-        signal_breakdown = []
+        contributions = [] if include_breakdown else None
         
         # Scaling factor: How much 1 "point" of weight affects the logit
         # If weight=10, we want it to move the needle significantly
@@ -64,25 +171,25 @@ class IntentScorer:
         
         total_raw_weight = 0.0
         
+        # Single clock read shared by every decay calculation
+        now_ts = time.time()
+        self._refresh_decay_rate()
+        modifiers = self._action_modifier_table()
+        self._refresh_weight_tables()
+        base_weights = self._weight_list
+        
         for signal in signals:
             # Get base weight for signal type
-            base_weight = self.config.signal_weights.get(signal.type.value, 5.0)
+            base_weight = base_weights[signal.type_id]
             
             # Apply action modifier (e.g., share vs like)
-            modifier = 1.0
-            if signal.data:
-                action_type = signal.data.get("event_type") or signal.data.get("round_type")
-                if action_type:
-                    for key, val in self.config.action_modifiers.items():
-                        if key in str(action_type).lower():
-                            modifier = val
-                            break
+            modifier = modifiers[signal.action_id]
             
             # Apply signal strength (0.0 - 1.0)
             strength_factor = signal.strength
             
             # Apply Recency Decay
-            decay = self._calculate_decay(signal.timestamp)
+            decay = self._decay_at(signal.ts_epoch, now_ts)
             
             # Calculate contribution for this signal
             signal_weight = base_weight * modifier * strength_factor * decay
@@ -91,12 +198,8 @@ class IntentScorer:
             # Add to logits
             logits += (signal_weight * scale_factor)
             
-            signal_breakdown.append({
-                "type": signal.type.value,
-                "weight": round(signal_weight, 2),
-                "decay": round(decay, 2),
-                "timestamp": signal.timestamp.isoformat(),
-            })
+            if contributions is not None:
+                contributions.append((signal, signal_weight, decay))
         
         # 2. Buying Committee Detection
         committee_factor = 1.0
@@ -107,17 +210,9 @@ class IntentScorer:
                 lead.user_id, 
                 company_signals
             )
-            if committee_factor > 1.0:
-                # Add boost to logits directly
-                logit_boost = 1.5 if committee_factor >= 1.5 else 0.8
-                logits += logit_boost
-                
-                committee_details = {
-                    "detected": True,
-                    "multiplier": committee_factor,
-                    "logit_boost": logit_boost,
-                    "reason": "Multiple engaged contacts"
-                }
+            logit_boost, committee_details = self._committee_boost(committee_factor)
+            # Add boost to logits directly
+            logits += logit_boost
         
         # 3. Final Probability Calculation
         probability = self._sigmoid(logits)
@@ -126,19 +221,200 @@ class IntentScorer:
         # 4. Determine Label
         label = self._determine_label(final_score)
         
+        breakdown = {
+            "committee": committee_details,
+            "logits": round(logits, 2)
+        }
+        if contributions is not None:
+            # Formatted once, after scoring, only when asked for
+            breakdown["signals"] = [
+                {
+                    "type": signal.type.value,
+                    "weight": round(weight, 2),
+                    "decay": round(decay, 2),
+                    "timestamp": signal.timestamp.isoformat(),
+                }
+                for signal, weight, decay in contributions
+            ]
+        
         return IntentScore(
             score=round(final_score, 1),
             label=label,
             signals_score=round(total_raw_weight, 1),
-            recency_factor=self._calculate_decay(signals[0].timestamp) if signals else 0.0,
+            recency_factor=self._decay_at(signals[0].ts_epoch, now_ts) if signals else 0.0,
             committee_factor=committee_factor,
-            breakdown={
-                "signals": signal_breakdown,
-                "committee": committee_details,
-                "logits": round(logits, 2)
-            }
+            breakdown=breakdown
         )
     
+    def calculate_intent_scores_batch(
+        self,
+        signal_lists: List[List[SignalEvent]],
+        fixed_point: bool = False,
+        leads: Optional[List[Optional[EnrichedLead]]] = None,
+        company_index: Optional[CompanyIndex] = None,
+    ) -> List[IntentScore]:
+        """
+        Score many leads at once with vectorized NumPy math.
+        
+        All signals are flattened into column arrays (timestamp, type id,
+        modifier, strength, lead index) so decay and weighting run as array
+        ops, and per-lead sums are a single bincount. Equivalent to calling
+        calculate_intent_score(signals, lead, company_signals) for each list.
+        
+        Buying committee detection runs when both leads and company_index
+        are given: build the index once with build_company_index() over all
+        company signals, and each lead's check is a binary search into its
+        company's entry rather than a scan of the company's signals.
+        
+        With fixed_point=True the weight products use int16 inputs and int32
+        products; scores then differ from the float path by at most a few
+        tenths of a point. Configs whose weights or modifiers don't fit that
+        range raise ValueError instead of wrapping.
+        
+        Args:
+            signal_lists: One list of signals per lead
+            fixed_point: Accumulate signal weights in scaled integers
+            leads: Enriched lead per signal list (optional, for committee detection)
+            company_index: build_company_index() output covering the leads' companies
+            
+        Returns:
+            List of IntentScore, in the same order as signal_lists
+        """
+        num_leads = len(signal_lists)
+        counts = np.fromiter((len(sigs) for sigs in signal_lists), dtype=np.intp, count=num_leads)
+        flat = [signal for sigs in signal_lists for signal in sigs]
+        n = len(flat)
+        
+        # Column arrays (SoA)
+        ts_sec = np.fromiter((s.ts_epoch for s in flat), dtype=np.float64, count=n)
+        type_id = np.fromiter((s.type_id for s in flat), dtype=np.intp, count=n)
+        action_id = np.fromiter((s.action_id for s in flat), dtype=np.intp, count=n)
+        strength = np.fromiter((s.strength for s in flat), dtype=np.float32, count=n)
+        lead_idx = np.repeat(np.arange(num_leads), counts)
+        
+        # Base weight lookup table indexed by type id (float32 like the
+        # other per-signal columns; sums below accumulate in float64)
+        self._refresh_weight_tables()
+        base_weight = np.take(self._weight_table32, type_id)
+        self._action_modifier_table()
+        modifier = np.take(self._modifier_table32, action_id)
+        
+        now_ts = time.time()
+        self._refresh_decay_rate()
+        
+        if _jit_weight_kernel is not None and not fixed_point:
+            # Compiled single pass over the columns
+            raw_weight, decay = _jit_weight_kernel(
+                ts_sec, base_weight.astype(np.float64), modifier.astype(np.float64),
+                strength.astype(np.float64), lead_idx,
+                now_ts, self._decay_rate, _DECAY_TABLE, num_leads
+            )
+        else:
+            decay = self._decay_batch(ts_sec, now_ts)
+            
+            if fixed_point:
+                raw_weight = self._accumulate_fixed_point(
+                    base_weight, modifier, strength, decay, lead_idx, num_leads
+                )
+            else:
+                weights = base_weight * modifier * strength * decay
+                raw_weight = np.bincount(lead_idx, weights=weights, minlength=num_leads)
+        
+        logits = -3.0 + raw_weight * 0.1
+        
+        # Buying committee: one indexed lookup per lead with a known company
+        committee_factors = [1.0] * num_leads
+        committee_details = [{"detected": False} for _ in range(num_leads)]
+        if leads is not None and company_index is not None:
+            for i, lead in enumerate(leads):
+                if not (lead and lead.company):
+                    continue
+                entry = company_index.get(lead.company.company_id)
+                if entry is None:
+                    continue
+                factor = self.detect_buying_committee_indexed(lead.user_id, entry)
+                logit_boost, committee_details[i] = self._committee_boost(factor)
+                committee_factors[i] = factor
+                logits[i] += logit_boost
+        
+        scores = np.interp(logits, _LUT_X, _LUT_Y, left=0.0, right=1.0) * 100.0
+        
+        # Recency factor uses each lead's first signal
+        starts = np.cumsum(counts) - counts
+        has_signals = counts > 0
+        recency = np.zeros(num_leads)
+        recency[has_signals] = decay[starts[has_signals]]
+        
+        # Bucket all scores at once: 0 = low, 1 = medium, 2 = high
+        label_idx = np.digitize(scores, [self.config.medium_threshold, self.config.high_threshold])
+        
+        results = []
+        for i in range(num_leads):
+            score = float(scores[i])
+            results.append(IntentScore(
+                score=round(score, 1),
+                label=_LABELS[label_idx[i]],
+                signals_score=round(float(raw_weight[i]), 1),
+                recency_factor=float(recency[i]),
+                committee_factor=committee_factors[i],
+                breakdown={
+                    "committee": committee_details[i],
+                    "logits": round(float(logits[i]), 2),
+                },
+            ))
+        return results
+    
+    def _accumulate_fixed_point(
+        self,
+        base_weight: np.ndarray,
+        modifier: np.ndarray,
+        strength: np.ndarray,
+        decay: np.ndarray,
+        lead_idx: np.ndarray,
+        num_leads: int,
+    ) -> np.ndarray:
+        """
+        Per-lead sum of base * modifier * strength * decay in fixed point.
+        
+        Raises:
+            ValueError: if a configured weight or modifier would overflow the
+                int16 inputs or the int32 products
+        """
+        self._check_fixed_point_range()
+        base_q = np.rint(base_weight * _WEIGHT_Q).astype(np.int16)
+        mod_q = np.rint(modifier * _MODIFIER_Q).astype(np.int16)
+        strength_q = np.rint(strength * (1 << _UNIT_SHIFT)).astype(np.int16)
+        decay_q = np.rint(decay * (1 << _UNIT_SHIFT)).astype(np.int16)
+        
+        # Widen to int32 before multiplying; shift after each [0, 1] factor
+        # so the product keeps the base * modifier scale
+        weight_q = base_q.astype(np.int32) * mod_q
+        weight_q = (weight_q * strength_q) >> _UNIT_SHIFT
+        weight_q = (weight_q * decay_q) >> _UNIT_SHIFT
+        
+        # bincount sums in float64, which is exact for these integer terms
+        acc = np.bincount(lead_idx, weights=weight_q, minlength=num_leads)
+        return acc / float(_WEIGHT_Q * _MODIFIER_Q)
+    
+    def _check_fixed_point_range(self) -> None:
+        """Raise ValueError if the weight/modifier tables don't fit the fixed-point scales."""
+        int16_max = np.iinfo(np.int16).max
+        base_max = float(np.abs(self._weight_table).max()) * _WEIGHT_Q
+        mod_max = float(np.abs(self._modifier_table32).max()) * _MODIFIER_Q
+        if base_max > int16_max:
+            raise ValueError(
+                f"signal_weights must be within ±{int16_max / _WEIGHT_Q} for fixed_point scoring"
+            )
+        if mod_max > int16_max:
+            raise ValueError(
+                f"action_modifiers must be within ±{int16_max / _MODIFIER_Q} for fixed_point scoring"
+            )
+        if round(base_max) * round(mod_max) > _PRODUCT_Q_MAX:
+            raise ValueError(
+                f"Largest signal weight x action modifier ({base_max / _WEIGHT_Q} x "
+                f"{mod_max / _MODIFIER_Q}) overflows int32 in fixed_point scoring"
+            )
+    
     def detect_buying_committee(
         self, 
         current_user_id: str,
@@ -159,11 +435,11 @@ class IntentScorer:
             
         # Get unique user IDs engaged in the last 30 days
         active_users = set()
-        cutoff = datetime.now().timestamp() - (30 * 24 * 3600)
+        cutoff = time.time() - (30 * 24 * 3600)
         
         for signal in company_signals:
             # Check if signal is recent enough
-            if signal.timestamp.timestamp() > cutoff:
+            if signal.ts_epoch > cutoff:
                 if signal.user_id and signal.user_id != current_user_id:
                     active_users.add(signal.user_id)
         
@@ -174,22 +450,162 @@ class IntentScorer:
             
         return 1.0
     
-    def _calculate_decay(self, timestamp: datetime) -> float:
+    def detect_buying_committee_indexed(
+        self,
+        current_user_id: str,
+        company_entry: Tuple[np.ndarray, np.ndarray],
+    ) -> float:
+        """
+        Same as detect_buying_committee, using a prebuilt company index entry.
+        
+        Build the index once with build_company_index() and reuse it for every
+        lead in the company; each call is a binary search plus a set over the
+        recent user ids.
+        
+        Args:
+            current_user_id: ID of the lead being scored
+            company_entry: (user_ids, timestamps) for the lead's company
+            
+        Returns:
+            Multiplier (e.g., 1.5x) if buying committee detected
+        """
+        user_ids, timestamps = company_entry
+        cutoff = time.time() - (30 * 24 * 3600)
+        
+        # Timestamps are sorted, so recent signals are a tail slice
+        start = np.searchsorted(timestamps, cutoff, side="right")
+        recent_users = set(user_ids[start:].tolist())
+        recent_users.discard(current_user_id)
+        
+        # 1 other person = 1.2x, 2+ other people = 1.5x
+        if len(recent_users) >= 2:
+            return 1.5
+        if len(recent_users) >= 1:
+            return 1.2
+        return 1.0
+    
+    def _committee_boost(self, committee_factor: float) -> Tuple[float, dict]:
+        """Logit boost and breakdown entry for a buying committee multiplier."""
+        if committee_factor <= 1.0:
+            return 0.0, {"detected": False}
+        logit_boost = 1.5 if committee_factor >= 1.5 else 0.8
+        return logit_boost, {
+            "detected": True,
+            "multiplier": committee_factor,
+            "logit_boost": logit_boost,
+            "reason": "Multiple engaged contacts"
+        }
+    
+    def _action_modifier_table(self) -> List[float]:
+        """
+        Action modifiers (e.g. share vs like) indexed by SignalEvent.action_id.
+        
+        The trailing 1.0 is the "no match" entry, reached via action_id == -1.
+        Cached like the base weight tables: rebuilt (and its keys validated)
+        only when config.action_modifiers changes.
+        """
+        modifiers = self.config.action_modifiers
+        if modifiers != self._modifiers_snapshot:
+            validate_action_modifiers(modifiers)
+            table = [modifiers.get(key, 1.0) for key in ACTION_KEYWORDS]
+            table.append(1.0)
+            self._modifier_table = table
+            self._modifier_table32 = np.array(table, dtype=np.float32)
+            self._modifiers_snapshot = dict(modifiers)
+        return self._modifier_table
+    
+    def _signal_weight_table(self) -> np.ndarray:
+        """Base weights as an array indexed by SIGNAL_TYPE_IDS (default 5.0)."""
+        self._refresh_weight_tables()
+        return self._weight_table
+    
+    def _refresh_weight_tables(self) -> None:
+        """
+        Rebuild the cached base weight tables if config.signal_weights changed.
+        
+        Callers may replace the dict or edit it in place after construction,
+        so the check compares against a copy of the dict the tables were
+        built from (a C-level compare of a handful of items).
+        """
+        weights = self.config.signal_weights
+        if weights == self._weights_snapshot:
+            return
+        table = np.full(len(SIGNAL_TYPE_IDS), 5.0)
+        for signal_type, idx in SIGNAL_TYPE_IDS.items():
+            table[idx] = weights.get(signal_type.value, 5.0)
+        self._weight_table = table
+        self._weight_table32 = table.astype(np.float32)
+        self._weight_list = table.tolist()
+        self._weights_snapshot = dict(weights)
+    
+    def _calculate_decay(self, timestamp: datetime, now_ts: Optional[float] = None) -> float:
         """
         Calculate exponential decay factor based on age.
         Formula: N(t) = N0 * (1/2)^(t / half_life)
+        
+        Args:
+            timestamp: When the signal happened
+            now_ts: Reference POSIX time; pass it in to avoid a clock read
+                    per signal (default: current time)
+        """
+        if now_ts is None:
+            now_ts = time.time()
+        self._refresh_decay_rate()
+        return self._decay_at(timestamp.timestamp(), now_ts)
+    
+    def _refresh_decay_rate(self) -> None:
         """
-        age_hours = (datetime.now() - timestamp).total_seconds() / 3600
+        Recompute the decay rate if config.decay_half_life_hours changed.
         
-        # Prevent future timestamps
-        if age_hours < 0:
-            age_hours = 0
-            
+        The table itself is indexed by age in half-lives, so only the rate
+        that maps hours onto it depends on the config.
+        """
         half_life = self.config.decay_half_life_hours
+        if half_life == self._decay_half_life:
+            return
+        # 0.5 ** (age / half_life) == exp(-age * ln2 / half_life); hoist the divide
+        self._decay_rate = math.log(2.0) / half_life
+        self._decay_half_life = half_life
+    
+    def _decay_at(self, ts_epoch: float, now_ts: float) -> float:
+        """
+        Decay factor for a POSIX timestamp relative to now_ts.
         
-        # Decay factor falls from 1.0 to 0.5 over one half-life
-        decay = 0.5 ** (age_hours / half_life)
+        Per-signal inner helper: callers refresh the tables once beforehand.
+        """
+        # Prevent future timestamps
+        x = max(0.0, (now_ts - ts_epoch) / 3600) * self._decay_rate
+        
+        # Decay factor falls from 1.0 to 0.5 over one half-life;
+        # the first 16 half-lives are interpolated from the table
+        pos = x * _DECAY_POS_SCALE
+        k = int(pos)
+        if k < len(_DECAY_LIST) - 1:
+            lo = _DECAY_LIST[k]
+            return lo + (_DECAY_LIST[k + 1] - lo) * (pos - k)
+        return math.exp(-x)
+    
+    def _decay_batch(self, ts_epoch: np.ndarray, now_ts: float) -> np.ndarray:
+        """
+        Vectorized _decay_at over an array of POSIX timestamps, as float32.
+        
+        Ages are taken in float64 (epoch seconds need it); the decay factors
+        themselves are in [0, 1] and float32 keeps them within ~1e-7.
+        """
+        self._refresh_decay_rate()
+        if _jit_decay_kernel is not None:
+            return _jit_decay_kernel(ts_epoch, now_ts, self._decay_rate, _DECAY_TABLE32)
         
+        # Recency decay: 0.5 ** (age / half_life), interpolated from the
+        # table for the first 16 half-lives, exp beyond
+        x = np.maximum(0.0, (now_ts - ts_epoch) / 3600) * self._decay_rate
+        pos = x * _DECAY_POS_SCALE
+        k = pos.astype(np.intp)
+        in_table = k < _DECAY_TABLE32.size - 1
+        decay = np.exp(-x).astype(np.float32)
+        k_in = k[in_table]
+        lo = _DECAY_TABLE32[k_in]
+        decay[in_table] = lo + (_DECAY_TABLE32[k_in + 1] - lo) * (pos[in_table] - k_in)
         return decay
     
     def _determine_label(self, score: float) -> IntentLabel:
@@ -3,11 +3,15 @@ Signal Collection Module (Block 0)
 
 This module provides real-time signal collection for lead scoring:
 - SignalEvent: Core data class for all signal types
+- signals_to_json: Bulk JSON serialization of SignalEvents
+- signals_from_json: Bulk JSON deserialization of SignalEvents
+- decay_weights: Vectorized SignalEvent.decay_weight over many signals
 - LinkedInSignalMonitor: Agent 0A - LinkedIn engagement signals
 - ExternalSignalAggregator: Agent 0B - Funding, role changes, events
 """
 
-from .signal_event import SignalEvent, SignalType, SignalSource
+from .signal_event import SignalEvent, SignalType, SignalSource, signals_to_json, signals_from_json
+from .decay import decay_weights
 from .linkedin_monitor import LinkedInSignalMonitor
 from .external_aggregator import ExternalSignalAggregator
 
@@ -15,6 +19,9 @@ __all__ = [
     'SignalEvent',
     'SignalType',
     'SignalSource',
+    'signals_to_json',
+    'signals_from_json',
+    'decay_weights',
     'LinkedInSignalMonitor', 
     'ExternalSignalAggregator',
 ]
@@ -0,0 +1,16 @@
+"""
+Cached ISO-8601 timestamp parsing shared by the signal monitors.
+
+Webhook retries and batch replays deliver the same timestamp strings over
+and over; datetime objects are immutable, so parsed results can be reused.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+
+# 131072 entries ~ one day of distinct per-second timestamps
+@lru_cache(maxsize=1 << 17)
+def parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO-8601 string, accepting a trailing 'Z' for UTC."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
@@ -0,0 +1,36 @@
+"""
+Vectorized signal decay.
+
+Batch counterpart of SignalEvent.decay_weight: one clock read and one
+np.exp over all signal ages instead of a datetime.now() + math.exp per event.
+"""
+
+import time
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .signal_event import SignalEvent
+
+
+def decay_weights(
+    signals: Sequence[SignalEvent],
+    half_life_hours: float = 168,
+    now: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Exponential decay weight for each signal (same formula as decay_weight).
+    
+    Args:
+        signals: Signals to weight
+        half_life_hours: Hours after which signal strength halves (default: 7 days)
+        now: Reference POSIX time (default: current time)
+        
+    Returns:
+        Array of decay weights, one per signal
+    """
+    if now is None:
+        now = time.time()
+    ts = np.fromiter((s.ts_epoch for s in signals), dtype=np.float64, count=len(signals))
+    ages_h = (now - ts) / 3600.0
+    return np.exp(-0.693 * ages_h / half_life_hours)
@@ -9,10 +9,18 @@ Monitors business signals beyond LinkedIn:
 """
 
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from collections import defaultdict
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from .signal_event import SignalEvent, SignalType, SignalSource
+from .signal_store import SignalStore
+from ._ts_cache import parse_iso
+from ..enrichment._seniority import detect_seniority
+
+
+# Required payload fields per signal kind
+_FUNDING_FIELDS = ("company_id", "funding_amount", "round_type")
+_ROLE_CHANGE_FIELDS = ("user_id", "new_title")
+_EVENT_FIELDS = ("attendee_id", "event_name", "event_type")
 
 
 class ExternalSignalAggregator:
@@ -43,9 +51,18 @@ class ExternalSignalAggregator:
         "individual_contributor": 0.3,
     }
     
+    # Event type signal strengths (in-person, hands-on events rank higher)
+    EVENT_STRENGTHS = {
+        "conference": 0.8,
+        "workshop": 0.7,
+        "webinar": 0.5,
+        "meetup": 0.4,
+    }
+    
     def __init__(self):
         """Initialize the external signal aggregator."""
-        self._signals: Dict[str, List[SignalEvent]] = defaultdict(list)
+        # Columnar store with user_id and company_id row indexes
+        self._signal_store = SignalStore()
     
     def parse_funding_event(self, payload: Dict[str, Any]) -> SignalEvent:
         """
@@ -63,14 +80,34 @@ class ExternalSignalAggregator:
         Returns:
             SignalEvent with type=FUNDING_ROUND, company_id, amount, round
         """
-        self._validate_required_fields(payload, ["company_id", "funding_amount", "round_type"])
+        self._validate_required_fields(payload, _FUNDING_FIELDS)
+        signal = self._build_funding_event(payload)
+        self._store(signal)
+        return signal
+    
+    def parse_funding_events(self, payloads: List[Dict[str, Any]]) -> List[SignalEvent]:
+        """
+        Batch version of parse_funding_event.
         
+        Reads the clock once for payloads without a timestamp. All payloads
+        are validated before any is stored.
+        
+        Args:
+            payloads: List of funding payloads (see parse_funding_event)
+            
+        Returns:
+            List of SignalEvent with type=FUNDING_ROUND, in payload order
+        """
+        return self._parse_batch(payloads, _FUNDING_FIELDS, self._build_funding_event)
+    
+    def _build_funding_event(self, payload: Dict[str, Any], now: Optional[datetime] = None) -> SignalEvent:
+        """Build a FUNDING_ROUND signal from a validated payload."""
         round_type = payload["round_type"].lower().replace("-", "_").replace(" ", "_")
         strength = self.FUNDING_STRENGTHS.get(round_type, 0.5)
         
-        timestamp = self._parse_timestamp(payload.get("timestamp"))
+        timestamp = self._parse_timestamp(payload.get("timestamp"), now)
         
-        signal = SignalEvent(
+        return SignalEvent(
             type=SignalType.FUNDING_ROUND,
             user_id=payload.get("user_id", f"company:{payload['company_id']}"),
             timestamp=timestamp,
@@ -84,9 +121,6 @@ class ExternalSignalAggregator:
             company_id=payload["company_id"],
             strength=strength,
         )
-        
-        self._signals[signal.user_id].append(signal)
-        return signal
     
     def parse_role_change(self, payload: Dict[str, Any]) -> SignalEvent:
         """
@@ -103,8 +137,28 @@ class ExternalSignalAggregator:
         Returns:
             SignalEvent with type=ROLE_CHANGE, new_title, previous_title, start_date
         """
-        self._validate_required_fields(payload, ["user_id", "new_title"])
+        self._validate_required_fields(payload, _ROLE_CHANGE_FIELDS)
+        signal = self._build_role_change(payload)
+        self._store(signal)
+        return signal
+    
+    def parse_role_changes(self, payloads: List[Dict[str, Any]]) -> List[SignalEvent]:
+        """
+        Batch version of parse_role_change.
+        
+        Reads the clock once for payloads without a date. All payloads are
+        validated before any is stored.
         
+        Args:
+            payloads: List of role change payloads (see parse_role_change)
+            
+        Returns:
+            List of SignalEvent with type=ROLE_CHANGE, in payload order
+        """
+        return self._parse_batch(payloads, _ROLE_CHANGE_FIELDS, self._build_role_change)
+    
+    def _build_role_change(self, payload: Dict[str, Any], now: Optional[datetime] = None) -> SignalEvent:
+        """Build a ROLE_CHANGE signal from a validated payload."""
         # Determine seniority level from title
         new_title_lower = payload["new_title"].lower()
         seniority = self._detect_seniority(new_title_lower)
@@ -115,9 +169,9 @@ class ExternalSignalAggregator:
         if start_date:
             timestamp = self._parse_timestamp(start_date)
         else:
-            timestamp = self._parse_timestamp(payload.get("timestamp"))
+            timestamp = self._parse_timestamp(payload.get("timestamp"), now)
         
-        signal = SignalEvent(
+        return SignalEvent(
             type=SignalType.ROLE_CHANGE,
             user_id=payload["user_id"],
             timestamp=timestamp,
@@ -131,9 +185,6 @@ class ExternalSignalAggregator:
             company_id=payload.get("company_id"),
             strength=strength,
         )
-        
-        self._signals[payload["user_id"]].append(signal)
-        return signal
     
     def parse_event_signal(self, payload: Dict[str, Any]) -> SignalEvent:
         """
@@ -150,22 +201,34 @@ class ExternalSignalAggregator:
         Returns:
             SignalEvent with type=EVENT_ATTENDANCE, event_name, event_type, attendee_id
         """
-        self._validate_required_fields(payload, ["attendee_id", "event_name", "event_type"])
+        self._validate_required_fields(payload, _EVENT_FIELDS)
+        signal = self._build_event_signal(payload)
+        self._store(signal)
+        return signal
+    
+    def parse_event_signals(self, payloads: List[Dict[str, Any]]) -> List[SignalEvent]:
+        """
+        Batch version of parse_event_signal.
         
-        # Event type determines signal strength
-        event_strengths = {
-            "conference": 0.8,
-            "workshop": 0.7,
-            "webinar": 0.5,
-            "meetup": 0.4,
-        }
+        Reads the clock once for payloads without a timestamp. All payloads
+        are validated before any is stored.
         
+        Args:
+            payloads: List of event payloads (see parse_event_signal)
+            
+        Returns:
+            List of SignalEvent with type=EVENT_ATTENDANCE, in payload order
+        """
+        return self._parse_batch(payloads, _EVENT_FIELDS, self._build_event_signal)
+    
+    def _build_event_signal(self, payload: Dict[str, Any], now: Optional[datetime] = None) -> SignalEvent:
+        """Build an EVENT_ATTENDANCE signal from a validated payload."""
         event_type = payload["event_type"].lower()
-        strength = event_strengths.get(event_type, 0.5)
+        strength = self.EVENT_STRENGTHS.get(event_type, 0.5)
         
-        timestamp = self._parse_timestamp(payload.get("timestamp"))
+        timestamp = self._parse_timestamp(payload.get("timestamp"), now)
         
-        signal = SignalEvent(
+        return SignalEvent(
             type=SignalType.EVENT_ATTENDANCE,
             user_id=payload["attendee_id"],
             timestamp=timestamp,
@@ -178,55 +241,60 @@ class ExternalSignalAggregator:
             company_id=payload.get("company_id"),
             strength=strength,
         )
+    
+    def _parse_batch(
+        self,
+        payloads: List[Dict[str, Any]],
+        required: Tuple[str, ...],
+        build: Callable[[Dict[str, Any], datetime], SignalEvent],
+    ) -> List[SignalEvent]:
+        """Validate every payload, then build and store signals against one clock read."""
+        for payload in payloads:
+            self._validate_required_fields(payload, required)
         
-        self._signals[payload["attendee_id"]].append(signal)
-        return signal
+        now = datetime.now()
+        signals = [build(payload, now) for payload in payloads]
+        for signal in signals:
+            self._store(signal)
+        return signals
     
     def get_signals_by_company(self, company_id: str) -> List[SignalEvent]:
         """Get all signals for a specific company."""
-        all_signals = []
-        for signals in self._signals.values():
-            for signal in signals:
-                if signal.company_id == company_id:
-                    all_signals.append(signal)
-        return sorted(all_signals, key=lambda s: s.timestamp, reverse=True)
+        store = self._signal_store
+        rows = store.window(store.company_rows.get(company_id, []))
+        # Rows are oldest first; return latest first
+        return store.signals(rows[::-1])
     
     def clear_signals(self, user_id: Optional[str] = None) -> None:
         """Clear stored signals for a user or all users."""
         if user_id:
-            self._signals[user_id] = []
+            self._signal_store.remove_user(user_id)
         else:
-            self._signals.clear()
+            self._signal_store.clear()
+    
+    def _store(self, signal: SignalEvent) -> None:
+        """Record a parsed signal under its user and (if any) its company."""
+        self._signal_store.append(signal)
     
     def _detect_seniority(self, title: str) -> str:
-        """Detect seniority level from job title."""
-        title_lower = title.lower()
-        
-        # Check director first (before co-founder to avoid false match)
-        if "director" in title_lower:
-            return "director"
-        
-        if any(t in title_lower for t in ["ceo", "cto", "cfo", "coo", "chief", "founder", "co-founder"]):
-            return "c_level"
-        elif any(t in title_lower for t in ["vp", "vice president"]):
-            return "vp"
-        elif any(t in title_lower for t in ["manager", "lead", "head"]):
-            return "manager"
-        else:
-            return "individual_contributor"
+        """Detect seniority level from job title (same rules as the enricher)."""
+        return detect_seniority(title).value
     
     def _validate_required_fields(
         self, 
         payload: Dict[str, Any], 
-        required: List[str]
+        required: Tuple[str, ...]
     ) -> None:
         """Validate that required fields are present in payload."""
-        missing = [f for f in required if f not in payload or payload[f] is None]
-        if missing:
-            raise ValueError(f"Missing required fields: {missing}")
+        # One get() per field on the happy path; list every missing field on failure
+        get = payload.get
+        for f in required:
+            if get(f) is None:
+                missing = [name for name in required if get(name) is None]
+                raise ValueError(f"Missing required fields: {missing}")
     
-    def _parse_timestamp(self, timestamp: Optional[str]) -> datetime:
-        """Parse timestamp string or return current time."""
+    def _parse_timestamp(self, timestamp: Optional[str], now: Optional[datetime] = None) -> datetime:
+        """Parse timestamp string or return now (default: current time)."""
         if timestamp:
-            return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return datetime.now()
+            return parse_iso(timestamp)
+        return now or datetime.now()
@@ -8,11 +8,34 @@ Continuously monitors buying signals from LinkedIn in real-time:
 - Competitor content engagement
 """
 
+import time
+from math import exp
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
 
 from .signal_event import SignalEvent, SignalType, SignalSource
+from .signal_store import SignalStore
+from ._ts_cache import parse_iso
+
+
+# Profile visit recency: < 24h "today", < 7 days "this_week", else "older"
+RECENCY_EDGES_HOURS = (24, 168)
+RECENCY_LABELS = ("today", "this_week", "older")
+
+# Engagement signal strength by event type
+ENGAGEMENT_STRENGTHS = {
+    "like": 0.3,
+    "comment": 0.7,
+    "share": 0.9,
+}
+_ENGAGEMENT_FIELDS = ("event_type", "user_id", "post_id")
+
+# Per-user retention: older signals are pruned from the store
+RETENTION_DAYS = 90
+MAX_SIGNALS_PER_USER = 10000
 
 
 class LinkedInSignalMonitor:
@@ -23,10 +46,22 @@ class LinkedInSignalMonitor:
     to track prospect engagement over time.
     """
     
-    def __init__(self):
-        """Initialize the signal monitor with empty signal store."""
-        # Store signals by user_id for aggregation
-        self._signals: Dict[str, List[SignalEvent]] = defaultdict(list)
+    def __init__(
+        self,
+        retention_days: int = RETENTION_DAYS,
+        max_signals_per_user: int = MAX_SIGNALS_PER_USER,
+    ):
+        """
+        Initialize the signal monitor with empty signal store.
+        
+        Args:
+            retention_days: Signals older than this are pruned when a user is aggregated
+            max_signals_per_user: Cap on stored signals per user (oldest dropped first)
+        """
+        self.retention_days = retention_days
+        self.max_signals_per_user = max_signals_per_user
+        # Columnar store, rows indexed by user_id (oldest first) for aggregation
+        self._signal_store = SignalStore()
     
     def parse_engagement(self, payload: Dict[str, Any]) -> SignalEvent:
         """
@@ -46,21 +81,41 @@ class LinkedInSignalMonitor:
         Raises:
             ValueError: If required fields are missing
         """
-        self._validate_required_fields(payload, ["event_type", "user_id", "post_id"])
+        self._validate_required_fields(payload, _ENGAGEMENT_FIELDS)
+        signal = self._build_engagement(payload)
+        self._store(signal)
+        return signal
+    
+    def parse_engagements(self, payloads: List[Dict[str, Any]]) -> List[SignalEvent]:
+        """
+        Batch version of parse_engagement.
         
-        # Determine signal strength based on engagement type
-        engagement_strengths = {
-            "like": 0.3,
-            "comment": 0.7,
-            "share": 0.9,
-        }
+        Reads the clock once for payloads without a timestamp. All payloads
+        are validated before any is stored.
+        
+        Args:
+            payloads: List of engagement payloads (see parse_engagement)
+            
+        Returns:
+            List of SignalEvent with type=CONTENT_ENGAGEMENT, in payload order
+        """
+        for payload in payloads:
+            self._validate_required_fields(payload, _ENGAGEMENT_FIELDS)
         
+        now = datetime.now()
+        signals = [self._build_engagement(payload, now) for payload in payloads]
+        for signal in signals:
+            self._store(signal)
+        return signals
+    
+    def _build_engagement(self, payload: Dict[str, Any], now: Optional[datetime] = None) -> SignalEvent:
+        """Build a CONTENT_ENGAGEMENT signal from a validated payload."""
         event_type = payload["event_type"]
-        strength = engagement_strengths.get(event_type, 0.5)
+        strength = ENGAGEMENT_STRENGTHS.get(event_type, 0.5)
         
-        timestamp = self._parse_timestamp(payload.get("timestamp"))
+        timestamp = self._parse_timestamp(payload.get("timestamp"), now)
         
-        signal = SignalEvent(
+        return SignalEvent(
             type=SignalType.CONTENT_ENGAGEMENT,
             user_id=payload["user_id"],
             timestamp=timestamp,
@@ -73,11 +128,6 @@ class LinkedInSignalMonitor:
             company_id=payload.get("company_id"),
             strength=strength,
         )
-        
-        # Store signal for aggregation
-        self._signals[payload["user_id"]].append(signal)
-        
-        return signal
     
     def parse_profile_visit(self, payload: Dict[str, Any]) -> SignalEvent:
         """
@@ -93,7 +143,7 @@ class LinkedInSignalMonitor:
         Returns:
             SignalEvent with type=PROFILE_VISIT, visitor URL, count, recency
         """
-        self._validate_required_fields(payload, ["visitor_id", "visitor_url"])
+        self._validate_required_fields(payload, ("visitor_id", "visitor_url"))
         
         visit_count = payload.get("visit_count", 1)
         timestamp = self._parse_timestamp(payload.get("timestamp"))
@@ -102,14 +152,51 @@ class LinkedInSignalMonitor:
         strength = min(0.3 + (visit_count * 0.15), 1.0)
         
         # Calculate recency category
-        age_hours = (datetime.now() - timestamp).total_seconds() / 3600
-        if age_hours < 24:
-            recency = "today"
-        elif age_hours < 168:  # 7 days
-            recency = "this_week"
-        else:
-            recency = "older"
+        age_hours = (time.time() - timestamp.timestamp()) / 3600
+        recency = RECENCY_LABELS[bisect_right(RECENCY_EDGES_HOURS, age_hours)]
         
+        return self._store_profile_visit(payload, timestamp, visit_count, strength, recency)
+    
+    def parse_profile_visits(self, payloads: List[Dict[str, Any]]) -> List[SignalEvent]:
+        """
+        Batch version of parse_profile_visit.
+        
+        Reads the clock once and computes strength and recency for all
+        visits as array ops. All payloads are validated before any is stored.
+        
+        Args:
+            payloads: List of profile visit payloads (see parse_profile_visit)
+            
+        Returns:
+            List of SignalEvent with type=PROFILE_VISIT, in payload order
+        """
+        for payload in payloads:
+            self._validate_required_fields(payload, ("visitor_id", "visitor_url"))
+        
+        n = len(payloads)
+        now = datetime.now()
+        timestamps = [self._parse_timestamp(p.get("timestamp"), now) for p in payloads]
+        visit_counts = [p.get("visit_count", 1) for p in payloads]
+        
+        ts_epochs = np.fromiter((ts.timestamp() for ts in timestamps), dtype=np.float64, count=n)
+        age_h = (time.time() - ts_epochs) / 3600
+        recency = np.array(RECENCY_LABELS)[np.digitize(age_h, RECENCY_EDGES_HOURS)].tolist()
+        strength = np.minimum(0.3 + np.array(visit_counts, dtype=np.float64) * 0.15, 1.0).tolist()
+        
+        return [
+            self._store_profile_visit(payload, timestamps[i], visit_counts[i], strength[i], recency[i])
+            for i, payload in enumerate(payloads)
+        ]
+    
+    def _store_profile_visit(
+        self,
+        payload: Dict[str, Any],
+        timestamp: datetime,
+        visit_count: int,
+        strength: float,
+        recency: str,
+    ) -> SignalEvent:
+        """Build and store a PROFILE_VISIT signal from precomputed fields."""
         signal = SignalEvent(
             type=SignalType.PROFILE_VISIT,
             user_id=payload["visitor_id"],
@@ -124,21 +211,33 @@ class LinkedInSignalMonitor:
             strength=strength,
         )
         
-        self._signals[payload["visitor_id"]].append(signal)
+        self._store(signal)
         
         return signal
     
     def aggregate_signals(
         self, 
         user_id: str, 
-        window_days: int = 7
+        window_days: int = 7,
+        *,
+        now: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """
         Aggregate signals from a prospect over a time window.
         
+        Not a pure read: retention is enforced here, against `now`, rather
+        than on insert (inserts carry their own timestamps, so replayed or
+        backfilled history would otherwise be pruned by the wall clock). The
+        user's signals older than retention_days are permanently dropped from
+        the store first, so a window_days beyond the retention period only
+        sees retained signals, and aggregating with a later `now` can remove
+        signals an earlier call returned.
+        
         Args:
             user_id: LinkedIn user ID to aggregate signals for
             window_days: Number of days to look back (default 7)
+            now: Reference time (default: datetime.now()); pass one value
+                when aggregating many users
             
         Returns:
             Aggregated signal data with:
@@ -148,13 +247,15 @@ class LinkedInSignalMonitor:
                 - signal_types: Breakdown by type
                 - latest_timestamp: Most recent signal
         """
-        cutoff = datetime.now() - timedelta(days=window_days)
+        now = now or datetime.now()
+        cutoff = (now - timedelta(days=window_days)).timestamp()
         
-        # Filter signals within window
-        user_signals = self._signals.get(user_id, [])
-        recent_signals = [s for s in user_signals if s.timestamp >= cutoff]
+        # Vectorized window filter over the user's time-sorted rows
+        store = self._signal_store
+        store.prune_user(user_id, (now - timedelta(days=self.retention_days)).timestamp())
+        rows = store.window(store.user_rows.get(user_id, []), cutoff)
         
-        if not recent_signals:
+        if not rows.size:
             return {
                 "signals": [],
                 "frequency_score": 0.0,
@@ -164,45 +265,57 @@ class LinkedInSignalMonitor:
             }
         
         # Count by type
-        type_counts: Dict[str, int] = defaultdict(int)
-        for signal in recent_signals:
-            type_counts[signal.type.value] += 1
+        type_counts = store.type_counts(rows)
         
         # Calculate frequency score (more signals = higher score, capped at 1.0)
         # Formula: 1 - e^(-count/5) gives diminishing returns
-        import math
-        frequency_score = 1 - math.exp(-len(recent_signals) / 5)
+        frequency_score = 1 - exp(-rows.size / 5)
         
-        # Sort by timestamp to get latest
-        recent_signals.sort(key=lambda s: s.timestamp, reverse=True)
+        # Latest first
+        recent_signals = store.signals(rows[::-1])
         
         return {
             "signals": recent_signals,
             "frequency_score": round(frequency_score, 3),
             "total_count": len(recent_signals),
-            "signal_types": dict(type_counts),
+            "signal_types": type_counts,
             "latest_timestamp": recent_signals[0].timestamp,
         }
     
     def clear_signals(self, user_id: Optional[str] = None) -> None:
         """Clear stored signals for a user or all users."""
         if user_id:
-            self._signals[user_id] = []
+            self._signal_store.remove_user(user_id)
         else:
-            self._signals.clear()
+            self._signal_store.clear()
+    
+    def _store(self, signal: SignalEvent) -> None:
+        """
+        Add a signal to the store (kept in timestamp order per user).
+        
+        Past max_signals_per_user the oldest row is dropped on each insert;
+        the store marks it dead and reclaims the space in amortized batches.
+        """
+        store = self._signal_store
+        store.append(signal)
+        if len(store.user_rows[signal.user_id]) > self.max_signals_per_user:
+            store.prune_user(signal.user_id, float("-inf"), self.max_signals_per_user)
     
     def _validate_required_fields(
         self, 
         payload: Dict[str, Any], 
-        required: List[str]
+        required: Tuple[str, ...]
     ) -> None:
         """Validate that required fields are present in payload."""
-        missing = [f for f in required if f not in payload or not payload[f]]
-        if missing:
-            raise ValueError(f"Missing required fields: {missing}")
+        # One get() per field on the happy path; list every missing field on failure
+        get = payload.get
+        for f in required:
+            if not get(f):
+                missing = [name for name in required if not get(name)]
+                raise ValueError(f"Missing required fields: {missing}")
     
-    def _parse_timestamp(self, timestamp: Optional[str]) -> datetime:
-        """Parse timestamp string or return current time."""
+    def _parse_timestamp(self, timestamp: Optional[str], now: Optional[datetime] = None) -> datetime:
+        """Parse timestamp string or return now (default: current time)."""
         if timestamp:
-            return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return datetime.now()
+            return parse_iso(timestamp)
+        return now or datetime.now()
@@ -5,11 +5,19 @@ This is the unified format for signals from LinkedIn, funding announcements,
 role changes, events, and any other intent indicators.
 """
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from enum import Enum
 
+from ._ts_cache import parse_iso
+
+try:
+    import orjson
+except ImportError:  # Optional: signals_to_json falls back to stdlib json
+    orjson = None
+
 
 class SignalType(Enum):
     """Types of signals that can be detected."""
@@ -30,6 +38,30 @@ class SignalType(Enum):
     PRICING_PAGE_VISIT = "pricing_page_visit"
 
 
+# Dense integer IDs (definition order) for array-based lookups
+SIGNAL_TYPE_IDS: Dict[SignalType, int] = {t: i for i, t in enumerate(SignalType)}
+# .value strings indexed by type ID
+SIGNAL_TYPE_VALUES: Tuple[str, ...] = tuple(t.value for t in SignalType)
+
+# Action keywords recognised in data["event_type"] / data["round_type"].
+# SignalEvent.action_id is the index of the first match (-1 if none).
+ACTION_KEYWORDS = ("like", "comment", "share", "visit")
+
+
+def _resolve_action_id(data: Dict[str, Any]) -> int:
+    """Substring-match the signal's action type against ACTION_KEYWORDS."""
+    if not data:
+        return -1
+    action_type = data.get("event_type") or data.get("round_type")
+    if not action_type:
+        return -1
+    action_lower = str(action_type).lower()
+    for idx, key in enumerate(ACTION_KEYWORDS):
+        if key in action_lower:
+            return idx
+    return -1
+
+
 class SignalSource(Enum):
     """Source of the signal."""
     LINKEDIN = "linkedin"
@@ -40,11 +72,20 @@ class SignalSource(Enum):
     MANUAL = "manual"
 
 
-@dataclass(frozen=True)
+# Plain dict lookups are cheaper than Enum(value) in from_dict
+_TYPE_BY_VALUE: Dict[str, SignalType] = {t.value: t for t in SignalType}
+_SOURCE_BY_VALUE: Dict[str, SignalSource] = {s.value: s for s in SignalSource}
+
+
+@dataclass(slots=True, eq=False)
 class SignalEvent:
     """
     Unified signal event representing any buying signal.
     
+    Treat instances as immutable once created: the cached fields below are
+    derived in __post_init__ and are not recomputed on later writes.
+    Equality is identity (compare to_dict() for value equality).
+    
     Attributes:
         type: The type of signal (e.g., content_engagement, funding_round)
         user_id: LinkedIn user ID or unique identifier for the prospect
@@ -53,14 +94,23 @@ class SignalEvent:
         data: Additional signal-specific data
         company_id: Optional company identifier
         strength: Signal strength score (0.0 to 1.0)
+        action_id: Index into ACTION_KEYWORDS, resolved once on creation
+        ts_epoch: timestamp as POSIX seconds, cached on creation
+        type_id: Index into SIGNAL_TYPE_IDS, cached on creation
     """
     type: SignalType
     user_id: str
     timestamp: datetime
     source: SignalSource
-    data: Dict[str, Any] = field(default_factory=dict, hash=False)
+    data: Dict[str, Any] = field(default_factory=dict)
     company_id: Optional[str] = None
     strength: float = 0.5
+    action_id: int = field(default=-1, init=False, repr=False)
+    ts_epoch: float = field(default=0.0, init=False, repr=False)
+    type_id: int = field(default=-1, init=False, repr=False)
+    # Enum .value strings, cached for serialization
+    _type_value: str = field(default="", init=False, repr=False)
+    _source_value: str = field(default="", init=False, repr=False)
     
     def __post_init__(self):
         """Validate signal data after initialization."""
@@ -69,14 +119,21 @@ class SignalEvent:
         
         if not self.user_id:
             raise ValueError("user_id cannot be empty")
+        
+        # Classify the action once so scorers don't re-scan strings per call
+        self.action_id = _resolve_action_id(self.data)
+        self.ts_epoch = self.timestamp.timestamp()
+        self.type_id = SIGNAL_TYPE_IDS[self.type]
+        self._type_value = self.type.value
+        self._source_value = self.source.value
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert signal to dictionary for serialization."""
         return {
-            "type": self.type.value,
+            "type": self._type_value,
             "user_id": self.user_id,
             "timestamp": self.timestamp.isoformat(),
-            "source": self.source.value,
+            "source": self._source_value,
             "data": self.data,
             "company_id": self.company_id,
             "strength": self.strength,
@@ -85,11 +142,18 @@ class SignalEvent:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SignalEvent":
         """Create SignalEvent from dictionary."""
+        try:
+            signal_type = _TYPE_BY_VALUE[data["type"]]
+            source = _SOURCE_BY_VALUE[data["source"]]
+        except KeyError:
+            # Missing key, or an unknown value: let the enum raise its ValueError
+            signal_type = SignalType(data["type"])
+            source = SignalSource(data["source"])
         return cls(
-            type=SignalType(data["type"]),
+            type=signal_type,
             user_id=data["user_id"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            source=SignalSource(data["source"]),
+            timestamp=parse_iso(data["timestamp"]),
+            source=source,
             data=data.get("data", {}),
             company_id=data.get("company_id"),
             strength=data.get("strength", 0.5),
@@ -114,3 +178,41 @@ class SignalEvent:
         import math
         age = self.age_hours()
         return math.exp(-0.693 * age / half_life_hours)
+
+
+def signals_to_json(events: Iterable[SignalEvent]) -> bytes:
+    """
+    Serialize many signals to a JSON array in one call.
+    
+    Same per-signal shape as SignalEvent.to_dict(). Uses orjson when
+    installed (datetimes are encoded natively, matching isoformat());
+    otherwise stdlib json.
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps([
+            {
+                "type": e._type_value,
+                "user_id": e.user_id,
+                "timestamp": e.timestamp,
+                "source": e._source_value,
+                "data": e.data,
+                "company_id": e.company_id,
+                "strength": e.strength,
+            }
+            for e in events
+        ])
+    return json.dumps([e.to_dict() for e in events]).encode("utf-8")
+
+
+def signals_from_json(blob: bytes) -> List[SignalEvent]:
+    """
+    Deserialize a JSON array produced by signals_to_json.
+    
+    Uses orjson for parsing when installed, otherwise stdlib json.
+    """
+    records = orjson.loads(blob) if orjson is not None else json.loads(blob)
+    from_dict = SignalEvent.from_dict
+    return [from_dict(record) for record in records]
@@ -0,0 +1,212 @@
+"""
+SignalStore: columnar (struct-of-arrays) storage for SignalEvents.
+
+Hot numeric fields live in parallel NumPy columns (timestamp, type id,
+strength) so window filters and per-type counts are array ops over a
+user's rows instead of attribute reads on scattered objects. The
+SignalEvent objects are kept alongside for callers that need them.
+
+Dropped rows are only marked dead at first; the columns and event list are
+compacted once dead rows outnumber live ones, so memory stays proportional
+to the live signals.
+"""
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .signal_event import SignalEvent, SIGNAL_TYPE_VALUES
+
+
+class SignalStore:
+    """
+    Append-only columnar signal store with per-user and per-company row indexes.
+
+    Row lists are kept in timestamp order, so a time-window query is a binary
+    search for the first row inside the window. Removed and pruned rows leave
+    user_rows at once and are marked dead (alive[row] = False, event
+    released). Company row lists drop their dead rows in one pass once half
+    of a list is dead, and window() skips dead rows until then. When dead rows
+    outnumber live ones the store compacts: columns and events are rewritten
+    with live rows only and every row list is renumbered, so row indexes are
+    only stable between compactions.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every signal."""
+        self._size = 0
+        self.ts = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self.type_id = np.empty(self._INITIAL_CAPACITY, dtype=np.int8)
+        self.strength = np.empty(self._INITIAL_CAPACITY, dtype=np.float32)
+        self.alive = np.empty(self._INITIAL_CAPACITY, dtype=bool)
+        self.events: List[Optional[SignalEvent]] = []
+        self.user_rows: Dict[str, List[int]] = defaultdict(list)
+        self.company_rows: Dict[str, List[int]] = defaultdict(list)
+        self._dead = 0
+        # Dead rows still listed in each company's row list
+        self._company_dead: Dict[str, int] = defaultdict(int)
+
+    def append(self, signal: SignalEvent) -> int:
+        """
+        Add a signal and index it by user and company.
+
+        Returns:
+            Row index of the stored signal
+        """
+        row = self._size
+        if row == self.ts.size:
+            self._grow()
+
+        self.ts[row] = signal.ts_epoch
+        self.type_id[row] = signal.type_id
+        self.strength[row] = signal.strength
+        self.alive[row] = True
+        self.events.append(signal)
+        self._size += 1
+
+        # Keep row lists sorted by timestamp (ties keep arrival order)
+        ts = self.ts
+        insort(self.user_rows[signal.user_id], row, key=ts.__getitem__)
+        if signal.company_id:
+            insort(self.company_rows[signal.company_id], row, key=ts.__getitem__)
+        return row
+
+    def window(self, rows: List[int], cutoff: Optional[float] = None) -> np.ndarray:
+        """
+        Live rows (oldest first) whose timestamp is >= cutoff.
+
+        Row lists are time-sorted, so the window is a suffix found by binary
+        search: O(log n + k) for k rows in the window. Dead rows still
+        listed in a company row list are masked out.
+
+        Args:
+            rows: A row list from user_rows or company_rows
+            cutoff: POSIX time lower bound (default: no bound)
+        """
+        if cutoff is not None:
+            rows = rows[bisect_left(rows, cutoff, key=self.ts.__getitem__):]
+        idx = np.asarray(rows, dtype=np.intp)
+        return idx[self.alive[idx]]
+
+    def type_counts(self, rows: np.ndarray) -> Dict[str, int]:
+        """Count signals per SignalType value over the given rows."""
+        counts = np.bincount(self.type_id[rows], minlength=len(SIGNAL_TYPE_VALUES))
+        present = np.flatnonzero(counts)
+        return dict(zip([SIGNAL_TYPE_VALUES[i] for i in present.tolist()], counts[present].tolist()))
+
+    def signals(self, rows: np.ndarray) -> List[SignalEvent]:
+        """SignalEvent objects for the given rows, in row order."""
+        events = self.events
+        return [events[r] for r in rows.tolist()]
+
+    def remove_user(self, user_id: str) -> None:
+        """Drop a user's rows from the user and company indexes."""
+        self._drop_rows(self.user_rows.pop(user_id, []))
+
+    def prune_user(self, user_id: str, cutoff: float, max_rows: Optional[int] = None) -> int:
+        """
+        Drop a user's rows older than cutoff, and beyond max_rows keep only the newest.
+
+        Rows are time-sorted, so this trims a prefix of the user's row list.
+
+        Args:
+            user_id: User whose rows to prune
+            cutoff: POSIX time; rows with an earlier timestamp are dropped
+            max_rows: Optional cap on rows kept for the user
+
+        Returns:
+            Number of rows dropped
+        """
+        rows = self.user_rows.get(user_id)
+        if not rows:
+            return 0
+        n = bisect_left(rows, cutoff, key=self.ts.__getitem__)
+        if max_rows is not None:
+            n = max(n, len(rows) - max_rows)
+        if n <= 0:
+            return 0
+        dropped = rows[:n]
+        del rows[:n]
+        self._drop_rows(dropped)
+        return n
+
+    def _drop_rows(self, rows: List[int]) -> None:
+        """
+        Mark rows (already gone from user_rows) dead and release their events.
+
+        Amortized O(1) per row: a company row list is only rewritten once
+        half of it is dead, and the whole store only once half of it is.
+        """
+        if not rows:
+            return
+        events = self.events
+        company_dead = self._company_dead
+        touched = set()
+        for r in rows:
+            company_id = events[r].company_id
+            if company_id:
+                company_dead[company_id] += 1
+                touched.add(company_id)
+            events[r] = None
+        self.alive[rows] = False
+        self._dead += len(rows)
+
+        if self._dead * 2 > self._size and self._size >= self._INITIAL_CAPACITY:
+            self._compact()
+            return
+        alive = self.alive
+        for company_id in touched:
+            company = self.company_rows[company_id]
+            if company_dead[company_id] * 2 >= len(company):
+                live = [r for r in company if alive[r]]
+                if live:
+                    self.company_rows[company_id] = live
+                else:
+                    del self.company_rows[company_id]
+                del company_dead[company_id]
+
+    def _compact(self) -> None:
+        """Rewrite columns and events with live rows only and renumber every row list."""
+        size = self._size
+        live = np.flatnonzero(self.alive[:size])
+        n = live.size
+        remap = np.full(size, -1, dtype=np.intp)
+        remap[live] = np.arange(n)
+
+        capacity = max(self._INITIAL_CAPACITY, 2 * n)
+        for name in ("ts", "type_id", "strength", "alive"):
+            column = getattr(self, name)
+            compacted = np.empty(capacity, dtype=column.dtype)
+            compacted[:n] = column[live]
+            setattr(self, name, compacted)
+        events = self.events
+        self.events = [events[r] for r in live.tolist()]
+        self._size = n
+        self._dead = 0
+
+        # Elementwise remap keeps each list in timestamp order
+        for index in (self.user_rows, self.company_rows):
+            for key, rows in list(index.items()):
+                kept = remap[np.asarray(rows, dtype=np.intp)]
+                kept = kept[kept >= 0]
+                if kept.size:
+                    index[key] = kept.tolist()
+                else:
+                    del index[key]
+        self._company_dead.clear()
+
+    def _grow(self) -> None:
+        """Double column capacity (amortized O(1) appends)."""
+        capacity = self.ts.size * 2
+        self.ts = np.resize(self.ts, capacity)
+        self.type_id = np.resize(self.type_id, capacity)
+        self.strength = np.resize(self.strength, capacity)
+        self.alive = np.resize(self.alive, capacity)
@@ -1,9 +1,30 @@
+"""
+Tokenizer and embedding similarity utilities.
+
+For scoring many candidates against one query, use cosine_similarity_batch
+(one BLAS call) rather than cosine_similarity in a Python loop; the same
+holds for dot_product_batch and euclidean_distance_batch over row pairs, and
+cosine_similarity_paired for matching rows (A[i] vs B[i]). For very
+large tables, similarity_numba.cosine_batch fuses dot + norm into a single
+pass, and its dot_product / cosine_similarity / euclidean_distance are
+compiled drop-ins for per-pair hot loops (imported separately so the Numba
+compile only happens on demand).
+"""
+
 from .sales_tokenizer import SalesTokenizer
-from .similarity import dot_product, cosine_similarity, euclidean_distance
+from .similarity import (
+    dot_product, cosine_similarity, euclidean_distance,
+    dot_product_batch, cosine_similarity_batch, euclidean_distance_batch,
+    cosine_similarity_paired,
+)
 
 __all__ = [
     'SalesTokenizer',
     'dot_product',
     'cosine_similarity',
-    'euclidean_distance'
+    'euclidean_distance',
+    'dot_product_batch',
+    'cosine_similarity_batch',
+    'euclidean_distance_batch',
+    'cosine_similarity_paired',
 ]
\ No newline at end of file
@@ -1,6 +1,74 @@
 
 import json
 import os
+from bisect import bisect_right
+from operator import itemgetter
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional: tokenize_batch falls back to np.digitize
+    njit = None
+
+# Bucket edges, shared by tokenize_lead (bisect_right) and tokenize_batch
+# (np.digitize); both use left-closed bins and put NaN in the top bucket
+TENURE_EDGES = np.array([3, 6, 18])
+FUNDING_EDGES = np.array([1e5, 1e6, 1e7])
+MOMENTUM_EDGES = np.array([0.8, 1.2])
+COMP_EDGES = np.array([3, 10])
+
+# Per-lead lookup tables: token = TOKENS[bisect_right(BOUNDS, value)].
+# Bounds are plain tuples so bisect compares Python floats, not NumPy scalars.
+_TENURE_BOUNDS = tuple(TENURE_EDGES.tolist())
+_TENURE_TOKENS = ("TENURE_NEW", "TENURE_SHORT", "TENURE_MID", "TENURE_LONG")
+_FUNDING_BOUNDS = tuple(FUNDING_EDGES.tolist())
+_FUNDING_TOKENS = ("FUNDING_BOOTSTRAP", "FUNDING_SEED", "FUNDING_SERIES_A", "FUNDING_GROWTH")
+_MOMENTUM_BOUNDS = tuple(MOMENTUM_EDGES.tolist())
+_MOMENTUM_TOKENS = ("MOMENTUM_DECLINING", "MOMENTUM_STABLE", "MOMENTUM_ACCELERATING")
+_COMP_BOUNDS = tuple(COMP_EDGES.tolist())
+_COMP_TOKENS = ("COMP_LOW", "COMP_MED", "COMP_HIGH")
+
+
+def _lookup_all(mapping, keys):
+    """[mapping[k] for k in keys] as a single C-level itemgetter call"""
+    if len(keys) > 1:
+        return list(itemgetter(*keys)(mapping))
+    return [mapping[k] for k in keys]
+
+
+def _activity_bucket_kernel(own_1m, own_3m, comp_1m, comp_3m, momentum_base, comp_base,
+                            momentum_out, comp_out):
+    """
+    Momentum and competition token IDs in one pass over the four view columns.
+    
+    Same buckets as MOMENTUM_EDGES / COMP_EDGES with np.digitize (NaN lands
+    in the top bucket). Numeric columns only - no strings cross into numba.
+    """
+    for i in range(own_1m.shape[0]):
+        surge = own_1m[i] / (own_3m[i] / 3.0 + 1e-8)
+        if surge < 0.8:
+            momentum_out[i] = momentum_base
+        elif surge < 1.2:
+            momentum_out[i] = momentum_base + 1
+        else:
+            momentum_out[i] = momentum_base + 2
+        
+        intensity = comp_1m[i] + comp_3m[i]
+        if intensity < 3:
+            comp_out[i] = comp_base
+        elif intensity < 10:
+            comp_out[i] = comp_base + 1
+        else:
+            comp_out[i] = comp_base + 2
+
+
+# Declared signature: compiled once at import (cached to disk). No fastmath,
+# so edge cases round exactly like the NumPy path.
+_jit_activity_bucket_kernel = njit(
+    "void(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int32[::1], int32[::1])",
+    cache=True,
+)(_activity_bucket_kernel) if njit is not None else None
 
 class SalesTokenizer:
     def __init__(self):
@@ -12,7 +80,8 @@ class SalesTokenizer:
         - Raw features for funding and tenure
         """
         self.vocab = self._build_vocab() # Token -> ID
-        self.id_to_token = {v: k for k, v in self.vocab.items()} 
+        self.id_to_token = self._build_id_to_token() # ID -> Token (list, IDs are dense)
+        self._sig_value_to_id = self._build_signal_lookup()
     
     def _build_vocab(self):
         """Build the vocabulary mapping token -> ID"""
@@ -25,22 +94,22 @@ class SalesTokenizer:
             idx += 1
         
         # Tenure buckets
-        for token in ["TENURE_NEW", "TENURE_SHORT", "TENURE_MID", "TENURE_LONG"]:
+        for token in _TENURE_TOKENS:
             vocab[token] = idx
             idx += 1
         
         # Funding buckets
-        for token in ["FUNDING_BOOTSTRAP", "FUNDING_SEED", "FUNDING_SERIES_A", "FUNDING_GROWTH"]:
+        for token in _FUNDING_TOKENS:
             vocab[token] = idx
             idx += 1
         
         # Momentum buckets
-        for token in ["MOMENTUM_DECLINING", "MOMENTUM_STABLE", "MOMENTUM_ACCELERATING"]:
+        for token in _MOMENTUM_TOKENS:
             vocab[token] = idx
             idx += 1
         
         # Competition buckets
-        for token in ["COMP_LOW", "COMP_MED", "COMP_HIGH"]:
+        for token in _COMP_TOKENS:
             vocab[token] = idx
             idx += 1
         
@@ -65,16 +134,40 @@ class SalesTokenizer:
             
         return vocab
     
-    def tokenize_lead(self, lead_data, signals=None):
+    def _build_id_to_token(self):
+        """Reverse vocab as a list indexed by ID (IDs are contiguous 0..V-1)"""
+        id_to_token = [None] * len(self.vocab)
+        for token, idx in self.vocab.items():
+            id_to_token[idx] = token
+        return id_to_token
+    
+    def _build_signal_lookup(self):
+        """Map raw signal type value (e.g. "funding_round") -> SIGNAL_* token ID"""
+        return {
+            name[len("SIGNAL_"):].lower(): idx
+            for name, idx in self.vocab.items() if name.startswith("SIGNAL_")
+        }
+    
+    def _signal_token_id(self, t_val):
+        """Token ID for a signal type value, or None if not in vocab"""
+        tid = self._sig_value_to_id.get(t_val)
+        if tid is None and isinstance(t_val, str):
+            # Tolerate non-lowercase values (token names are case-insensitive)
+            tid = self._sig_value_to_id.get(t_val.lower())
+        return tid
+    
+    def tokenize_lead(self, lead_data, signals=None, return_strings=True):
         """
         Convert lead dict + signals to list of token strings.
         
         Args:
             lead_data: dict with lead attributes
             signals: optional list of SignalEvent objects or dicts
+            return_strings: build the token string list (set False when only
+                            IDs are needed, e.g. at inference)
         
         Returns:
-            tokens: list of token strings
+            tokens: list of token strings (None if return_strings is False)
             token_ids: list of token IDs
         """
         tokens = ["[START]"]
@@ -83,29 +176,13 @@ class SalesTokenizer:
         # Tokenize months_in_role
         # ===================================
         months = lead_data.get("months_in_role", 0)
-        
-        if months < 3:
-            tokens.append("TENURE_NEW")
-        elif 3 <= months < 6:
-            tokens.append("TENURE_SHORT")
-        elif 6 <= months < 18:
-            tokens.append("TENURE_MID")
-        else:
-            tokens.append("TENURE_LONG")
+        tokens.append(_TENURE_TOKENS[bisect_right(_TENURE_BOUNDS, months)])
         
         # ===================================
         # Tokenize funding_amount
         # ===================================
         funding = lead_data.get("funding_amount", 0)
-
-        if funding < 100000:
-            tokens.append("FUNDING_BOOTSTRAP")
-        elif 100000 <= funding < 1000000:
-            tokens.append("FUNDING_SEED")
-        elif 1000000 <= funding < 10000000:
-            tokens.append("FUNDING_SERIES_A")
-        else:
-            tokens.append("FUNDING_GROWTH")
+        tokens.append(_FUNDING_TOKENS[bisect_right(_FUNDING_BOUNDS, funding)])
         
         # ===================================
         # Calculate and tokenize momentum
@@ -117,12 +194,7 @@ class SalesTokenizer:
         # Formula: ratio = current / (average + epsilon)
         avg_views_per_month = own_views_3m / 3.0
         own_surge_ratio = own_views_1m / (avg_views_per_month + epsilon)
-        if own_surge_ratio < 0.8:
-            tokens.append("MOMENTUM_DECLINING")
-        elif 0.8 <= own_surge_ratio < 1.2:
-            tokens.append("MOMENTUM_STABLE")
-        else:
-            tokens.append("MOMENTUM_ACCELERATING")        
+        tokens.append(_MOMENTUM_TOKENS[bisect_right(_MOMENTUM_BOUNDS, own_surge_ratio)])
         
         # ===================================
         # Calculate and tokenize competition
@@ -131,16 +203,12 @@ class SalesTokenizer:
         comp_views_1m = lead_data.get("comp_views_1m", 0)
         
         comp_intensity = comp_views_1m + comp_views_3m
-        if comp_intensity < 3:
-            tokens.append("COMP_LOW")
-        elif comp_intensity < 10:
-            tokens.append("COMP_MED")
-        else:
-            tokens.append("COMP_HIGH")
+        tokens.append(_COMP_TOKENS[bisect_right(_COMP_BOUNDS, comp_intensity)])
             
         # ===================================
         # Tokenize Signals
         # ===================================
+        signal_ids = []
         if signals:
             for sig in signals:
                 # Handle both SignalEvent objects and dicts (from synthetic data)
@@ -152,28 +220,108 @@ class SalesTokenizer:
                 else:
                     continue
                     
-                # Construct token: SIGNAL_TYPE
-                # e.g. funding_round -> SIGNAL_FUNDING_ROUND
-                token_name = f"SIGNAL_{t_val}".upper()
-                
+                # e.g. funding_round -> ID of SIGNAL_FUNDING_ROUND
                 # Add if in vocab, otherwise ignore
-                if token_name in self.vocab:
-                    tokens.append(token_name)
-        
-        tokens.append("[END]")
+                tid = self._signal_token_id(t_val)
+                if tid is not None:
+                    signal_ids.append(tid)
         
         # Convert tokens to IDs
-        token_ids = self._tokens_to_ids(tokens)
+        token_ids = self._tokens_to_ids(tokens) + signal_ids
+        token_ids.append(self.vocab["[END]"])
+        
+        if not return_strings:
+            return None, token_ids
+        
+        tokens.extend(self.id_to_token[tid] for tid in signal_ids)
+        tokens.append("[END]")
         
         return tokens, token_ids
     
+    def tokenize_batch(self, leads, signals_list=None):
+        """
+        Vectorized tokenize_lead for many leads at once.
+        
+        Each numeric feature is pulled into a column and bucketed with a
+        single np.digitize call; bucket index + the feature's first token ID
+        gives the token ID directly (bucket tokens are contiguous in vocab).
+        
+        Args:
+            leads: list of lead dicts
+            signals_list: optional list (one per lead) of signal lists
+        
+        Returns:
+            token_ids: int32 array [N, max_len], rows padded with [PAD]
+                       (same IDs as tokenize_lead per row)
+        """
+        n = len(leads)
+        
+        def column(key):
+            return np.array([lead.get(key, 0) for lead in leads], dtype=np.float64)
+        
+        tenure_ids = self.vocab["TENURE_NEW"] + np.digitize(column("months_in_role"), TENURE_EDGES)
+        funding_ids = self.vocab["FUNDING_BOOTSTRAP"] + np.digitize(column("funding_amount"), FUNDING_EDGES)
+        
+        if _jit_activity_bucket_kernel is not None:
+            # Compiled single pass for momentum + competition
+            momentum_ids = np.empty(n, dtype=np.int32)
+            comp_ids = np.empty(n, dtype=np.int32)
+            _jit_activity_bucket_kernel(
+                column("own_views_1m"), column("own_views_3m"),
+                column("comp_views_1m"), column("comp_views_3m"),
+                self.vocab["MOMENTUM_DECLINING"], self.vocab["COMP_LOW"],
+                momentum_ids, comp_ids,
+            )
+        else:
+            epsilon = 1e-8
+            surge = column("own_views_1m") / (column("own_views_3m") / 3.0 + epsilon)
+            momentum_ids = self.vocab["MOMENTUM_DECLINING"] + np.digitize(surge, MOMENTUM_EDGES)
+            
+            comp_intensity = column("comp_views_1m") + column("comp_views_3m")
+            comp_ids = self.vocab["COMP_LOW"] + np.digitize(comp_intensity, COMP_EDGES)
+        
+        features = np.column_stack([
+            np.full(n, self.vocab["[START]"]), tenure_ids, funding_ids, momentum_ids, comp_ids
+        ]).astype(np.int32)
+        
+        # Signal tokens: signal type value -> ID, unknown types dropped
+        per_lead_signals = []
+        for signals in (signals_list or [None] * n):
+            ids = []
+            for sig in signals or []:
+                if hasattr(sig, 'type'):
+                    t_val = sig.type.value
+                elif isinstance(sig, dict):
+                    t_val = sig.get('type', '')
+                else:
+                    continue
+                idx = self._signal_token_id(t_val)
+                if idx is not None:
+                    ids.append(idx)
+            per_lead_signals.append(ids)
+        
+        num_features = features.shape[1]
+        max_len = num_features + max((len(ids) for ids in per_lead_signals), default=0) + 1
+        token_ids = np.full((n, max_len), self.vocab["[PAD]"], dtype=np.int32)
+        token_ids[:, :num_features] = features
+        end_id = self.vocab["[END]"]
+        for row, ids in enumerate(per_lead_signals):
+            token_ids[row, num_features:num_features + len(ids)] = ids
+            token_ids[row, num_features + len(ids)] = end_id
+        
+        return token_ids
+    
     def _tokens_to_ids(self, tokens):
         """Convert token strings to IDs using self.vocab"""
-        return [self.vocab[token] for token in tokens]
+        return _lookup_all(self.vocab, tokens)
     
     def ids_to_tokens(self, token_ids):
-        """Convert token IDs back to strings"""
-        return [self.id_to_token[idx] for idx in token_ids]
+        """Convert token IDs back to strings (KeyError for an ID not in the vocab)"""
+        # id_to_token is a list: a negative ID would silently index from the end
+        if len(token_ids) and (min(token_ids) < 0 or max(token_ids) >= len(self.id_to_token)):
+            bad = next(t for t in token_ids if not 0 <= t < len(self.id_to_token))
+            raise KeyError(bad)
+        return _lookup_all(self.id_to_token, token_ids)
     
     def save_vocab(self, filepath):
         """Save vocabulary to JSON file"""
@@ -183,8 +331,19 @@ class SalesTokenizer:
         print(f"Vocabulary saved to {filepath}")
     
     def load_vocab(self, filepath):
-        """Load vocabulary from JSON file"""
+        """
+        Load vocabulary from JSON file
+        
+        Raises:
+            ValueError: if the token IDs are not exactly 0..V-1 (id_to_token
+                        is a list indexed by ID)
+        """
         with open(filepath, 'r') as f:
-            self.vocab = json.load(f)
-        self.id_to_token = {v: k for k, v in self.vocab.items()}
+            vocab = json.load(f)
+        if sorted(vocab.values()) != list(range(len(vocab))):
+            raise ValueError(f"Vocabulary IDs in {filepath} must be exactly 0..{len(vocab) - 1}")
+        
+        self.vocab = vocab
+        self.id_to_token = self._build_id_to_token()
+        self._sig_value_to_id = self._build_signal_lookup()
         print(f"Vocabulary loaded from {filepath}")
\ No newline at end of file
@@ -1,9 +1,26 @@
+import math
+
 import numpy as np
 
 # ===================================
 # Embedding Similarity Functions
 # ===================================
 
+# Below this many dims, plain Python math beats NumPy's per-call
+# array conversion and dispatch overhead for list/tuple inputs
+SMALL_VEC_DIM = 64
+
+
+def _is_small_sequence(vec1, vec2):
+    """
+    True when both inputs are short, equal-length lists/tuples (pure-Python fast path).
+    
+    Mismatched lengths go to NumPy, which raises ValueError instead of
+    letting zip() silently truncate.
+    """
+    return (isinstance(vec1, (list, tuple)) and isinstance(vec2, (list, tuple))
+            and len(vec1) < SMALL_VEC_DIM and len(vec1) == len(vec2))
+
 def dot_product(vec1, vec2):
     """
     Calculate dot product between two vectors
@@ -20,8 +37,11 @@ def dot_product(vec1, vec2):
         vec2 = [4, 5, 6]
         result = 1*4 + 2*5 + 3*6 = 32
     """
-    vec1 = np.array(vec1)
-    vec2 = np.array(vec2)
+    if _is_small_sequence(vec1, vec2):
+        return sum(a * b for a, b in zip(vec1, vec2))
+    
+    vec1 = np.asarray(vec1)
+    vec2 = np.asarray(vec2)
     
     return np.dot(vec1, vec2)
 
@@ -42,15 +62,25 @@ def cosine_similarity(vec1, vec2):
         vec2 = [1, 0, 0]
         result = 1.0 (identical)
     """
-    vec1 = np.array(vec1)
-    vec2 = np.array(vec2)
-    
     # Formula:
     #     cosine_sim = dot(vec1, vec2) / (||vec1|| * ||vec2||)
     #     where ||vec|| = sqrt(sum(vec^2))
     # Edge case: Handle division by zero if magnitude is 0 -> add epsilon to the denominator
     epsilon = 1e-8
-    cosine_sim = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2) + epsilon) 
+    
+    if _is_small_sequence(vec1, vec2):
+        dot = sum(a * b for a, b in zip(vec1, vec2))
+        n1 = math.sqrt(sum(a * a for a in vec1))
+        n2 = math.sqrt(sum(b * b for b in vec2))
+        return dot / (n1 * n2 + epsilon)
+    
+    vec1 = np.asarray(vec1)
+    vec2 = np.asarray(vec2)
+    # Norms as self-dot products: one fused multiply-add reduction each,
+    # no squared temporary
+    n1 = math.sqrt(np.dot(vec1, vec1))
+    n2 = math.sqrt(np.dot(vec2, vec2))
+    cosine_sim = np.dot(vec1, vec2) / (n1 * n2 + epsilon)
     return cosine_sim
 
 
@@ -70,10 +100,117 @@ def euclidean_distance(vec1, vec2):
         vec2 = [3, 4, 0]
         result = 5.0 (3-4-5 triangle)
     """
-    vec1 = np.array(vec1)
-    vec2 = np.array(vec2)
+    if _is_small_sequence(vec1, vec2):
+        return math.dist(vec1, vec2)
+    
+    vec1 = np.asarray(vec1)
+    vec2 = np.asarray(vec2)
     
     # Formula:
-    #     distance = sqrt(sum((vec1 - vec2)^2))
-    distance = np.sqrt(np.sum(np.square(vec1 - vec2)))
-    return distance
\ No newline at end of file
+    #     distance = sqrt(sum((vec1 - vec2)^2)) = sqrt(dot(diff, diff))
+    diff = vec1 - vec2
+    distance = math.sqrt(np.dot(diff, diff))
+    return distance
+
+
+def dot_product_batch(A, B):
+    """
+    Pairwise dot products between the rows of two matrices
+
+    One BLAS matrix-matrix product instead of a dot_product per pair.
+
+    Args:
+        A: numpy array, shape (m, d)
+        B: numpy array, shape (n, d)
+
+    Returns:
+        scores: numpy array, shape (m, n) where scores[i, j] = dot(A[i], B[j])
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    return A @ B.T
+
+
+def cosine_similarity_batch(query, mat, row_norms=None):
+    """
+    Cosine similarity between a query and every row of a matrix
+
+    Prefer this over calling cosine_similarity in a loop: the whole batch is
+    a single BLAS matrix-vector (or matrix-matrix) product.
+
+    Args:
+        query: numpy array, shape (d,) - or (m, d) for all pairs of rows
+        mat: numpy array, shape (n, d) - one candidate per row
+        row_norms: optional precomputed np.linalg.norm(mat, axis=1), shape (n,);
+                   cache it when the same matrix is queried repeatedly
+
+    Returns:
+        similarities: numpy array, shape (n,) - or (m, n) for a 2-D query -
+                      values in range [-1, 1]
+
+    Example:
+        query = [1, 0]
+        mat = [[1, 0], [0, 1]]
+        result = [1.0, 0.0]
+    """
+    query = np.asarray(query)
+    mat = np.asarray(mat)
+    assert mat.ndim == 2, f"mat must be 2-D (n, d), got shape {mat.shape}"
+
+    if row_norms is None:
+        row_norms = np.sqrt(np.einsum('ij,ij->i', mat, mat))
+
+    # Same epsilon as cosine_similarity to guard zero-magnitude rows
+    epsilon = 1e-8
+    if query.ndim == 2:
+        q_norms = np.sqrt(np.einsum('ij,ij->i', query, query))
+        return (query @ mat.T) / (np.outer(q_norms, row_norms) + epsilon)
+
+    q_norm = math.sqrt(np.dot(query, query))
+    return (mat @ query) / (row_norms * q_norm + epsilon)
+
+
+def cosine_similarity_paired(A, B):
+    """
+    Cosine similarity between matching rows of two matrices
+
+    The row-wise counterpart of cosine_similarity: out[i] compares A[i] with
+    B[i] only, so it costs O(n * d) rather than the (n, n) of
+    cosine_similarity_batch.
+
+    Args:
+        A: numpy array, shape (n, d)
+        B: numpy array, shape (n, d)
+
+    Returns:
+        similarities: numpy array, shape (n,), values in range [-1, 1]
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    dots = np.einsum('ij,ij->i', A, B)
+    norms = np.sqrt(np.einsum('ij,ij->i', A, A) * np.einsum('ij,ij->i', B, B))
+    # Same epsilon as cosine_similarity to guard zero-magnitude rows
+    epsilon = 1e-8
+    return dots / (norms + epsilon)
+
+
+def euclidean_distance_batch(A, B):
+    """
+    Pairwise Euclidean distances between the rows of two matrices
+
+    Uses ||a - b||^2 = ||a||^2 + ||b||^2 - 2 a.b so the cross term is one
+    BLAS product; small negative round-off is clipped to 0 before sqrt.
+
+    Args:
+        A: numpy array, shape (m, d)
+        B: numpy array, shape (n, d)
+
+    Returns:
+        distances: numpy array, shape (m, n), values >= 0
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    sq_a = np.einsum('ij,ij->i', A, A)
+    sq_b = np.einsum('ij,ij->i', B, B)
+    sq_dist = sq_a[:, None] + sq_b[None, :] - 2.0 * (A @ B.T)
+    return np.sqrt(np.clip(sq_dist, 0, None))
@@ -0,0 +1,189 @@
+import numpy as np
+
+from . import similarity
+from .similarity import cosine_similarity_batch
+
+# ===================================
+# Numba-compiled Batch Similarity (optional)
+# ===================================
+# Fuses the dot product and the row norm into one pass over `mat`, so each
+# row is read from memory once instead of twice (GEMV + norm), and rows are
+# split across threads with prange. Without numba installed, cosine_batch
+# falls back to the NumPy/BLAS cosine_similarity_batch.
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+
+def _cosine_batch_kernel(mat, query, out):
+    """
+    Write cosine(query, mat[i]) into out[i] for every row
+
+    Args:
+        mat: C-contiguous array, shape (n, d)
+        query: contiguous array, shape (d,)
+        out: preallocated array, shape (n,)
+    """
+    epsilon = 1e-8
+
+    # Query norm is shared by all rows - hoist it out of the parallel loop
+    nrm_q = 0.0
+    for j in range(query.shape[0]):
+        nrm_q += query[j] * query[j]
+    nrm_q = np.sqrt(nrm_q)
+
+    for i in prange(mat.shape[0]):
+        dot = 0.0
+        nrm_row = 0.0
+        for j in range(mat.shape[1]):
+            v = mat[i, j]
+            dot += v * query[j]
+            nrm_row += v * v
+        out[i] = dot / (np.sqrt(nrm_row) * nrm_q + epsilon)
+
+
+if HAVE_NUMBA:
+    # Explicit contiguous signatures: compiled once (and cached to disk),
+    # no re-specialization per call
+    _compiled_kernel = njit(
+        [
+            "void(float32[:, ::1], float32[::1], float32[::1])",
+            "void(float64[:, ::1], float64[::1], float64[::1])",
+        ],
+        parallel=True, fastmath=True, cache=True,
+    )(_cosine_batch_kernel)
+else:
+    _compiled_kernel = None
+
+
+def cosine_batch(mat, query, out=None):
+    """
+    Cosine similarity between a query and every row of a large embedding table
+
+    Args:
+        mat: numpy array, shape (n, d), float32 or float64
+        query: numpy array, shape (d,), same dtype as mat
+        out: optional preallocated output, shape (n,)
+
+    Returns:
+        similarities: numpy array, shape (n,), values in range [-1, 1]
+    
+    Raises:
+        ValueError: if the shapes don't line up (the compiled kernel does
+            no bounds checking, so this is checked before it runs)
+    """
+    mat = np.asarray(mat)
+    query = np.asarray(query)
+    if mat.ndim != 2:
+        raise ValueError(f"mat must be 2-D, got shape {mat.shape}")
+    if query.shape != (mat.shape[1],):
+        raise ValueError(f"query shape {query.shape} does not match mat shape {mat.shape}")
+    if out is not None and out.shape != (mat.shape[0],):
+        raise ValueError(f"out shape {out.shape} does not match {mat.shape[0]} rows")
+    
+    if _compiled_kernel is None:
+        result = cosine_similarity_batch(query, mat)
+        if out is None:
+            return result
+        out[:] = result
+        return out
+
+    mat = np.ascontiguousarray(mat)
+    query = np.ascontiguousarray(query, dtype=mat.dtype)
+    if out is None:
+        out = np.empty(mat.shape[0], dtype=mat.dtype)
+    _compiled_kernel(mat, query, out)
+    return out
+
+
+# ===================================
+# Numba-compiled Pairwise Similarity (optional)
+# ===================================
+# Drop-in versions of similarity.dot_product / cosine_similarity /
+# euclidean_distance for hot loops over single pairs: the compiled call
+# skips NumPy's per-call dispatch, and fastmath lets LLVM vectorize the
+# reduction. Results may differ from the NumPy versions in the last bits.
+
+def _dot_kernel(a, b):
+    """sum(a[i] * b[i])"""
+    acc = 0.0
+    for i in range(a.shape[0]):
+        acc += a[i] * b[i]
+    return acc
+
+
+def _cosine_kernel(a, b):
+    """dot(a, b) / (||a|| * ||b|| + epsilon) in one pass"""
+    dot = 0.0
+    nrm_a = 0.0
+    nrm_b = 0.0
+    for i in range(a.shape[0]):
+        dot += a[i] * b[i]
+        nrm_a += a[i] * a[i]
+        nrm_b += b[i] * b[i]
+    return dot / (np.sqrt(nrm_a) * np.sqrt(nrm_b) + 1e-8)
+
+
+def _euclidean_kernel(a, b):
+    """sqrt(sum((a[i] - b[i])^2)) without a diff temporary"""
+    acc = 0.0
+    for i in range(a.shape[0]):
+        d = a[i] - b[i]
+        acc += d * d
+    return np.sqrt(acc)
+
+
+if HAVE_NUMBA:
+    def _compile_pair(kernel):
+        return njit(
+            ["float32(float32[::1], float32[::1])", "float64(float64[::1], float64[::1])"],
+            fastmath=True, cache=True,
+        )(kernel)
+
+    _compiled_dot = _compile_pair(_dot_kernel)
+    _compiled_cosine = _compile_pair(_cosine_kernel)
+    _compiled_euclidean = _compile_pair(_euclidean_kernel)
+else:
+    _compiled_dot = _compiled_cosine = _compiled_euclidean = None
+
+
+def _as_pair(vec1, vec2):
+    """
+    Contiguous float arrays of a common dtype (float32 stays float32).
+    
+    The kernels loop over vec1 without bounds checks, so mismatched shapes
+    raise ValueError here, as similarity.py does, instead of reading past
+    the end of vec2.
+    """
+    vec1 = np.asarray(vec1)
+    dtype = np.float32 if vec1.dtype == np.float32 else np.float64
+    vec1 = np.ascontiguousarray(vec1, dtype=dtype)
+    vec2 = np.ascontiguousarray(vec2, dtype=dtype)
+    if vec1.shape != vec2.shape:
+        raise ValueError(f"vector shapes differ: {vec1.shape} vs {vec2.shape}")
+    return vec1, vec2
+
+
+def dot_product(vec1, vec2):
+    """Compiled similarity.dot_product (falls back to it without numba)."""
+    if _compiled_dot is None:
+        return similarity.dot_product(vec1, vec2)
+    return _compiled_dot(*_as_pair(vec1, vec2))
+
+
+def cosine_similarity(vec1, vec2):
+    """Compiled similarity.cosine_similarity (falls back to it without numba)."""
+    if _compiled_cosine is None:
+        return similarity.cosine_similarity(vec1, vec2)
+    return _compiled_cosine(*_as_pair(vec1, vec2))
+
+
+def euclidean_distance(vec1, vec2):
+    """Compiled similarity.euclidean_distance (falls back to it without numba)."""
+    if _compiled_euclidean is None:
+        return similarity.euclidean_distance(vec1, vec2)
+    return _compiled_euclidean(*_as_pair(vec1, vec2))
@@ -0,0 +1,40 @@
+"""Shared pytest setup: keep numeric libraries single-threaded; skip torch tests without torch."""
+
+import importlib.util
+import os
+import sys
+
+# One BLAS/OpenMP thread per process, set before any test module imports
+# numpy or torch (pools are sized at library load). Parallelism comes from
+# pytest-xdist workers; per-worker thread pools would only oversubscribe.
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+# The repo root is put on sys.path by pytest.ini (pythonpath = .).
+# Modules that import torch, directly or via src.model / src.context /
+# src.pipeline, are left out of collection when torch is not installed.
+TORCH_TEST_MODULES = [
+    "test_attention.py",
+    "test_context_scoring.py",
+    "test_e2e_pipeline.py",
+    "test_lead_scout.py",
+    "test_pipeline_engine.py",
+    "test_positional_encoding.py",
+]
+collect_ignore = [] if importlib.util.find_spec("torch") else TORCH_TEST_MODULES
+
+
+def pytest_collection_finish(session):
+    """Pin torch to one thread, if any collected module imported it.
+
+    Test tensors are tiny (e.g. [2, 6, 128]); intra-op threading only adds
+    scheduling overhead, and under xdist every worker's pool would compete for
+    the same cores, so run the CPU kernels single-threaded. torch is not
+    imported here so tokenizer/similarity-only runs never pay for it.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(1)
+        # Only settable before any inter-op work has started in this process
+        if torch.get_num_interop_threads() != 1:
+            torch.set_num_interop_threads(1)
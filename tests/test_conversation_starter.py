@@ -13,12 +13,19 @@ from src.engagement import ConversationStarter, OutreachMessage
 from src.enrichment import EnrichedLead, EnrichedContact, EnrichedCompany, SeniorityLevel
 from src.signals import SignalEvent, SignalType, SignalSource
 
+# One clock read per module, shared by every SignalEvent below
+NOW = datetime.now()
+
 
 class TestConversationStarter:
     """Tests for Conversation Starter."""
     
+    @classmethod
+    def setup_class(cls):
+        # Stateless; build once for the class
+        cls.starter = ConversationStarter()
+    
     def setup_method(self):
-        self.starter = ConversationStarter()
         self.lead = EnrichedLead(
             user_id="u1",
             contact=EnrichedContact(
@@ -36,7 +43,7 @@ class TestConversationStarter:
             SignalEvent(
                 type=SignalType.FUNDING_ROUND,
                 user_id="c1",
-                timestamp=datetime.now(),
+                timestamp=NOW,
                 source=SignalSource.CRUNCHBASE,
                 data={"round_type": "series_a"},
                 strength=0.9
@@ -55,7 +62,7 @@ class TestConversationStarter:
             SignalEvent(
                 type=SignalType.CONTENT_ENGAGEMENT,
                 user_id="u1",
-                timestamp=datetime.now(),
+                timestamp=NOW,
                 source=SignalSource.LINKEDIN,
                 data={"event_type": "share"},
                 strength=0.8
@@ -71,7 +78,7 @@ class TestConversationStarter:
         """Test 2: Role-Based Messaging (Executive)."""
         # Executive lead (VP) from setup
         signals = [
-            SignalEvent(type=SignalType.PROFILE_VISIT, user_id="u1", timestamp=datetime.now(), source=SignalSource.LINKEDIN, strength=0.5)
+            SignalEvent(type=SignalType.PROFILE_VISIT, user_id="u1", timestamp=NOW, source=SignalSource.LINKEDIN, strength=0.5)
         ]
         
         message = self.starter.generate_message(self.lead, signals)
@@ -94,7 +101,7 @@ class TestConversationStarter:
         )
         
         signals = [
-            SignalEvent(type=SignalType.PROFILE_VISIT, user_id="u2", timestamp=datetime.now(), source=SignalSource.LINKEDIN, strength=0.5)
+            SignalEvent(type=SignalType.PROFILE_VISIT, user_id="u2", timestamp=NOW, source=SignalSource.LINKEDIN, strength=0.5)
         ]
         
         message = self.starter.generate_message(manager_lead, signals)
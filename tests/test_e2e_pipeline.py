@@ -10,20 +10,27 @@ from src.pipeline import PipelineEngine, SystemConfig
 from src.context import SenderProfile
 from src.signals import SignalEvent, SignalType, SignalSource
 
+# One clock read per module, shared by every SignalEvent below
+NOW = datetime.now()
+
+
+# process_lead keeps no per-call state on the engine (the input buffer is
+# re-zeroed each call), so one engine serves every test in the module
+@pytest.fixture(scope="module")
+def setup_pipeline():
+    profile = SenderProfile(
+        name="E2ETestCorp",
+        description="Deep Tech AI",
+        value_props=["AGI", "Efficiency"],
+        target_industries=["ai_ml"],
+        target_roles=["cto"]
+    )
+    engine = PipelineEngine(profile)
+    return engine
+
+
 class TestE2EPipeline:
     
-    @pytest.fixture
-    def setup_pipeline(self):
-        profile = SenderProfile(
-            name="E2ETestCorp",
-            description="Deep Tech AI",
-            value_props=["AGI", "Efficiency"],
-            target_industries=["ai_ml"],
-            target_roles=["cto"]
-        )
-        engine = PipelineEngine(profile)
-        return engine
-
     def test_end_to_end_high_fit(self, setup_pipeline):
         """
         Scenario: High Fit (Tech Industry) + High Intent (Demo Request)
@@ -43,8 +50,8 @@ class TestE2EPipeline:
         
         # Signals
         signals = [
-            SignalEvent(SignalType.DEMO_REQUEST, "u2", datetime.now(), SignalSource.LINKEDIN, {}),
-            SignalEvent(SignalType.FUNDING_ROUND, "u2", datetime.now(), SignalSource.LINKEDIN, {})
+            SignalEvent(SignalType.DEMO_REQUEST, "u2", NOW, SignalSource.LINKEDIN, {}),
+            SignalEvent(SignalType.FUNDING_ROUND, "u2", NOW, SignalSource.LINKEDIN, {})
         ]
         
         # Execute
@@ -74,7 +81,7 @@ class TestE2EPipeline:
         
         # Signals
         signals = [
-            SignalEvent(SignalType.PRICING_PAGE_VISIT, "u3", datetime.now(), SignalSource.LINKEDIN, {})
+            SignalEvent(SignalType.PRICING_PAGE_VISIT, "u3", NOW, SignalSource.LINKEDIN, {})
         ]
         
         # Execute
@@ -15,8 +15,9 @@ from src.enrichment.data_classes import SeniorityLevel, Industry
 class TestCompanyEnrichment:
     """Test 1: Company Enrichment."""
     
-    def setup_method(self):
-        self.enricher = LeadEnricher()
+    @classmethod
+    def setup_class(cls):
+        cls.enricher = LeadEnricher()
     
     def test_enrich_company_basic(self):
         """Input: LinkedIn company URL
@@ -36,19 +37,14 @@ class TestCompanyEnrichment:
         assert company.tech_stack == ["Python", "React", "AWS"]
         assert company.company_id == "company:acme-tech"
     
-    def test_enrich_company_industry_detection(self):
+    @pytest.mark.parametrize(("linkedin_url", "industry", "expected"), [
+        ("https://linkedin.com/company/saas-corp", "Software as a Service", Industry.SAAS),
+        ("https://linkedin.com/company/fintech-inc", "Financial Technology", Industry.FINTECH),
+    ])
+    def test_enrich_company_industry_detection(self, linkedin_url, industry, expected):
         """Test industry detection from string."""
-        saas_company = self.enricher.enrich_company(
-            linkedin_url="https://linkedin.com/company/saas-corp",
-            industry="Software as a Service",
-        )
-        assert saas_company.industry == Industry.SAAS
-        
-        fintech_company = self.enricher.enrich_company(
-            linkedin_url="https://linkedin.com/company/fintech-inc",
-            industry="Financial Technology",
-        )
-        assert fintech_company.industry == Industry.FINTECH
+        company = self.enricher.enrich_company(linkedin_url=linkedin_url, industry=industry)
+        assert company.industry == expected
     
     def test_enrich_company_name_extraction(self):
         """Test company name extraction from URL."""
@@ -66,8 +62,9 @@ class TestCompanyEnrichment:
 class TestContactEnrichment:
     """Test 2: Contact Enrichment."""
     
-    def setup_method(self):
-        self.enricher = LeadEnricher()
+    @classmethod
+    def setup_class(cls):
+        cls.enricher = LeadEnricher()
     
     def test_enrich_contact_basic(self):
         """Input: LinkedIn profile URL
@@ -86,25 +83,15 @@ class TestContactEnrichment:
         assert contact.phone == "+1-555-0123"
         assert contact.seniority_level == SeniorityLevel.VP
     
-    def test_enrich_contact_seniority_detection(self):
+    @pytest.mark.parametrize(("linkedin_url", "title", "expected"), [
+        ("https://linkedin.com/in/jane-cto", "Chief Technology Officer", SeniorityLevel.C_LEVEL),
+        ("https://linkedin.com/in/bob-director", "Director of Sales", SeniorityLevel.DIRECTOR),
+        ("https://linkedin.com/in/alice-manager", "Product Manager", SeniorityLevel.MANAGER),
+    ])
+    def test_enrich_contact_seniority_detection(self, linkedin_url, title, expected):
         """Test seniority detection from title."""
-        cto = self.enricher.enrich_contact(
-            linkedin_url="https://linkedin.com/in/jane-cto",
-            title="Chief Technology Officer",
-        )
-        assert cto.seniority_level == SeniorityLevel.C_LEVEL
-        
-        director = self.enricher.enrich_contact(
-            linkedin_url="https://linkedin.com/in/bob-director",
-            title="Director of Sales",
-        )
-        assert director.seniority_level == SeniorityLevel.DIRECTOR
-        
-        manager = self.enricher.enrich_contact(
-            linkedin_url="https://linkedin.com/in/alice-manager",
-            title="Product Manager",
-        )
-        assert manager.seniority_level == SeniorityLevel.MANAGER
+        contact = self.enricher.enrich_contact(linkedin_url=linkedin_url, title=title)
+        assert contact.seniority_level == expected
     
     def test_enrich_contact_user_id_extraction(self):
         """Test user ID extraction from URL."""
@@ -117,8 +104,9 @@ class TestContactEnrichment:
 class TestSocialGraphAnalysis:
     """Test 3: Social Graph Analysis."""
     
-    def setup_method(self):
-        self.enricher = LeadEnricher()
+    @classmethod
+    def setup_class(cls):
+        cls.enricher = LeadEnricher()
     
     def test_analyze_social_graph(self):
         """Input: Prospect LinkedIn ID
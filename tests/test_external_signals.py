@@ -13,13 +13,28 @@ from src.signals import ExternalSignalAggregator, SignalEvent
 from src.signals.signal_event import SignalType, SignalSource
 
 
+def _fields(signal):
+    """Comparable view of a SignalEvent (events compare by identity)."""
+    return (signal.type, signal.user_id, signal.timestamp, signal.source,
+            signal.data, signal.company_id, signal.strength)
+
+
+@pytest.fixture(scope="module")
+def aggregator():
+    # Shared across the module; tests only read what it returns
+    return ExternalSignalAggregator()
+
+
+@pytest.fixture
+def fresh_aggregator():
+    # Fresh instance for tests that check accumulated state
+    return ExternalSignalAggregator()
+
+
 class TestFundingDetection:
     """Test 1: Funding Detection."""
     
-    def setup_method(self):
-        self.aggregator = ExternalSignalAggregator()
-    
-    def test_parse_funding_event(self):
+    def test_parse_funding_event(self, aggregator):
         """Input: Crunchbase/LinkedIn funding announcement
         Expected: SignalEvent with company_id, funding_amount, round_type
         """
@@ -31,7 +46,7 @@ class TestFundingDetection:
             "investor_names": ["Sequoia", "a16z"],
         }
         
-        signal = self.aggregator.parse_funding_event(payload)
+        signal = aggregator.parse_funding_event(payload)
         
         assert isinstance(signal, SignalEvent)
         assert signal.type == SignalType.FUNDING_ROUND
@@ -40,16 +55,15 @@ class TestFundingDetection:
         assert signal.data["round_type"] == "series_a"
         assert signal.source == SignalSource.CRUNCHBASE
     
-    def test_funding_round_strength_increases_with_stage(self):
+    def test_funding_round_strength_increases_with_stage(self, aggregator):
         """Later funding rounds should have higher strength."""
-        seed = self.aggregator.parse_funding_event({
+        seed = aggregator.parse_funding_event({
             "company_id": "company1",
             "funding_amount": 1_000_000,
             "round_type": "seed",
         })
         
-        aggregator2 = ExternalSignalAggregator()
-        series_b = aggregator2.parse_funding_event({
+        series_b = aggregator.parse_funding_event({
             "company_id": "company2",
             "funding_amount": 50_000_000,
             "round_type": "series_b",
@@ -57,22 +71,39 @@ class TestFundingDetection:
         
         assert series_b.strength > seed.strength
     
-    def test_funding_missing_fields_raises_error(self):
-        """Missing required fields should raise ValueError."""
+    def test_batch_parse_funding(self, aggregator, fresh_aggregator):
+        """Bulk parsing matches the per-payload loop."""
+        rounds = ["seed", "series_a", "Series B", "ipo"]
+        payloads = [
+            {
+                "company_id": f"company{i}",
+                "funding_amount": 1_000_000 * (i + 1),
+                "round_type": rounds[i % len(rounds)],
+                "timestamp": "2026-02-01T12:00:00",
+            }
+            for i in range(1000)
+        ]
+        
+        batch = fresh_aggregator.parse_funding_events(payloads)
+        
+        assert [_fields(s) for s in batch] == [_fields(aggregator.parse_funding_event(p)) for p in payloads]
+        assert fresh_aggregator.get_signals_by_company("company7") == [batch[7]]
+    
+    def test_batch_validates_before_storing(self, fresh_aggregator):
+        """A bad payload anywhere in the batch stores nothing."""
+        payloads = [
+            {"company_id": "company1", "funding_amount": 1_000_000, "round_type": "seed"},
+            {"company_id": "company2"},
+        ]
         with pytest.raises(ValueError, match="Missing required fields"):
-            self.aggregator.parse_funding_event({
-                "company_id": "company1",
-                # Missing funding_amount and round_type
-            })
+            fresh_aggregator.parse_funding_events(payloads)
+        assert fresh_aggregator.get_signals_by_company("company1") == []
 
 
 class TestRoleChangeDetection:
     """Test 2: Role Change Detection."""
     
-    def setup_method(self):
-        self.aggregator = ExternalSignalAggregator()
-    
-    def test_parse_role_change(self):
+    def test_parse_role_change(self, aggregator):
         """Input: Job title update notification
         Expected: SignalEvent with new_title, previous_title, start_date
         """
@@ -84,7 +115,7 @@ class TestRoleChangeDetection:
             "company_id": "company:techcorp",
         }
         
-        signal = self.aggregator.parse_role_change(payload)
+        signal = aggregator.parse_role_change(payload)
         
         assert signal.type == SignalType.ROLE_CHANGE
         assert signal.user_id == "urn:li:person:jane123"
@@ -93,37 +124,43 @@ class TestRoleChangeDetection:
         assert signal.data["start_date"] == "2026-01-15T00:00:00"
         assert signal.source == SignalSource.LINKEDIN
     
-    def test_role_seniority_detection(self):
+    @pytest.mark.parametrize(("title", "expected"), [
+        ("Chief Technology Officer", "c_level"),
+        ("VP of Sales", "vp"),
+        ("Director of Marketing", "director"),
+    ])
+    def test_role_seniority_detection(self, aggregator, title, expected):
         """Test seniority level detection from title."""
-        c_level = self.aggregator.parse_role_change({
+        signal = aggregator.parse_role_change({
             "user_id": "user1",
-            "new_title": "Chief Technology Officer",
+            "new_title": title,
         })
-        assert c_level.data["seniority_level"] == "c_level"
+        assert signal.data["seniority_level"] == expected
+    
+    def test_batch_parse_role_changes(self, aggregator, fresh_aggregator):
+        """Bulk parsing matches the per-payload loop."""
+        titles = ["Chief Technology Officer", "VP of Sales", "Director of Marketing", "Software Engineer"]
+        payloads = [
+            {
+                "user_id": f"user{i}",
+                "new_title": titles[i % len(titles)],
+                "start_date": "2026-01-15T00:00:00",
+            }
+            for i in range(1000)
+        ]
         
-        aggregator2 = ExternalSignalAggregator()
-        vp = aggregator2.parse_role_change({
-            "user_id": "user2",
-            "new_title": "VP of Sales",
-        })
-        assert vp.data["seniority_level"] == "vp"
+        batch = fresh_aggregator.parse_role_changes(payloads)
         
-        aggregator3 = ExternalSignalAggregator()
-        director = aggregator3.parse_role_change({
-            "user_id": "user3",
-            "new_title": "Director of Marketing",
-        })
-        assert director.data["seniority_level"] == "director"
+        assert [_fields(s) for s in batch] == [_fields(aggregator.parse_role_change(p)) for p in payloads]
     
-    def test_c_level_higher_strength_than_ic(self):
+    def test_c_level_higher_strength_than_ic(self, aggregator):
         """C-level roles should have higher signal strength."""
-        cto = self.aggregator.parse_role_change({
+        cto = aggregator.parse_role_change({
             "user_id": "user1",
             "new_title": "CTO",
         })
         
-        aggregator2 = ExternalSignalAggregator()
-        engineer = aggregator2.parse_role_change({
+        engineer = aggregator.parse_role_change({
             "user_id": "user2",
             "new_title": "Software Engineer",
         })
@@ -134,10 +171,7 @@ class TestRoleChangeDetection:
 class TestEventSignal:
     """Test 3: Event Signal."""
     
-    def setup_method(self):
-        self.aggregator = ExternalSignalAggregator()
-    
-    def test_parse_event_signal(self):
+    def test_parse_event_signal(self, aggregator):
         """Input: Event registration webhook
         Expected: SignalEvent with event_name, event_type, attendee_id
         """
@@ -149,7 +183,7 @@ class TestEventSignal:
             "company_id": "company:startupxyz",
         }
         
-        signal = self.aggregator.parse_event_signal(payload)
+        signal = aggregator.parse_event_signal(payload)
         
         assert signal.type == SignalType.EVENT_ATTENDANCE
         assert signal.user_id == "urn:li:person:attendee456"
@@ -158,16 +192,15 @@ class TestEventSignal:
         assert signal.data["attendee_id"] == "urn:li:person:attendee456"
         assert signal.source == SignalSource.EVENT_PLATFORM
     
-    def test_conference_higher_strength_than_webinar(self):
+    def test_conference_higher_strength_than_webinar(self, aggregator):
         """Conference attendance should have higher strength than webinar."""
-        conference = self.aggregator.parse_event_signal({
+        conference = aggregator.parse_event_signal({
             "attendee_id": "user1",
             "event_name": "Tech Conference",
             "event_type": "conference",
         })
         
-        aggregator2 = ExternalSignalAggregator()
-        webinar = aggregator2.parse_event_signal({
+        webinar = aggregator.parse_event_signal({
             "attendee_id": "user2",
             "event_name": "Weekly Webinar",
             "event_type": "webinar",
@@ -175,40 +208,81 @@ class TestEventSignal:
         
         assert conference.strength > webinar.strength
     
-    def test_event_missing_fields_raises_error(self):
+    def test_batch_parse_event_signals(self, aggregator, fresh_aggregator):
+        """Bulk parsing matches the per-payload loop."""
+        event_types = ["conference", "Workshop", "webinar", "meetup"]
+        payloads = [
+            {
+                "attendee_id": f"user{i}",
+                "event_name": "SaaS Growth Summit 2026",
+                "event_type": event_types[i % len(event_types)],
+                "timestamp": "2026-02-01T09:00:00",
+            }
+            for i in range(1000)
+        ]
+        
+        batch = fresh_aggregator.parse_event_signals(payloads)
+        
+        assert [_fields(s) for s in batch] == [_fields(aggregator.parse_event_signal(p)) for p in payloads]
+
+
+class TestRequiredFields:
+    """Every parser rejects payloads missing required fields."""
+    
+    @pytest.mark.parametrize(("parser", "payload"), [
+        ("parse_funding_event", {"company_id": "company1"}),  # Missing funding_amount and round_type
+        ("parse_role_change", {"user_id": "user1"}),  # Missing new_title
+        ("parse_event_signal", {"attendee_id": "user1"}),  # Missing event_name and event_type
+    ])
+    def test_missing_fields_raises_error(self, aggregator, parser, payload):
         """Missing required fields should raise ValueError."""
         with pytest.raises(ValueError, match="Missing required fields"):
-            self.aggregator.parse_event_signal({
-                "attendee_id": "user1",
-                # Missing event_name and event_type
-            })
+            getattr(aggregator, parser)(payload)
 
 
 class TestSignalsByCompany:
     """Test retrieving signals by company."""
     
-    def test_get_signals_by_company(self):
+    def test_get_signals_by_company(self, fresh_aggregator):
         """Get all signals for a specific company."""
-        aggregator = ExternalSignalAggregator()
-        
         # Add signals for different companies
-        aggregator.parse_funding_event({
+        fresh_aggregator.parse_funding_event({
             "company_id": "company:acme",
             "funding_amount": 5_000_000,
             "round_type": "seed",
         })
-        aggregator.parse_role_change({
+        fresh_aggregator.parse_role_change({
             "user_id": "user1",
             "new_title": "CTO",
             "company_id": "company:acme",
         })
-        aggregator.parse_funding_event({
+        fresh_aggregator.parse_funding_event({
             "company_id": "company:other",
             "funding_amount": 10_000_000,
             "round_type": "series_a",
         })
         
-        acme_signals = aggregator.get_signals_by_company("company:acme")
+        acme_signals = fresh_aggregator.get_signals_by_company("company:acme")
         
         assert len(acme_signals) == 2
         assert all(s.company_id == "company:acme" for s in acme_signals)
+    
+    def test_clear_signals_updates_company_index(self, fresh_aggregator):
+        """Clearing a user also drops their signals from company lookups."""
+        fresh_aggregator.parse_role_change({
+            "user_id": "user1",
+            "new_title": "CTO",
+            "company_id": "company:acme",
+        })
+        fresh_aggregator.parse_role_change({
+            "user_id": "user2",
+            "new_title": "VP of Sales",
+            "company_id": "company:acme",
+        })
+        
+        fresh_aggregator.clear_signals("user1")
+        acme_signals = fresh_aggregator.get_signals_by_company("company:acme")
+        assert [s.user_id for s in acme_signals] == ["user2"]
+        
+        fresh_aggregator.clear_signals()
+        assert fresh_aggregator.get_signals_by_company("company:acme") == []
@@ -15,74 +15,118 @@ from src.enrichment import (
     EnrichedCompany,
     EnrichedContact,
     EnrichedLead,
+    LeadEnricher,
 )
 from src.enrichment.data_classes import SeniorityLevel, Industry
+from src.signals import ExternalSignalAggregator
+
+
+# Read-only leads shared by the overall-score tests (the matcher never mutates them)
+IDEAL_LEAD = EnrichedLead(
+    user_id="urn:li:person:ideal",
+    company=EnrichedCompany(
+        company_id="company:ideal",
+        name="Ideal Company",
+        size=200,
+        industry=Industry.SAAS,
+        funding_stage="series_b",
+    ),
+    contact=EnrichedContact(
+        user_id="urn:li:person:vp",
+        name="VP of Sales",
+        title="VP of Sales",
+        seniority_level=SeniorityLevel.VP,
+    ),
+)
+
+POOR_LEAD = EnrichedLead(
+    user_id="urn:li:person:poor",
+    company=EnrichedCompany(
+        company_id="company:poor",
+        name="Poor Fit",
+        size=10,  # Too small
+        industry=Industry.ECOMMERCE,  # Wrong industry
+    ),
+    contact=EnrichedContact(
+        user_id="urn:li:person:ic",
+        name="Engineer",
+        title="Junior Developer",
+        seniority_level=SeniorityLevel.INDIVIDUAL_CONTRIBUTOR,
+    ),
+)
+
+TEST_COMPANY = EnrichedCompany(
+    company_id="company:test",
+    name="Test Co",
+    size=100,
+    industry=Industry.SAAS,
+)
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    # Shared across the module; tests only read what it returns
+    return ICPMatcher()
 
 
 class TestCompanySizeMatch:
     """Test 1: Company Size Match."""
     
-    def setup_method(self):
-        self.matcher = ICPMatcher()
-    
-    def test_size_perfect_match(self):
+    def test_size_perfect_match(self, matcher):
         """Input: Company with 150 employees, ICP range [50, 500]
         Expected: size_score = 1.0 (perfect match)
         """
-        score = self.matcher.score_company_size(size=150, size_range=(50, 500))
+        score = matcher.score_company_size(size=150, size_range=(50, 500))
         assert score == 1.0
     
-    def test_size_at_boundaries(self):
+    def test_size_at_boundaries(self, matcher):
         """Test size at exact boundaries."""
         # At minimum
-        assert self.matcher.score_company_size(50, (50, 500)) == 1.0
+        assert matcher.score_company_size(50, (50, 500)) == 1.0
         # At maximum
-        assert self.matcher.score_company_size(500, (50, 500)) == 1.0
+        assert matcher.score_company_size(500, (50, 500)) == 1.0
     
-    def test_size_below_range(self):
+    def test_size_below_range(self, matcher):
         """Size below range gets partial score."""
-        score = self.matcher.score_company_size(25, (50, 500))
+        score = matcher.score_company_size(25, (50, 500))
         assert 0 < score < 1.0
         assert score == 0.5  # 25/50 = 0.5
     
-    def test_size_above_range(self):
+    def test_size_above_range(self, matcher):
         """Size above range gets partial score."""
-        score = self.matcher.score_company_size(1000, (50, 500))
+        score = matcher.score_company_size(1000, (50, 500))
         assert 0 < score < 1.0
         assert score == 0.5  # 500/1000 = 0.5
     
-    def test_size_zero(self):
+    def test_size_zero(self, matcher):
         """Zero size returns 0."""
-        assert self.matcher.score_company_size(0) == 0.0
+        assert matcher.score_company_size(0) == 0.0
 
 
 class TestIndustryAlignment:
     """Test 2: Industry Alignment."""
     
-    def setup_method(self):
-        self.matcher = ICPMatcher()
-    
-    def test_industry_match(self):
+    def test_industry_match(self, matcher):
         """Input: SaaS company, ICP industries = ["SaaS", "FinTech"]
         Expected: industry_score = 1.0
         """
-        score = self.matcher.score_industry(
+        score = matcher.score_industry(
             industry=Industry.SAAS,
             target_industries=["saas", "fintech"]
         )
         assert score == 1.0
     
-    def test_industry_no_match(self):
+    def test_industry_no_match(self, matcher):
         """Non-matching industry returns 0."""
-        score = self.matcher.score_industry(
+        score = matcher.score_industry(
             industry=Industry.ECOMMERCE,
             target_industries=["saas", "fintech"]
         )
         assert score == 0.0
     
-    def test_industry_case_insensitive(self):
+    def test_industry_case_insensitive(self, matcher):
         """Industry matching is case insensitive."""
-        score = self.matcher.score_industry(
+        score = matcher.score_industry(
             industry=Industry.FINTECH,
             target_industries=["FINTECH", "SAAS"]
         )
@@ -92,46 +136,37 @@ class TestIndustryAlignment:
 class TestAuthorityDetection:
     """Test 3: Authority Detection."""
     
-    def setup_method(self):
-        self.matcher = ICPMatcher()
-    
-    def test_authority_vp(self):
+    @pytest.mark.parametrize(("title", "level", "score"), [
+        ("VP of Engineering", "decision_maker", 0.9),
+        ("Chief Technology Officer", "decision_maker", 1.0),
+        ("Director of Sales", "decision_maker", 0.8),
+        ("Software Engineer", "influencer", 0.3),
+    ])
+    def test_authority_from_title(self, matcher, title, level, score):
         """Input: Title = "VP of Engineering"
         Expected: authority_level = "decision_maker", authority_score = 0.9
+        (ICs are influencers with a low score)
         """
-        authority_level, authority_score = self.matcher.score_authority(
-            title="VP of Engineering"
-        )
-        assert authority_level == "decision_maker"
-        assert authority_score == 0.9
-    
-    def test_authority_c_level(self):
-        """C-level should have highest score."""
-        authority_level, authority_score = self.matcher.score_authority(
-            title="Chief Technology Officer"
-        )
-        assert authority_level == "decision_maker"
-        assert authority_score == 1.0
-    
-    def test_authority_director(self):
-        """Director should be decision maker."""
-        authority_level, authority_score = self.matcher.score_authority(
-            title="Director of Sales"
-        )
-        assert authority_level == "decision_maker"
-        assert authority_score == 0.8
-    
-    def test_authority_individual_contributor(self):
-        """IC should be influencer with low score."""
-        authority_level, authority_score = self.matcher.score_authority(
-            title="Software Engineer"
-        )
-        assert authority_level == "influencer"
-        assert authority_score == 0.3
-    
-    def test_authority_from_seniority_level(self):
+        authority_level, authority_score = matcher.score_authority(title=title)
+        assert authority_level == level
+        assert authority_score == score
+    
+    @pytest.mark.parametrize(("title", "expected"), [
+        ("Director of Technology", SeniorityLevel.DIRECTOR),  # "director" wins over the "cto" inside it
+        ("Co-Founder & CEO", SeniorityLevel.C_LEVEL),
+        ("Vice President, Sales", SeniorityLevel.VP),
+        ("Team Lead", SeniorityLevel.MANAGER),
+        ("Software Engineer", SeniorityLevel.INDIVIDUAL_CONTRIBUTOR),
+    ])
+    def test_seniority_matches_enricher(self, matcher, title, expected):
+        """ICP matcher, enricher and signal aggregator share one title -> seniority mapping."""
+        assert matcher._detect_seniority(title) == expected
+        assert LeadEnricher()._detect_seniority(title) == expected
+        assert ExternalSignalAggregator()._detect_seniority(title) == expected.value
+    
+    def test_authority_from_seniority_level(self, matcher):
         """Can use pre-detected seniority level."""
-        authority_level, authority_score = self.matcher.score_authority(
+        authority_level, authority_score = matcher.score_authority(
             seniority_level=SeniorityLevel.VP
         )
         assert authority_level == "decision_maker"
@@ -150,28 +185,7 @@ class TestOverallICPScore:
             target_industries=["saas"],
         ))
         
-        company = EnrichedCompany(
-            company_id="company:ideal",
-            name="Ideal Company",
-            size=200,
-            industry=Industry.SAAS,
-            funding_stage="series_b",
-        )
-        
-        contact = EnrichedContact(
-            user_id="urn:li:person:vp",
-            name="VP of Sales",
-            title="VP of Sales",
-            seniority_level=SeniorityLevel.VP,
-        )
-        
-        lead = EnrichedLead(
-            user_id="urn:li:person:ideal",
-            company=company,
-            contact=contact,
-        )
-        
-        result = matcher.calculate_icp_score(lead=lead)
+        result = matcher.calculate_icp_score(lead=IDEAL_LEAD)
         
         assert "icp_score" in result
         assert 0 <= result["icp_score"] <= 100
@@ -186,43 +200,14 @@ class TestOverallICPScore:
             target_industries=["saas"],
         ))
         
-        company = EnrichedCompany(
-            company_id="company:poor",
-            name="Poor Fit",
-            size=10,  # Too small
-            industry=Industry.ECOMMERCE,  # Wrong industry
-        )
-        
-        contact = EnrichedContact(
-            user_id="urn:li:person:ic",
-            name="Engineer",
-            title="Junior Developer",
-            seniority_level=SeniorityLevel.INDIVIDUAL_CONTRIBUTOR,
-        )
-        
-        lead = EnrichedLead(
-            user_id="urn:li:person:poor",
-            company=company,
-            contact=contact,
-        )
-        
-        result = matcher.calculate_icp_score(lead=lead)
+        result = matcher.calculate_icp_score(lead=POOR_LEAD)
         
         assert result["icp_score"] < 50  # Low score
         assert result["authority_level"] == "influencer"
     
-    def test_icp_score_breakdown(self):
+    def test_icp_score_breakdown(self, matcher):
         """Verify breakdown includes all dimensions."""
-        matcher = ICPMatcher()
-        
-        company = EnrichedCompany(
-            company_id="company:test",
-            name="Test Co",
-            size=100,
-            industry=Industry.SAAS,
-        )
-        
-        result = matcher.calculate_icp_score(company=company)
+        result = matcher.calculate_icp_score(company=TEST_COMPANY)
         
         breakdown = result["breakdown"]
         assert "size" in breakdown
@@ -235,22 +220,26 @@ class TestOverallICPScore:
 class TestICPConfig:
     """Test ICP configuration."""
     
-    def test_custom_config(self):
+    @pytest.mark.parametrize(("size_range", "target_industries", "size", "industry", "expected_size", "expected_industry"), [
+        ((100, 1000), ["fintech", "security"], 500, Industry.FINTECH, 1.0, 1.0),
+        ((1, 10), ["saas"], 100, Industry.SAAS, 0.1, 1.0),  # 10x above max
+        ((50, 500), ["SaaS"], 25, Industry.SAAS, 0.5, 1.0),  # Case-insensitive target
+        ((50, 500), ["saas", "fintech"], 50, Industry.ECOMMERCE, 1.0, 0.0),
+    ])
+    def test_custom_config(self, size_range, target_industries, size, industry,
+                           expected_size, expected_industry):
         """Test matcher with custom config."""
         config = ICPConfig(
-            size_range=(100, 1000),
-            target_industries=["fintech", "security"],
+            size_range=size_range,
+            target_industries=target_industries,
             target_tech_stack=["Python", "Kubernetes"],
             decision_maker_levels=["c_level", "vp"],
         )
         
         matcher = ICPMatcher(config=config)
         
-        # Size 500 is in range
-        assert matcher.score_company_size(500) == 1.0
-        
-        # Fintech matches
-        assert matcher.score_industry(Industry.FINTECH) == 1.0
+        assert matcher.score_company_size(size) == pytest.approx(expected_size)
+        assert matcher.score_industry(industry) == expected_industry
     
     def test_config_validation(self):
         """Test config weight validation."""
@@ -9,6 +9,7 @@ TDD Specs from Agents.md:
 """
 
 import pytest
+from dataclasses import replace
 from src.engagement import (
     HighIntentFilter,
     EngagementConfig,
@@ -19,29 +20,42 @@ from src.scoring import IntentScore, IntentLabel
 from src.enrichment import EnrichedLead, EnrichedCompany
 
 
+# Prototypes; tests vary them with dataclasses.replace
+HIGH_INTENT = IntentScore(score=85.0, label=IntentLabel.HIGH, signals_score=85)
+STRONG_INTENT = replace(HIGH_INTENT, score=90.0, signals_score=90)
+
+ACME = EnrichedCompany(company_id="c1", name="Acme Corp", website="acme.com")
+
+# Read-only leads (the filter never mutates them)
+BASE_LEAD = EnrichedLead(user_id="u1", company=ACME)
+COMPETITOR_LEAD = EnrichedLead(
+    user_id="u2",
+    company=replace(ACME, company_id="c2", name="CompetitorX Inc", website="competitorx.com")
+)
+EXCLUDED_LEAD = EnrichedLead(
+    user_id="u3",
+    company=replace(ACME, company_id="c3", name="Bad Domain", website="sub.exclude-me.com")
+)
+
+
 class TestHighIntentFilter:
     """Tests for High Intent Filter."""
     
-    def setup_method(self):
-        self.config = EngagementConfig(
+    @classmethod
+    def setup_class(cls):
+        cls.config = EngagementConfig(
             min_intent_score=70.0,
             min_icp_score=80.0,
             competitors=["CompetitorX"],
             excluded_domains=["exclude-me.com"]
         )
-        self.filter = HighIntentFilter(config=self.config)
-        
-        # Base fixtures
-        self.lead = EnrichedLead(
-            user_id="u1",
-            company=EnrichedCompany(company_id="c1", name="Acme Corp", website="acme.com")
-        )
+        cls.filter = HighIntentFilter(config=cls.config)
     
     def test_intent_threshold_failure(self):
         """Test 1: Intent Threshold failure."""
         decision = self.filter.evaluate_lead(
-            lead=self.lead,
-            intent_score=IntentScore(score=65.0, label=IntentLabel.MEDIUM, signals_score=65),
+            lead=BASE_LEAD,
+            intent_score=replace(HIGH_INTENT, score=65.0, label=IntentLabel.MEDIUM, signals_score=65),
             icp_score_val=90.0  # ICP passes
         )
         
@@ -51,8 +65,8 @@ class TestHighIntentFilter:
     def test_icp_threshold_failure(self):
         """Test 2: ICP Threshold failure."""
         decision = self.filter.evaluate_lead(
-            lead=self.lead,
-            intent_score=IntentScore(score=85.0, label=IntentLabel.HIGH, signals_score=85),
+            lead=BASE_LEAD,
+            intent_score=HIGH_INTENT,
             icp_score_val=75.0  # ICP fails (needs 80)
         )
         
@@ -61,14 +75,9 @@ class TestHighIntentFilter:
     
     def test_exclusion_rule_competitor(self):
         """Test 3: Exclusion Rules (Competitor)."""
-        competitor_lead = EnrichedLead(
-            user_id="u2",
-            company=EnrichedCompany(company_id="c2", name="CompetitorX Inc", website="competitorx.com")
-        )
-        
         decision = self.filter.evaluate_lead(
-            lead=competitor_lead,
-            intent_score=IntentScore(score=90.0, label=IntentLabel.HIGH, signals_score=90),
+            lead=COMPETITOR_LEAD,
+            intent_score=STRONG_INTENT,
             icp_score_val=90.0
         )
         
@@ -77,25 +86,58 @@ class TestHighIntentFilter:
     
     def test_exclusion_rule_domain(self):
         """Test Exclusion Rules (Domain)."""
-        excluded_lead = EnrichedLead(
-            user_id="u3",
-            company=EnrichedCompany(company_id="c3", name="Bad Domain", website="sub.exclude-me.com")
-        )
-        
         decision = self.filter.evaluate_lead(
-            lead=excluded_lead,
-            intent_score=IntentScore(score=90.0, label=IntentLabel.HIGH, signals_score=90),
+            lead=EXCLUDED_LEAD,
+            intent_score=STRONG_INTENT,
             icp_score_val=90.0
         )
         
         assert decision.should_engage is False
         assert "Excluded domain" in decision.reason
     
+    def test_exclusion_large_domain_list(self):
+        """Domain exclusion stays a substring match with thousands of entries."""
+        config = EngagementConfig(
+            min_intent_score=0.0,
+            min_icp_score=0.0,
+            excluded_domains=[f"bad{i}.com" for i in range(10_000)] + ["Exclude-Me.com"],
+        )
+        large_filter = HighIntentFilter(config=config)
+        
+        for website, excluded in [
+            ("sub.exclude-me.com", True),
+            ("www.bad9999.com", True),
+            ("notbad42.com.example.net", True),  # Substring, not suffix, match
+            ("acme.com", False),
+        ]:
+            lead = EnrichedLead(user_id="u4", company=replace(ACME, website=website))
+            decision = large_filter.evaluate_lead(lead=lead, intent_score=HIGH_INTENT, icp_score_val=90.0)
+            assert decision.should_engage is not excluded
+    
+    def test_exclusions_follow_config_edits(self):
+        """Edits to the config's exclusion lists after construction take effect."""
+        config = EngagementConfig(min_intent_score=0.0, min_icp_score=0.0)
+        edit_filter = HighIntentFilter(config=config)
+        
+        def engaged(lead):
+            return edit_filter.evaluate_lead(lead=lead, intent_score=HIGH_INTENT, icp_score_val=90.0).should_engage
+        
+        assert engaged(COMPETITOR_LEAD) and engaged(EXCLUDED_LEAD)
+        
+        config.competitors.append("CompetitorX")
+        config.excluded_domains.append("exclude-me.com")
+        assert not engaged(COMPETITOR_LEAD)
+        assert not engaged(EXCLUDED_LEAD)
+        
+        config.competitors = []
+        config.excluded_domains.clear()
+        assert engaged(COMPETITOR_LEAD) and engaged(EXCLUDED_LEAD)
+    
     def test_qualified_lead(self):
         """Test 4: Qualified Lead (Passes all checks)."""
         decision = self.filter.evaluate_lead(
-            lead=self.lead,
-            intent_score=IntentScore(score=85.0, label=IntentLabel.HIGH, signals_score=85),
+            lead=BASE_LEAD,
+            intent_score=HIGH_INTENT,
             icp_score_val=90.0
         )
         
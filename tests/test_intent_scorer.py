@@ -8,80 +8,140 @@ TDD Specs from Agents.md:
 - Test 4: Composite Intent Score
 """
 
+import json
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
 
-from src.scoring import IntentScorer, IntentScore, ScoringConfig
+from src.scoring import IntentScorer, IntentScore, ScoringConfig, build_company_index, scores_to_json
 from src.scoring.data_classes import IntentLabel
+from src.scoring.intent_scorer import _weight_kernel, _decay_kernel, _DECAY_TABLE
 from src.signals import SignalEvent, SignalType, SignalSource
+from src.signals.signal_event import SIGNAL_TYPE_IDS
 from src.enrichment import EnrichedLead, EnrichedCompany
 
+# One clock read per module, shared by every SignalEvent below
+NOW = datetime.now()
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    # Shared across the module; tests only read what it returns
+    return IntentScorer()
+
+
+@pytest.fixture
+def fresh_scorer():
+    # Fresh instance for tests that change the scoring config
+    return IntentScorer()
+
+
+@pytest.fixture(scope="module")
+def committee_signals():
+    """Lead's own visit followed by two colleagues' signals, all at company:acme."""
+    return [
+        SignalEvent(signal_type, user_id, NOW, SignalSource.LINKEDIN, company_id="company:acme")
+        for signal_type, user_id in [
+            (SignalType.PROFILE_VISIT, "urn:li:person:decision_maker"),
+            (SignalType.PROFILE_VISIT, "urn:li:person:colleague1"),
+            (SignalType.CONTENT_ENGAGEMENT, "urn:li:person:colleague2"),
+        ]
+    ]
+
 
 class TestRecencyDecay:
     """Test 1: Recency Decay."""
     
-    def setup_method(self):
-        self.scorer = IntentScorer()
-    
-    def test_recency_decay_calculation(self):
+    def test_recency_decay_calculation(self, scorer):
         """Input: Signal from 1 hour ago, Signal from 72 hours ago
         Expected: weight(1hr) > weight(72hr)
         """
-        now = datetime.now()
-        recent_ts = now - timedelta(hours=1)
-        old_ts = now - timedelta(hours=72)
+        recent_ts = NOW - timedelta(hours=1)
+        old_ts = NOW - timedelta(hours=72)
         
-        recent_decay = self.scorer._calculate_decay(recent_ts)
-        old_decay = self.scorer._calculate_decay(old_ts)
+        # Decay against the same reference instant the timestamps came from
+        recent_decay = scorer._calculate_decay(recent_ts, now_ts=NOW.timestamp())
+        old_decay = scorer._calculate_decay(old_ts, now_ts=NOW.timestamp())
         
         # Decay at 1 hour should be near 1.0
         assert recent_decay > 0.95
         
         # Decay at 72 hours (half-life) should be 0.5
-        assert abs(old_decay - 0.5) < 0.01
+        assert abs(old_decay - 0.5) < 1e-9
         
         # Recent should be stronger than old
         assert recent_decay > old_decay
     
-    def test_recency_impacts_score(self):
-        """Same signal should have lower score if older."""
-        now = datetime.now()
+    def test_batch_decay_matches_scalar(self, scorer):
+        """Vectorized decay agrees with the per-signal path, inside and past the decay table."""
+        now_ts = NOW.timestamp()
+        # 10 000 ages at 7-minute steps (~48 days), plus one future timestamp
+        ts_epoch = now_ts - np.arange(-1, 10_000) * 420.0
         
+        decay = scorer._decay_batch(ts_epoch, now_ts)
+        
+        # float32 factors: well inside the tolerance any ranking needs
+        assert decay.dtype == np.float32
+        expected = [scorer._decay_at(ts, now_ts) for ts in ts_epoch.tolist()]
+        np.testing.assert_allclose(decay, expected, rtol=1e-6)
+    
+    def test_recency_impacts_score(self, scorer):
+        """Same signal should have lower score if older."""
         recent_signal = SignalEvent(
             type=SignalType.PROFILE_VISIT,
             user_id="u1",
-            timestamp=now - timedelta(hours=1),
+            timestamp=NOW - timedelta(hours=1),
             source=SignalSource.LINKEDIN,
         )
         
         old_signal = SignalEvent(
             type=SignalType.PROFILE_VISIT,
             user_id="u1",
-            timestamp=now - timedelta(hours=72),
+            timestamp=NOW - timedelta(hours=72),
             source=SignalSource.LINKEDIN,
         )
         
-        recent_score = self.scorer.calculate_intent_score([recent_signal])
-        old_score = self.scorer.calculate_intent_score([old_signal])
+        recent_score = scorer.calculate_intent_score([recent_signal])
+        old_score = scorer.calculate_intent_score([old_signal])
         
         assert recent_score.score > old_score.score
 
+    
+    def test_half_life_change_rebuilds_decay(self, fresh_scorer):
+        """Changing decay_half_life_hours after construction takes effect."""
+        ts = NOW - timedelta(hours=24)
+        now_ts = NOW.timestamp()
+        assert fresh_scorer._calculate_decay(ts, now_ts=now_ts) == pytest.approx(0.5 ** (24 / 72), rel=2e-5)
+        
+        fresh_scorer.config.decay_half_life_hours = 24.0
+        assert fresh_scorer._calculate_decay(ts, now_ts=now_ts) == pytest.approx(0.5)
+        decay = fresh_scorer._decay_batch(np.array([ts.timestamp()]), now_ts)
+        assert decay[0] == pytest.approx(0.5, rel=1e-6)
+    
+    def test_short_half_life_decay_is_accurate(self, fresh_scorer):
+        """The decay table scales with the half-life, so short ones stay accurate."""
+        fresh_scorer.config.decay_half_life_hours = 2.0
+        now_ts = NOW.timestamp()
+        # 0 to ~40h (20 half-lives, past the table) in 37-second steps
+        ages = np.arange(4000) * 37.0
+        expected = 0.5 ** (ages / 3600 / 2.0)
+        
+        fresh_scorer._refresh_decay_rate()
+        scalar = [fresh_scorer._decay_at(now_ts - age, now_ts) for age in ages.tolist()]
+        np.testing.assert_allclose(scalar, expected, rtol=2e-5)
+        np.testing.assert_allclose(fresh_scorer._decay_batch(now_ts - ages, now_ts), expected, rtol=2e-5)
+
 
 class TestSignalStrengthMultipliers:
     """Test 2: Signal Strength Multipliers."""
     
-    def setup_method(self):
-        self.scorer = IntentScorer()
-    
-    def test_signal_weights(self):
+    def test_signal_weights(self, scorer):
         """Different signal types have different weights."""
-        now = datetime.now()
-        
         # Profile visit (Base weight 8.0)
         visit = SignalEvent(
             type=SignalType.PROFILE_VISIT,
             user_id="u1",
-            timestamp=now,
+            timestamp=NOW,
             source=SignalSource.LINKEDIN,
         )
         
@@ -89,23 +149,21 @@ class TestSignalStrengthMultipliers:
         funding = SignalEvent(
             type=SignalType.FUNDING_ROUND,
             user_id="c1",
-            timestamp=now,
+            timestamp=NOW,
             source=SignalSource.CRUNCHBASE,
         )
         
-        visit_score = self.scorer.calculate_intent_score([visit])
-        funding_score = self.scorer.calculate_intent_score([funding])
+        visit_score = scorer.calculate_intent_score([visit])
+        funding_score = scorer.calculate_intent_score([funding])
         
         assert funding_score.score > visit_score.score
     
-    def test_action_modifiers(self):
+    def test_action_modifiers(self, scorer):
         """Action type (like vs share) modifies score."""
-        now = datetime.now()
-        
         like = SignalEvent(
             type=SignalType.CONTENT_ENGAGEMENT,
             user_id="u1",
-            timestamp=now,
+            timestamp=NOW,
             source=SignalSource.LINKEDIN,
             data={"event_type": "like"},  # Modifier 1.0
         )
@@ -113,111 +171,193 @@ class TestSignalStrengthMultipliers:
         share = SignalEvent(
             type=SignalType.CONTENT_ENGAGEMENT,
             user_id="u1",
-            timestamp=now,
+            timestamp=NOW,
             source=SignalSource.LINKEDIN,
             data={"event_type": "share"},  # Modifier 3.0
         )
         
-        like_score = self.scorer.calculate_intent_score([like])
-        share_score = self.scorer.calculate_intent_score([share])
+        like_score = scorer.calculate_intent_score([like])
+        share_score = scorer.calculate_intent_score([share])
         
         # Share should be 3x stronger than like (base weights equal)
         # Allow small margin for floating point
         ratio = share_score.score / like_score.score
         assert 2.9 < ratio < 3.1
 
+    def test_action_id_resolved_on_creation(self, scorer):
+        """Action keyword is classified once when the SignalEvent is built."""
+        reshare = SignalEvent(
+            type=SignalType.CONTENT_ENGAGEMENT,
+            user_id="u1",
+            timestamp=NOW,
+            source=SignalSource.LINKEDIN,
+            data={"event_type": "RESHARE"},
+        )
+        unknown = SignalEvent(
+            type=SignalType.CONTENT_ENGAGEMENT,
+            user_id="u1",
+            timestamp=NOW,
+            source=SignalSource.LINKEDIN,
+            data={"event_type": "react"},
+        )
+
+        modifiers = scorer._action_modifier_table()
+        assert modifiers[reshare.action_id] == 3.0
+        assert unknown.action_id == -1
+        assert modifiers[unknown.action_id] == 1.0
+    
+    def test_signal_weight_table_gather(self, scorer):
+        """Base weights come from one array gather over cached type ids."""
+        table = scorer._signal_weight_table()
+        assert isinstance(table, np.ndarray)
+        
+        signals = [SignalEvent(t, "u1", NOW, SignalSource.LINKEDIN) for t in SignalType]
+        gathered = table[[s.type_id for s in signals]]
+        
+        expected = [scorer.config.signal_weights.get(t.value, 5.0) for t in SignalType]
+        assert gathered.tolist() == expected
+        assert table[SIGNAL_TYPE_IDS[SignalType.FUNDING_ROUND]] > table[SIGNAL_TYPE_IDS[SignalType.PROFILE_VISIT]]
+
+    
+    def test_weight_table_follows_config_edits(self, fresh_scorer):
+        """Cached base weights pick up in-place and replaced config dicts."""
+        visit = SignalEvent(SignalType.PROFILE_VISIT, "u1", NOW, SignalSource.LINKEDIN)
+        before = fresh_scorer.calculate_intent_score([visit]).signals_score
+        
+        fresh_scorer.config.signal_weights["profile_visit"] = 30.0
+        edited = fresh_scorer.calculate_intent_score([visit]).signals_score
+        assert edited == pytest.approx(before * 2, rel=0.01)
+        
+        fresh_scorer.config.signal_weights = {}
+        replaced = fresh_scorer.calculate_intent_scores_batch([[visit]])[0].signals_score
+        assert replaced == pytest.approx(before / 3, rel=0.05)
+
+    
+    def test_unknown_action_modifier_rejected(self, fresh_scorer):
+        """Modifier keys outside ACTION_KEYWORDS raise instead of being dropped."""
+        with pytest.raises(ValueError, match="repost"):
+            ScoringConfig(action_modifiers={"like": 1.0, "repost": 2.0})
+        
+        share = SignalEvent(SignalType.CONTENT_ENGAGEMENT, "u1", NOW, SignalSource.LINKEDIN,
+                            data={"event_type": "share"})
+        fresh_scorer.calculate_intent_score([share])
+        fresh_scorer.config.action_modifiers["repost"] = 2.0
+        with pytest.raises(ValueError, match="repost"):
+            fresh_scorer.calculate_intent_score([share])
+
 
 class TestBuyingCommitteeDetection:
     """Test 3: Buying Committee Detection."""
     
     def setup_method(self):
-        self.scorer = IntentScorer()
         self.lead = EnrichedLead(
             user_id="urn:li:person:decision_maker",
             company=EnrichedCompany(company_id="company:acme", name="Acme"),
         )
     
-    def test_committee_boost(self):
+    def test_committee_boost(self, scorer, committee_signals):
         """Input: Multiple engaged contacts from same company
         Expected: committee_boost = 1.5x
         """
-        now = datetime.now()
-        
-        # Lead's own signal
-        own_signal = SignalEvent(
-            type=SignalType.PROFILE_VISIT,
-            user_id="urn:li:person:decision_maker",
-            timestamp=now,
-            source=SignalSource.LINKEDIN,
-            company_id="company:acme",
-        )
+        own_signal = committee_signals[0]
         
-        # Other colleagues' signals
-        colleague_signals = [
-            SignalEvent(
-                type=SignalType.PROFILE_VISIT,
-                user_id="urn:li:person:colleague1",
-                timestamp=now,
-                source=SignalSource.LINKEDIN,
-                company_id="company:acme",
-            ),
-            SignalEvent(
-                type=SignalType.CONTENT_ENGAGEMENT,
-                user_id="urn:li:person:colleague2",
-                timestamp=now,
-                source=SignalSource.LINKEDIN,
-                company_id="company:acme",
-            )
-        ]
-        
-        all_signals = [own_signal] + colleague_signals
-        
-        score = self.scorer.calculate_intent_score(
+        score = scorer.calculate_intent_score(
             signals=[own_signal],
             lead=self.lead,
-            company_signals=all_signals
+            company_signals=committee_signals
         )
         
         # Check committee factor applied
         assert score.committee_factor == 1.5  # 2 other colleagues = 1.5x
+        
+        # Columnar (user_ids, timestamps) index gives the same factor
+        index = build_company_index(committee_signals)
+        assert scorer.detect_buying_committee_indexed(own_signal.user_id, index["company:acme"]) == 1.5
     
-    def test_no_committee_boost(self):
+    def test_no_committee_boost(self, scorer, committee_signals):
         """No boost if only one person active."""
-        now = datetime.now()
+        own_signal = committee_signals[0]
         
-        own_signal = SignalEvent(
-            type=SignalType.PROFILE_VISIT,
-            user_id="urn:li:person:decision_maker",
-            timestamp=now,
-            source=SignalSource.LINKEDIN,
-            company_id="company:acme",
-        )
-        
-        score = self.scorer.calculate_intent_score(
+        score = scorer.calculate_intent_score(
             signals=[own_signal],
             lead=self.lead,
             company_signals=[own_signal]  # Only their own signal
         )
-        
+
         assert score.committee_factor == 1.0
 
+    def test_indexed_matches_scan(self, scorer):
+        """Indexed committee detection agrees with the per-lead scan."""
+        def visit(user_id, age_days):
+            return SignalEvent(
+                type=SignalType.PROFILE_VISIT,
+                user_id=user_id,
+                timestamp=NOW - timedelta(days=age_days),
+                source=SignalSource.LINKEDIN,
+                company_id="company:acme",
+            )
+
+        company_signals = [
+            visit("urn:li:person:decision_maker", 0),
+            visit("urn:li:person:colleague1", 2),
+            visit("urn:li:person:colleague2", 45),  # Outside 30-day window
+        ]
+        index = build_company_index(company_signals)
+
+        for user_id in ["urn:li:person:decision_maker", "urn:li:person:colleague1", "urn:li:person:other"]:
+            expected = scorer.detect_buying_committee(user_id, company_signals)
+            indexed = scorer.detect_buying_committee_indexed(user_id, index["company:acme"])
+            assert indexed == expected
+
+    
+    def test_index_ignores_signals_without_user(self, scorer, committee_signals):
+        """Company-level signals with no user_id don't count as committee members."""
+        anonymous = [
+            SignalEvent(SignalType.FUNDING_ROUND, "placeholder", NOW, SignalSource.CRUNCHBASE, company_id="company:acme")
+            for _ in range(2)
+        ]
+        # Construction rejects empty ids, but the field is writable afterwards
+        anonymous[0].user_id = ""
+        anonymous[1].user_id = None
+        company_signals = committee_signals[:2] + anonymous
+        index = build_company_index(company_signals)
+        
+        user_id = committee_signals[0].user_id
+        assert scorer.detect_buying_committee(user_id, company_signals) == 1.2
+        assert scorer.detect_buying_committee_indexed(user_id, index["company:acme"]) == 1.2
+    
+    def test_batch_committee_matches_single(self, scorer, committee_signals):
+        """The batch scorer applies the indexed committee check like the per-lead path."""
+        other = EnrichedLead(user_id="urn:li:person:elsewhere",
+                             company=EnrichedCompany(company_id="company:other", name="Other"))
+        leads = [self.lead, other, None]
+        signal_lists = [[committee_signals[0]], [committee_signals[1]], []]
+        
+        batch = scorer.calculate_intent_scores_batch(
+            signal_lists, leads=leads, company_index=build_company_index(committee_signals)
+        )
+        
+        for signals, lead, result in zip(signal_lists, leads, batch):
+            # Only self.lead's company (acme) has company signals
+            company_signals = committee_signals if lead is self.lead else None
+            single = scorer.calculate_intent_score(signals, lead, company_signals=company_signals)
+            assert result.committee_factor == single.committee_factor
+            assert result.breakdown["committee"] == single.breakdown["committee"]
+            assert result.score == single.score
+        assert batch[0].committee_factor == 1.5
+
 
 class TestCompositeIntentScore:
     """Test 4: Composite Intent Score."""
     
-    def setup_method(self):
-        self.scorer = IntentScorer()
-    
-    def test_composite_score_high_intent(self):
+    def test_composite_score_high_intent(self, fresh_scorer):
         """Test high intent scenario (HOT lead)."""
-        now = datetime.now()
-        
         signals = [
             # High value demo request
             SignalEvent(
                 type=SignalType.EVENT_ATTENDANCE, # Demo request equiv
                 user_id="u1",
-                timestamp=now,
+                timestamp=NOW,
                 source=SignalSource.LINKEDIN,
                 data={"event_type": "demo_request"},
                 strength=1.0,
@@ -226,37 +366,213 @@ class TestCompositeIntentScore:
             SignalEvent(
                 type=SignalType.PROFILE_VISIT,
                 user_id="u1",
-                timestamp=now - timedelta(hours=2),
+                timestamp=NOW - timedelta(hours=2),
                 source=SignalSource.LINKEDIN,
                 strength=0.8,
             )
         ]
         
         # Update config to ensure demo request is weighted heavily
-        self.scorer.config.signal_weights["event_attendance"] = 75.0
+        fresh_scorer.config.signal_weights["event_attendance"] = 75.0
         
-        result = self.scorer.calculate_intent_score(signals)
+        result = fresh_scorer.calculate_intent_score(signals)
         
         assert result.label == IntentLabel.HIGH
         assert result.score > 70.0
     
-    def test_composite_score_low_intent(self):
+    def test_composite_score_low_intent(self, scorer):
         """Test low intent scenario (Cold lead)."""
-        now = datetime.now()
-        
         signals = [
             # Old, weak signal
             SignalEvent(
                 type=SignalType.CONTENT_ENGAGEMENT,
                 user_id="u1",
-                timestamp=now - timedelta(days=10), # Very old
+                timestamp=NOW - timedelta(days=10), # Very old
                 source=SignalSource.LINKEDIN,
                 data={"event_type": "like"}, # Low weight
                 strength=0.3,
             )
         ]
         
-        result = self.scorer.calculate_intent_score(signals)
+        result = scorer.calculate_intent_score(signals)
         
         assert result.label == IntentLabel.LOW
         assert result.score < 30.0
+
+    def test_breakdown_opt_in(self, scorer):
+        """Per-signal breakdown is only built when requested."""
+        signal = SignalEvent(
+            type=SignalType.PROFILE_VISIT,
+            user_id="u1",
+            timestamp=NOW - timedelta(hours=3),
+            source=SignalSource.LINKEDIN,
+        )
+
+        plain = scorer.calculate_intent_score([signal])
+        detailed = scorer.calculate_intent_score([signal], include_breakdown=True)
+
+        assert "signals" not in plain.breakdown
+        assert detailed.score == plain.score
+        assert len(detailed.breakdown["signals"]) == 1
+        assert detailed.breakdown["signals"][0]["type"] == "profile_visit"
+
+
+class TestSigmoidLookup:
+    """Lookup-table sigmoid stays close to the exact function."""
+    
+    def test_matches_exact_sigmoid(self, scorer):
+        import math
+        for x in [-7.9, -3.0, -0.5, 0.0, 1.23, 4.0, 7.99]:
+            assert abs(scorer._sigmoid(x) - 1.0 / (1.0 + math.exp(-x))) < 1e-4
+    
+    def test_saturates_outside_range(self, scorer):
+        assert scorer._sigmoid(-20.0) == 0.0
+        assert scorer._sigmoid(20.0) == 1.0
+
+
+class TestBatchScoring:
+    """Vectorized batch scoring matches per-lead scoring."""
+    
+    def test_batch_matches_single(self, scorer):
+        signal_lists = [
+            [
+                SignalEvent(SignalType.PROFILE_VISIT, "u1", NOW - timedelta(hours=5), SignalSource.LINKEDIN, strength=0.8),
+                SignalEvent(SignalType.CONTENT_ENGAGEMENT, "u1", NOW, SignalSource.LINKEDIN,
+                            data={"event_type": "share"}),
+            ],
+            [],
+            [
+                SignalEvent(SignalType.FUNDING_ROUND, "c1", NOW - timedelta(days=3), SignalSource.CRUNCHBASE,
+                            data={"round_type": "series_a"}, strength=0.7),
+            ],
+        ]
+        
+        batch = scorer.calculate_intent_scores_batch(signal_lists)
+        
+        assert len(batch) == 3
+        for signals, result in zip(signal_lists, batch):
+            single = scorer.calculate_intent_score(signals)
+            assert result.score == single.score
+            assert result.label == single.label
+            assert result.signals_score == single.signals_score
+            assert result.recency_factor == pytest.approx(single.recency_factor, abs=1e-6)
+    
+    def test_batch_matches_single_random(self, scorer):
+        """1000 random signals over 100 leads score the same through the columnar batch path."""
+        rng = np.random.default_rng(0)
+        types = list(SignalType)
+        signal_lists = [
+            [
+                SignalEvent(
+                    types[rng.integers(len(types))], f"u{lead}",
+                    NOW - timedelta(hours=float(rng.uniform(0, 24 * 60))),
+                    SignalSource.LINKEDIN,
+                    data={"event_type": str(rng.choice(["like", "comment", "share"]))},
+                    strength=float(rng.uniform(0.1, 1.0)),
+                )
+                for _ in range(10)
+            ]
+            for lead in range(100)
+        ]
+        
+        batch = scorer.calculate_intent_scores_batch(signal_lists)
+        
+        for signals, result in zip(signal_lists, batch):
+            single = scorer.calculate_intent_score(signals)
+            # Sums differ only in float summation order (scores are rounded to 0.1)
+            assert result.score == pytest.approx(single.score, abs=0.1)
+            assert result.signals_score == pytest.approx(single.signals_score, abs=0.1)
+            assert result.recency_factor == pytest.approx(single.recency_factor, abs=1e-6)
+    
+    def test_batch_empty(self, scorer):
+        assert scorer.calculate_intent_scores_batch([]) == []
+
+    def test_fixed_point_close_to_float(self, scorer):
+        signal_lists = [
+            [
+                SignalEvent(SignalType.PROFILE_VISIT, "u1", NOW - timedelta(hours=30), SignalSource.LINKEDIN, strength=0.63),
+                SignalEvent(SignalType.CONTENT_ENGAGEMENT, "u1", NOW, SignalSource.LINKEDIN,
+                            data={"event_type": "comment"}, strength=0.9),
+            ],
+            [
+                SignalEvent(SignalType.DEMO_REQUEST, "u2", NOW - timedelta(days=2), SignalSource.COMPANY_WEBSITE),
+            ],
+        ]
+
+        exact = scorer.calculate_intent_scores_batch(signal_lists)
+        quantized = scorer.calculate_intent_scores_batch(signal_lists, fixed_point=True)
+
+        for a, b in zip(exact, quantized):
+            assert abs(a.score - b.score) <= 0.5
+            assert abs(a.signals_score - b.signals_score) <= 0.5
+
+    def test_fixed_point_rejects_out_of_range_config(self):
+        """Weights or modifiers too large for int16/int32 raise instead of wrapping."""
+        signal_lists = [[
+            SignalEvent(SignalType.CONTENT_ENGAGEMENT, "u1", NOW, SignalSource.LINKEDIN,
+                        data={"event_type": "share"}),
+        ]]
+        for config in (
+            ScoringConfig(signal_weights={"content_engagement": 4000.0}),
+            ScoringConfig(action_modifiers={"share": 2100.0}),
+            ScoringConfig(signal_weights={"content_engagement": 3000.0},
+                          action_modifiers={"share": 20.0}),
+        ):
+            with pytest.raises(ValueError):
+                IntentScorer(config).calculate_intent_scores_batch(signal_lists, fixed_point=True)
+            # The float path has no such limit
+            assert IntentScorer(config).calculate_intent_scores_batch(signal_lists)[0].score > 0
+    
+    def test_weight_kernel_matches_numpy(self, scorer):
+        """Uncompiled kernel agrees with the vectorized decay + bincount."""
+        now_ts = NOW.timestamp()
+        ts_epoch = now_ts - np.array([0.5, 30.0, 900.0]) * 3600
+        base_weight = np.array([10.0, 15.0, 40.0])
+        modifier = np.array([3.0, 1.0, 1.0])
+        strength = np.array([0.5, 0.8, 0.7])
+        lead_idx = np.array([0, 0, 1])
+
+        raw_weight, decay = _weight_kernel(
+            ts_epoch, base_weight, modifier, strength, lead_idx,
+            now_ts, scorer._decay_rate, _DECAY_TABLE, 2
+        )
+
+        expected_decay = [scorer._decay_at(ts, now_ts) for ts in ts_epoch]
+        assert decay == pytest.approx(expected_decay)
+        expected = np.bincount(lead_idx, weights=base_weight * modifier * strength * decay, minlength=2)
+        assert raw_weight == pytest.approx(expected)
+
+    def test_decay_kernel_matches_numpy(self, scorer):
+        """Uncompiled decay kernel agrees with the per-signal decay."""
+        now_ts = NOW.timestamp()
+        ts_epoch = now_ts - np.array([-1.0, 0.5, 30.0, 719.9, 720.0, 900.0]) * 3600
+        
+        decay = _decay_kernel(ts_epoch, now_ts, scorer._decay_rate, _DECAY_TABLE)
+        
+        expected = [scorer._decay_at(ts, now_ts) for ts in ts_epoch]
+        assert decay == pytest.approx(expected)
+
+
+class TestIntentScoreRecord:
+    """Flat record export for bulk serialization."""
+
+    def test_record_matches_dict(self):
+        result = IntentScore(score=55.0, label=IntentLabel.MEDIUM, signals_score=12.5,
+                             recency_factor=0.9, committee_factor=1.2)
+        record = result.to_record()
+        as_dict = result.to_dict()
+
+        assert len(record) == len(IntentScore.columns())
+        for name, value in zip(IntentScore.columns(), record):
+            assert as_dict[name] == value
+
+    def test_scores_to_json(self):
+        scores = [
+            IntentScore(score=82.5, label=IntentLabel.HIGH, signals_score=40.0),
+            IntentScore(score=12.0, label=IntentLabel.LOW, signals_score=1.5, recency_factor=0.4),
+        ]
+
+        decoded = json.loads(scores_to_json(scores))
+
+        assert decoded["columns"] == IntentScore.columns()
+        assert decoded["rows"] == [list(s.to_record()) for s in scores]
@@ -9,9 +9,11 @@ from src.baseline import preprocess_data, feature_engineering, train_model
 
 class TestBaseModel(unittest.TestCase):
 
-    def setUp(self):
-        # Create a tiny dummy dataset
-        self.raw_data = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        # Create a tiny dummy dataset once; preprocess_data and
+        # feature_engineering copy before writing, so it is never mutated
+        cls.raw_data = pd.DataFrame({
             'months_in_role': [10, 20],
             'funding_amount': [0, 100],
             'comp_views_3m': [6, 1],
@@ -25,24 +27,24 @@ class TestBaseModel(unittest.TestCase):
         """Test log transformation of funding."""
         df = preprocess_data(self.raw_data)
         self.assertTrue('funding_amount' in df.columns)
-        # log1p(0) should be 0
-        self.assertAlmostEqual(df.loc[0, 'funding_amount'], 0.0)
-        # log1p(100) should be approx 4.615
-        self.assertAlmostEqual(df.loc[1, 'funding_amount'], np.log1p(100))
+        # log1p(0) should be 0, log1p(100) approx 4.615
+        np.testing.assert_allclose(df['funding_amount'].to_numpy(), np.log1p([0, 100]))
 
     def test_feature_engineering_momentum(self):
         """Test momentum calculation."""
         # Row 0: own_views_1m=1, own_views_3m=3
         # Denom = 3 / 3 + 1 = 2
         # Ratio = 1 / 2 = 0.5
+        # Row 1: own_views_1m=0 -> 0.0
         df = feature_engineering(self.raw_data)
-        self.assertAlmostEqual(df.loc[0, 'own_surge_ratio'], 0.5)
+        np.testing.assert_allclose(df['own_surge_ratio'].to_numpy(), [0.5, 0.0])
 
     def test_feature_engineering_comp_intensity(self):
         """Test competitive intensity calculation."""
         # Row 0: comp_views_1m=2, comp_views_3m=6 -> 8
+        # Row 1: comp_views_1m=0, comp_views_3m=1 -> 1
         df = feature_engineering(self.raw_data)
-        self.assertEqual(df.loc[0, 'comp_intensity'], 8)
+        np.testing.assert_array_equal(df['comp_intensity'].to_numpy(), [8, 1])
 
     def test_model_training(self):
         """Test that the model trains and returns a scaler."""
@@ -1,20 +1,23 @@
 import unittest
 import torch
 import math
-import sys
-import os
 
-# Add parent directory to path so we can import src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from src.model.positional_encoding import PositionalEncoding
+from src.model.positional_encoding import PositionalEncoding, _build_pe
 
 class TestPositionalEncoding(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        # The encoding table is a fixed buffer, so one layer serves every test
+        cls.d_model = 128
+        cls.max_len = 32
+        cls.pe_layer = PositionalEncoding(d_model=cls.d_model, max_len=cls.max_len)
+    
     def setUp(self):
-        self.d_model = 128
-        self.max_len = 32
-        self.pe_layer = PositionalEncoding(d_model=self.d_model, max_len=self.max_len)
+        # Forward-only tests: skip autograd bookkeeping
+        inference = torch.inference_mode()
+        inference.__enter__()
+        self.addCleanup(inference.__exit__, None, None, None)
     
     def test_output_shape(self):
         """Test that output shape matches input shape"""
@@ -31,7 +34,8 @@ class TestPositionalEncoding(unittest.TestCase):
         x = torch.zeros(batch_size, seq_len, self.d_model)
         output1 = self.pe_layer(x)
         output2 = self.pe_layer(x)
-        self.assertTrue(torch.allclose(output1, output2))
+        # Same buffer, same input: bit-identical, checked in one pass
+        self.assertTrue(torch.equal(output1, output2))
     
     def test_decay_property(self):
         """Test that relative positions have consistent relationship (sanity check for frequencies)"""
@@ -50,7 +54,7 @@ class TestPositionalEncoding(unittest.TestCase):
         # Our implementation uses PE + X.
         # Since X is 0, Output IS PE.
         # PE values are sin/cos, so they are bounded [-1, 1].
-        self.assertTrue((pos0 >= -1).all() and (pos0 <= 1).all())
+        self.assertLessEqual(pos0.abs().max().item(), 1.0 + 1e-6)
 
     def test_values_match_formula(self):
         """Verify a specific value against the formula manually"""
@@ -67,5 +71,16 @@ class TestPositionalEncoding(unittest.TestCase):
         
         self.assertAlmostEqual(actual, expected, places=4)
 
+    def test_table_is_cached_but_not_shared(self):
+        """Same hyperparameters reuse the cached table; each layer owns its buffer"""
+        hits = _build_pe.cache_info().hits
+        other = PositionalEncoding(d_model=self.d_model, max_len=self.max_len)
+        self.assertGreater(_build_pe.cache_info().hits, hits)
+        
+        torch.testing.assert_close(other.pe, self.pe_layer.pe, atol=0, rtol=0)
+        other.pe.zero_()
+        self.assertTrue(self.pe_layer.pe.abs().sum() > 0)
+        self.assertTrue(_build_pe(self.d_model, self.max_len).abs().sum() > 0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,10 +7,17 @@ TDD Specs from Agents.md:
 - Test 3: Signal Aggregation
 """
 
+import json
 import pytest
 from datetime import datetime, timedelta
-from src.signals import LinkedInSignalMonitor, SignalEvent
-from src.signals.signal_event import SignalType, SignalSource
+from src.signals import LinkedInSignalMonitor, SignalEvent, signals_to_json, signals_from_json, decay_weights
+from src.signals.signal_event import SignalType, SignalSource, SIGNAL_TYPE_VALUES
+from src.signals.signal_store import SignalStore
+
+
+# Fixed reference time for the aggregation tests: signal timestamps are laid
+# out relative to it and aggregate_signals(now=NOW) windows against it
+NOW = datetime(2026, 2, 2, 12, 0)
 
 
 class TestEngagementDetection:
@@ -74,6 +81,29 @@ class TestEngagementDetection:
         """Missing required fields should raise ValueError."""
         with pytest.raises(ValueError, match="Missing required fields"):
             self.monitor.parse_engagement({"event_type": "like"})
+    
+    def test_batch_engagements_match_single(self):
+        """Batch parsing gives the same signals as one-at-a-time."""
+        payloads = [
+            {"event_type": kind, "user_id": "user1", "post_id": f"post_{i}",
+             "timestamp": (datetime.now() - timedelta(hours=i)).isoformat()}
+            for i, kind in enumerate(["like", "comment", "share", "repost"])
+        ]
+        
+        batch = self.monitor.parse_engagements(payloads)
+        single = [LinkedInSignalMonitor().parse_engagement(p) for p in payloads]
+        
+        assert [s.to_dict() for s in batch] == [s.to_dict() for s in single]
+        assert [s.strength for s in batch] == [0.3, 0.7, 0.9, 0.5]
+    
+    def test_batch_engagements_validate_before_storing(self):
+        """A bad payload anywhere in the batch stores nothing."""
+        with pytest.raises(ValueError, match="Missing required fields"):
+            self.monitor.parse_engagements([
+                {"event_type": "like", "user_id": "user1", "post_id": "p1"},
+                {"event_type": "like", "user_id": "user1"},
+            ])
+        assert self.monitor.aggregate_signals("user1")["total_count"] == 0
 
 
 class TestProfileVisitTracking:
@@ -109,9 +139,8 @@ class TestProfileVisitTracking:
             "visit_count": 1,
         })
         
-        # Clear and create new monitor for fresh test
-        monitor2 = LinkedInSignalMonitor()
-        multiple_visits = monitor2.parse_profile_visit({
+        # Distinct visitor_id, so the same monitor gives an independent signal
+        multiple_visits = self.monitor.parse_profile_visit({
             "visitor_id": "user2",
             "visitor_url": "https://linkedin.com/in/test2",
             "visit_count": 5,
@@ -131,12 +160,28 @@ class TestProfileVisitTracking:
         
         # This week (3 days ago)
         three_days_ago = (datetime.now() - timedelta(days=3)).isoformat()
-        week_signal = LinkedInSignalMonitor().parse_profile_visit({
+        week_signal = self.monitor.parse_profile_visit({
             "visitor_id": "user2",
             "visitor_url": "https://linkedin.com/in/test2",
             "timestamp": three_days_ago,
         })
         assert week_signal.data["recency"] == "this_week"
+    
+    def test_batch_profile_visits_match_single(self):
+        """Batch parsing gives the same strength/recency as one-at-a-time."""
+        now = datetime.now()
+        payloads = [
+            {"visitor_id": f"user{i}", "visitor_url": f"https://linkedin.com/in/u{i}",
+             "visit_count": count, "timestamp": (now - timedelta(hours=hours)).isoformat()}
+            for i, (count, hours) in enumerate([(1, 2), (3, 50), (6, 400)])
+        ]
+        
+        batch = self.monitor.parse_profile_visits(payloads)
+        single = [LinkedInSignalMonitor().parse_profile_visit(p) for p in payloads]
+        
+        assert [s.data for s in batch] == [s.data for s in single]
+        assert [s.strength for s in batch] == [s.strength for s in single]
+        assert [s.data["recency"] for s in batch] == ["today", "this_week", "older"]
 
 
 class TestSignalAggregation:
@@ -160,29 +205,31 @@ class TestSignalAggregation:
         user_id = "urn:li:person:prospect123"
         
         # Add multiple signals
-        for i in range(5):
-            self.monitor.parse_engagement({
+        self.monitor.parse_engagements([
+            {
                 "event_type": "like",
                 "user_id": user_id,
                 "post_id": f"post_{i}",
-                "timestamp": (datetime.now() - timedelta(days=i)).isoformat(),
-            })
+                "timestamp": (NOW - timedelta(days=i)).isoformat(),
+            }
+            for i in range(5)
+        ])
         
-        result = self.monitor.aggregate_signals(user_id, window_days=7)
+        result = self.monitor.aggregate_signals(user_id, window_days=7, now=NOW)
         
         assert result["total_count"] == 5
         assert len(result["signals"]) == 5
         assert result["frequency_score"] > 0
         assert result["frequency_score"] <= 1.0
         assert "content_engagement" in result["signal_types"]
-        assert result["latest_timestamp"] is not None
+        assert result["latest_timestamp"] == NOW
     
     def test_aggregate_excludes_old_signals(self):
         """Signals outside window should be excluded."""
         user_id = "urn:li:person:test"
         
         # Add old signal (30 days ago)
-        old_timestamp = (datetime.now() - timedelta(days=30)).isoformat()
+        old_timestamp = (NOW - timedelta(days=30)).isoformat()
         self.monitor.parse_engagement({
             "event_type": "like",
             "user_id": user_id,
@@ -195,10 +242,10 @@ class TestSignalAggregation:
             "event_type": "comment",
             "user_id": user_id,
             "post_id": "new_post",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": NOW.isoformat(),
         })
         
-        result = self.monitor.aggregate_signals(user_id, window_days=7)
+        result = self.monitor.aggregate_signals(user_id, window_days=7, now=NOW)
         
         assert result["total_count"] == 1  # Only recent signal
     
@@ -208,23 +255,186 @@ class TestSignalAggregation:
         user2 = "user_many"
         
         # 2 signals for user1
-        for i in range(2):
+        timestamp = NOW.isoformat()
+        self.monitor.parse_engagements([
+            {"event_type": "like", "user_id": user1, "post_id": f"post_{i}", "timestamp": timestamp}
+            for i in range(2)
+        ])
+        
+        # 10 signals for user2
+        monitor2 = LinkedInSignalMonitor()
+        monitor2.parse_engagements([
+            {"event_type": "like", "user_id": user2, "post_id": f"post_{i}", "timestamp": timestamp}
+            for i in range(10)
+        ])
+        
+        result1 = self.monitor.aggregate_signals(user1, now=NOW)
+        result2 = monitor2.aggregate_signals(user2, now=NOW)
+        
+        assert result2["frequency_score"] > result1["frequency_score"]
+    
+    def test_out_of_order_signals_returned_latest_first(self):
+        """Signals arriving out of order are still returned newest first."""
+        user_id = "user_replay"
+        
+        for hours_ago in [5, 1, 30, 3]:
             self.monitor.parse_engagement({
                 "event_type": "like",
-                "user_id": user1,
-                "post_id": f"post_{i}",
+                "user_id": user_id,
+                "post_id": f"post_{hours_ago}",
+                "timestamp": (NOW - timedelta(hours=hours_ago)).isoformat(),
             })
         
-        # 10 signals for user2
-        monitor2 = LinkedInSignalMonitor()
-        for i in range(10):
-            monitor2.parse_engagement({
+        result = self.monitor.aggregate_signals(user_id, window_days=1, now=NOW)
+        
+        assert [s.data["post_id"] for s in result["signals"]] == ["post_1", "post_3", "post_5"]
+        assert result["latest_timestamp"] == NOW - timedelta(hours=1)
+    
+    def test_aggregate_with_explicit_now(self):
+        """A caller-supplied reference time sets the window."""
+        user_id = "user_now"
+        past = datetime.now() - timedelta(days=60)
+        self.monitor.parse_engagement({
+            "event_type": "like",
+            "user_id": user_id,
+            "post_id": "post_past",
+            "timestamp": (past - timedelta(days=1)).isoformat(),
+        })
+        
+        assert self.monitor.aggregate_signals(user_id, now=past)["total_count"] == 1
+        assert self.monitor.aggregate_signals(user_id)["total_count"] == 0
+    
+    def test_signals_pruned_past_retention(self):
+        """Aggregation drops signals older than the retention period; stores are capped."""
+        monitor = LinkedInSignalMonitor(retention_days=10, max_signals_per_user=3)
+        for days_ago in [20, 15, 2, 1]:
+            monitor.parse_engagement({
                 "event_type": "like",
-                "user_id": user2,
-                "post_id": f"post_{i}",
+                "user_id": "user_old",
+                "post_id": f"post_{days_ago}",
+                "company_id": "acme",
+                "timestamp": (NOW - timedelta(days=days_ago)).isoformat(),
             })
+        store = monitor._signal_store
+        assert len(store.user_rows["user_old"]) == 3
         
-        result1 = self.monitor.aggregate_signals(user1)
-        result2 = monitor2.aggregate_signals(user2)
+        result = monitor.aggregate_signals("user_old", window_days=30, now=NOW)
         
-        assert result2["frequency_score"] > result1["frequency_score"]
+        assert [s.data["post_id"] for s in result["signals"]] == ["post_1", "post_2"]
+        assert len(store.user_rows["user_old"]) == 2
+        assert len(store.company_rows["acme"]) == 2
+
+
+class TestSignalSerialization:
+    """Bulk JSON export of signals."""
+    
+    def test_signals_to_json_matches_to_dict(self):
+        monitor = LinkedInSignalMonitor()
+        signals = [
+            monitor.parse_engagement({"event_type": "share", "user_id": "u1", "post_id": "p1"}),
+            monitor.parse_engagement({
+                "event_type": "like", "user_id": "u2", "post_id": "p2",
+                "timestamp": "2024-03-01T12:00:00Z",
+            }),
+        ]
+        
+        decoded = json.loads(signals_to_json(signals))
+        
+        assert decoded == [s.to_dict() for s in signals]
+        assert SignalEvent.from_dict(decoded[1]).to_dict() == signals[1].to_dict()
+    
+    def test_signals_from_json_round_trip(self):
+        monitor = LinkedInSignalMonitor()
+        signals = [
+            monitor.parse_engagement({"event_type": "comment", "user_id": "u1", "post_id": "p1"}),
+            monitor.parse_profile_visit({
+                "visitor_id": "u2", "visitor_url": "https://linkedin.com/in/u2",
+                "timestamp": "2024-03-01T12:00:00Z",
+            }),
+        ]
+        
+        restored = signals_from_json(signals_to_json(signals))
+        
+        assert [s.to_dict() for s in restored] == [s.to_dict() for s in signals]
+    
+    def test_from_dict_rejects_unknown_type(self):
+        record = {"type": "bogus", "user_id": "u1", "timestamp": "2024-03-01T12:00:00", "source": "linkedin"}
+        
+        with pytest.raises(ValueError):
+            SignalEvent.from_dict(record)
+
+
+class TestDecayWeights:
+    """Vectorized decay over many signals."""
+    
+    def test_decay_weights_matches_scalar(self):
+        now = datetime.now()
+        signals = [
+            SignalEvent(SignalType.PROFILE_VISIT, "u1", now - timedelta(hours=h), SignalSource.LINKEDIN)
+            for h in [0, 12, 168, 500]
+        ]
+        
+        weights = decay_weights(signals, now=now.timestamp())
+        
+        expected = [s.decay_weight() for s in signals]
+        assert weights == pytest.approx(expected, rel=1e-4)
+
+
+class TestSignalStore:
+    """Columnar signal store."""
+    
+    def test_window_and_counts(self):
+        store = SignalStore()
+        now = datetime.now()
+        # More than the initial capacity to exercise growth
+        for i in range(100):
+            signal_type = SignalType.PROFILE_VISIT if i % 2 else SignalType.CONTENT_ENGAGEMENT
+            store.append(SignalEvent(signal_type, "u1", now - timedelta(hours=i), SignalSource.LINKEDIN))
+        
+        rows = store.window(store.user_rows["u1"], (now - timedelta(hours=9.5)).timestamp())
+        
+        assert rows.size == 10
+        assert store.type_counts(rows) == {"content_engagement": 5, "profile_visit": 5}
+        timestamps = [s.timestamp for s in store.signals(rows)]
+        assert timestamps == sorted(timestamps)
+    
+    def test_window_on_large_history(self):
+        """Narrow windows over a long history; a signal exactly at the cutoff is kept."""
+        monitor = LinkedInSignalMonitor()
+        monitor.parse_engagements([
+            {"event_type": "like", "user_id": "u_big", "post_id": f"post_{i}",
+             "timestamp": (NOW - timedelta(minutes=i)).isoformat()}
+            for i in range(10_000)
+        ])
+        
+        result = monitor.aggregate_signals("u_big", window_days=1, now=NOW)
+        
+        assert result["total_count"] == 24 * 60 + 1
+        assert result["signals"][-1].data["post_id"] == "post_1440"
+        assert monitor.aggregate_signals("u_big", window_days=0, now=NOW)["total_count"] == 1
+    
+    def test_capped_user_keeps_store_compact(self):
+        """Rows dropped by the per-user cap are reclaimed, not just hidden."""
+        monitor = LinkedInSignalMonitor(max_signals_per_user=100)
+        monitor.parse_engagements([
+            {"event_type": "like", "user_id": "u1", "post_id": f"post_{i}", "company_id": "acme",
+             "timestamp": (NOW - timedelta(seconds=1000 - i)).isoformat()}
+            for i in range(1000)
+        ])
+        store = monitor._signal_store
+        
+        assert len(store.user_rows["u1"]) == 100
+        assert store._size <= 2 * 100
+        assert len(store.events) == store._size
+        assert len(store.company_rows["acme"]) <= 2 * 100
+        
+        rows = store.window(store.company_rows["acme"])
+        assert [s.data["post_id"] for s in store.signals(rows)] == [f"post_{i}" for i in range(900, 1000)]
+        result = monitor.aggregate_signals("u1", window_days=1, now=NOW)
+        assert result["total_count"] == 100
+        assert result["signals"][0].data["post_id"] == "post_999"
+    
+    def test_type_id_indexes_type_values(self):
+        signal = SignalEvent(SignalType.FUNDING_ROUND, "u1", datetime.now(), SignalSource.CRUNCHBASE)
+        
+        assert SIGNAL_TYPE_VALUES[signal.type_id] == "funding_round"
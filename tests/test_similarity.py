@@ -1,16 +1,24 @@
 import unittest
+from unittest import mock
 import numpy as np
-import sys
-import os
 
-# Add parent directory to path so we can import src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from src.tokenizer import dot_product, cosine_similarity, euclidean_distance
+from src.tokenizer import (
+    dot_product, cosine_similarity, euclidean_distance,
+    dot_product_batch, cosine_similarity_batch, euclidean_distance_batch,
+    cosine_similarity_paired,
+)
+from src.tokenizer import similarity_numba
+from src.tokenizer.similarity_numba import cosine_batch, _cosine_batch_kernel
 
 
 class TestSimilarityFunctions(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        # Seeded, read-only row pairs shared by the bounds checks
+        rng = np.random.default_rng(0)
+        cls.vecX, cls.vecY = rng.standard_normal((2, 16, 5)).astype(np.float32)
+    
     def test_dot_product_basic(self):
         """Test basic dot product calculation"""
         vec1 = [1, 2, 3]
@@ -63,14 +71,25 @@ class TestSimilarityFunctions(unittest.TestCase):
     
     def test_cosine_similarity_bounds(self):
         """Test that cosine similarity is always in [-1, 1]"""
-        vecX = np.random.randn(10, 5) # Smaller batch for speed
-        vecY = np.random.randn(10, 5)
+        # Every row pair at once via the paired form, then one at a time
+        sims = cosine_similarity_paired(self.vecX, self.vecY)
+        self.assertTrue(np.all(sims >= -1.0 - 1e-5))
+        self.assertTrue(np.all(sims <= 1.0 + 1e-5))
+        
+        for x, y in zip(self.vecX, self.vecY):
+            sim = cosine_similarity(x, y)
+            self.assertGreaterEqual(sim, -1.0 - 1e-5)
+            self.assertLessEqual(sim, 1.0 + 1e-5)
+    
+    def test_cosine_similarity_paired_matches_scalar(self):
+        """Test that the row-paired version agrees with per-pair cosine similarity"""
+        rng = np.random.default_rng(4)
+        vecX = rng.normal(size=(10, 5))
+        vecY = rng.normal(size=(10, 5))
+        vecY[3] = 0  # zero-magnitude row
         
-        # Test just a few pairs manually since our func handles 1D standard vectors primarily
-        # But if it handles 2D, great. Assuming input is simple 1D as per docstring.
-        sim = cosine_similarity(vecX[0], vecY[0])
-        self.assertGreaterEqual(sim, -1.0 - 1e-5)
-        self.assertLessEqual(sim, 1.0 + 1e-5)
+        expected = [cosine_similarity(x, y) for x, y in zip(vecX, vecY)]
+        np.testing.assert_allclose(cosine_similarity_paired(vecX, vecY), expected, rtol=1e-6, atol=1e-12)
     
     def test_euclidean_distance_identical_vectors(self):
         """Test that identical vectors have distance of 0"""
@@ -103,6 +122,137 @@ class TestSimilarityFunctions(unittest.TestCase):
         dist_dissimilar = euclidean_distance(vec1, vec3)
         
         self.assertLess(dist_similar, dist_dissimilar)
+    
+    def test_list_fast_path_matches_numpy(self):
+        """Test that short list inputs (pure-Python path) match ndarray inputs"""
+        vec1 = [0.82, 0.35, -0.21, 0.91]
+        vec2 = [-0.53, -0.62, 0.89, -0.41]
+        
+        for fn in (dot_product, cosine_similarity, euclidean_distance):
+            self.assertAlmostEqual(fn(vec1, vec2), fn(np.array(vec1), np.array(vec2)), places=10)
+    
+    def test_list_fast_path_rejects_mismatched_lengths(self):
+        """Test that short lists of different lengths raise rather than truncate"""
+        for fn in (dot_product, cosine_similarity, euclidean_distance):
+            with self.assertRaises(ValueError):
+                fn([1, 2, 3], [1, 2])
+    
+    def test_cosine_similarity_batch_matches_scalar(self):
+        """Test that the batched version agrees with per-pair cosine similarity"""
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=16)
+        mat = rng.normal(size=(5, 16))
+        
+        result = cosine_similarity_batch(query, mat)
+        expected = [cosine_similarity(query, row) for row in mat]
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+        
+        # Cached row norms give the same answer
+        cached = cosine_similarity_batch(query, mat, row_norms=np.linalg.norm(mat, axis=1))
+        np.testing.assert_allclose(cached, result)
+    
+    def test_pairwise_batches_match_scalar(self):
+        """Test that the (m, n) pairwise helpers agree with the per-pair functions"""
+        rng = np.random.default_rng(2)
+        A = rng.normal(size=(3, 10))
+        B = rng.normal(size=(4, 10))
+        
+        for batch_fn, fn in ((dot_product_batch, dot_product),
+                             (cosine_similarity_batch, cosine_similarity),
+                             (euclidean_distance_batch, euclidean_distance)):
+            expected = [[fn(a, b) for b in B] for a in A]
+            np.testing.assert_allclose(batch_fn(A, B), expected, rtol=1e-6, atol=1e-12)
+        
+        # Identical rows: round-off must not produce NaN from sqrt of a negative
+        self.assertTrue(np.all(euclidean_distance_batch(A, A).diagonal() >= 0))
+    
+    def test_numba_cosine_batch_matches_numpy(self):
+        """Test the fused kernel (compiled or plain Python) and its fallback"""
+        rng = np.random.default_rng(1)
+        mat = rng.normal(size=(6, 8)).astype(np.float32)
+        query = rng.normal(size=8).astype(np.float32)
+        expected = cosine_similarity_batch(query, mat)
+        
+        np.testing.assert_allclose(cosine_batch(mat, query), expected, rtol=1e-5)
+        
+        out = np.empty(6, dtype=np.float32)
+        _cosine_batch_kernel(mat, query, out)
+        np.testing.assert_allclose(out, expected, rtol=1e-5)
+    
+    def test_numba_cosine_batch_rejects_bad_shapes(self):
+        """Test that shapes the unchecked kernel would overrun raise ValueError"""
+        mat = np.ones((4, 8), dtype=np.float32)
+        bad_calls = (
+            (np.ones(8, dtype=np.float32), np.ones(8, dtype=np.float32), None),   # 1-D mat
+            (mat, np.ones(9, dtype=np.float32), None),                             # long query
+            (mat, np.ones(7, dtype=np.float32), None),                             # short query
+            (mat, np.ones(8, dtype=np.float32), np.empty(3, dtype=np.float32)),    # short out
+        )
+        # Through both the fallback and the kernel path (plain Python when numba is missing)
+        kernel = similarity_numba._compiled_kernel or _cosine_batch_kernel
+        for compiled in (None, kernel):
+            with mock.patch.object(similarity_numba, "_compiled_kernel", compiled):
+                for args in bad_calls:
+                    with self.assertRaises(ValueError):
+                        cosine_batch(*args)
+
+    
+    def test_numba_pair_functions_match_numpy(self):
+        """Test the pairwise kernels (compiled or plain Python) and the public wrappers"""
+        rng = np.random.default_rng(3)
+        vec1 = rng.normal(size=32).astype(np.float32)
+        vec2 = rng.normal(size=32).astype(np.float32)
+        
+        pairs = (
+            (similarity_numba._dot_kernel, similarity_numba.dot_product, dot_product),
+            (similarity_numba._cosine_kernel, similarity_numba.cosine_similarity, cosine_similarity),
+            (similarity_numba._euclidean_kernel, similarity_numba.euclidean_distance, euclidean_distance),
+        )
+        for kernel, wrapper, reference in pairs:
+            expected = reference(vec1.astype(np.float64), vec2.astype(np.float64))
+            self.assertAlmostEqual(kernel(vec1, vec2), expected, places=4)
+            self.assertAlmostEqual(wrapper(vec1, vec2), expected, places=4)
+    
+    def test_numba_pair_functions_reject_mismatched_lengths(self):
+        """Test that the compiled path raises, like similarity.py, instead of overrunning"""
+        vec1 = np.ones(8, dtype=np.float32)
+        vec2 = np.ones(5, dtype=np.float32)
+        
+        kernels = {
+            "_compiled_dot": similarity_numba._dot_kernel,
+            "_compiled_cosine": similarity_numba._cosine_kernel,
+            "_compiled_euclidean": similarity_numba._euclidean_kernel,
+        }
+        wrappers = (similarity_numba.dot_product, similarity_numba.cosine_similarity,
+                    similarity_numba.euclidean_distance)
+        # Without numba, route the wrappers through the plain-Python kernels
+        # so the compiled-path checks still run
+        if not similarity_numba.HAVE_NUMBA:
+            for name, kernel in kernels.items():
+                patch = mock.patch.object(similarity_numba, name, kernel)
+                patch.start()
+                self.addCleanup(patch.stop)
+        
+        for wrapper in wrappers:
+            for a, b in ((vec1, vec2), (vec2, vec1)):
+                with self.assertRaises(ValueError):
+                    wrapper(a, b)
+    
+    @unittest.skipUnless(similarity_numba.HAVE_NUMBA, "numba not installed")
+    def test_numba_compiled_kernels_match_numpy(self):
+        """Test the jitted kernels themselves against the NumPy reference"""
+        rng = np.random.default_rng(5)
+        for dtype in (np.float32, np.float64):
+            mat = rng.normal(size=(7, 16)).astype(dtype)
+            query = rng.normal(size=16).astype(dtype)
+            out = np.empty(7, dtype=dtype)
+            similarity_numba._compiled_kernel(mat, query, out)
+            np.testing.assert_allclose(out, cosine_similarity_batch(query, mat), rtol=1e-4)
+            
+            for compiled, reference in ((similarity_numba._compiled_dot, dot_product),
+                                        (similarity_numba._compiled_cosine, cosine_similarity),
+                                        (similarity_numba._compiled_euclidean, euclidean_distance)):
+                self.assertAlmostEqual(compiled(mat[0], query), reference(mat[0], query), places=3)
 
 
 if __name__ == '__main__':
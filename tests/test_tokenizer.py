@@ -1,121 +1,82 @@
-import unittest
-import sys
+import json
 import os
+import tempfile
 
-# Add parent directory to path so we can import src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
+import pytest
 
 from src.tokenizer import SalesTokenizer
+from src.tokenizer.sales_tokenizer import _activity_bucket_kernel, MOMENTUM_EDGES, COMP_EDGES
 
 
-class TestSalesTokenizer(unittest.TestCase):
-    
-    def setUp(self):
-        """Run before each test - create a fresh tokenizer"""
-        self.tokenizer = SalesTokenizer()
+@pytest.fixture(scope="module")
+def tokenizer():
+    """One tokenizer for the module; no test mutates its vocab."""
+    return SalesTokenizer()
+
+
+class TestSalesTokenizer:
     
-    def test_vocab_size(self):
+    def test_vocab_size(self, tokenizer):
         """Test that vocabulary has correct size"""
-        self.assertEqual(len(self.tokenizer.vocab), 17)
+        assert len(tokenizer.vocab) == 17
     
-    def test_vocab_contains_special_tokens(self):
+    def test_vocab_contains_special_tokens(self, tokenizer):
         """Test that special tokens are in vocab"""
-        self.assertIn("[PAD]", self.tokenizer.vocab)
-        self.assertIn("[START]", self.tokenizer.vocab)
-        self.assertIn("[END]", self.tokenizer.vocab)
+        assert "[PAD]" in tokenizer.vocab
+        assert "[START]" in tokenizer.vocab
+        assert "[END]" in tokenizer.vocab
     
-    def test_tenure_buckets(self):
+    @pytest.mark.parametrize("months, expected", [
+        (2, "TENURE_NEW"),      # < 3 months
+        (5, "TENURE_SHORT"),    # 3-5 months
+        (10, "TENURE_MID"),     # 6-17 months
+        (39, "TENURE_LONG"),    # 18+ months
+    ])
+    def test_tenure_bucket(self, tokenizer, months, expected):
         """Test tenure tokenization with different values"""
-        # Test TENURE_NEW (< 3 months)
-        lead = {"months_in_role": 2, "funding_amount": 0, "own_views_3m": 1, "own_views_1m": 0, "comp_views_3m": 0, "comp_views_1m": 0}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("TENURE_NEW", tokens)
-        
-        # Test TENURE_SHORT (3-6 months)
-        lead["months_in_role"] = 5
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("TENURE_SHORT", tokens)
-        
-        # Test TENURE_MID (7-17 months)
-        lead["months_in_role"] = 10
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("TENURE_MID", tokens)
-        
-        # Test TENURE_LONG (18+ months)
-        lead["months_in_role"] = 39
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("TENURE_LONG", tokens)
+        lead = {"months_in_role": months, "funding_amount": 0, "own_views_3m": 1, "own_views_1m": 0, "comp_views_3m": 0, "comp_views_1m": 0}
+        tokens, _ = tokenizer.tokenize_lead(lead)
+        assert expected in tokens
     
-    def test_funding_buckets(self):
+    @pytest.mark.parametrize("funding, expected", [
+        (50000, "FUNDING_BOOTSTRAP"),
+        (500000, "FUNDING_SEED"),
+        (5000000, "FUNDING_SERIES_A"),
+        (50000000, "FUNDING_GROWTH"),
+    ])
+    def test_funding_bucket(self, tokenizer, funding, expected):
         """Test funding tokenization"""
-        base_lead = {"months_in_role": 5, "own_views_3m": 1, "own_views_1m": 0, "comp_views_3m": 0, "comp_views_1m": 0}
-        
-        # Bootstrap
-        lead = {**base_lead, "funding_amount": 50000}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("FUNDING_BOOTSTRAP", tokens)
-        
-        # Seed
-        lead = {**base_lead, "funding_amount": 500000}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("FUNDING_SEED", tokens)
-        
-        # Series A
-        lead = {**base_lead, "funding_amount": 5000000}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("FUNDING_SERIES_A", tokens)
-        
-        # Growth
-        lead = {**base_lead, "funding_amount": 50000000}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("FUNDING_GROWTH", tokens)
+        lead = {"months_in_role": 5, "funding_amount": funding, "own_views_3m": 1, "own_views_1m": 0, "comp_views_3m": 0, "comp_views_1m": 0}
+        tokens, _ = tokenizer.tokenize_lead(lead)
+        assert expected in tokens
     
-    def test_momentum_calculation(self):
+    @pytest.mark.parametrize("own_views_3m, own_views_1m, expected", [
+        (0, 0, "MOMENTUM_DECLINING"),     # zero views: 0 / (0 + eps) = 0
+        (6, 1, "MOMENTUM_DECLINING"),     # surge < 0.8
+        (3, 1, "MOMENTUM_STABLE"),        # denom = 3/3 = 1, surge = 1.0
+        (1, 3, "MOMENTUM_ACCELERATING"),  # surge >= 1.2
+    ])
+    def test_momentum_bucket(self, tokenizer, own_views_3m, own_views_1m, expected):
         """Test momentum tokenization"""
-        base_lead = {"months_in_role": 5, "funding_amount": 1000000, "comp_views_3m": 0, "comp_views_1m": 0}
-        
-        # Zero views
-        # Declining (surge < 0.8) -> 0 / (0 + eps) = 0
-        lead = {**base_lead, "own_views_3m": 0, "own_views_1m": 0}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("MOMENTUM_DECLINING", tokens)
-
-        # Declining (surge < 0.8)
-        lead = {**base_lead, "own_views_3m": 6, "own_views_1m": 1}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("MOMENTUM_DECLINING", tokens)
-        
-        # Stable (0.8 <= surge < 1.2)
-        # Denom = 3/3 = 1. To get 1.0, own_views_1m must be 1.
-        lead = {**base_lead, "own_views_3m": 3, "own_views_1m": 1}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("MOMENTUM_STABLE", tokens)
-        
-        # Accelerating (surge >= 1.2)
-        lead = {**base_lead, "own_views_3m": 1, "own_views_1m": 3}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("MOMENTUM_ACCELERATING", tokens)
+        lead = {"months_in_role": 5, "funding_amount": 1000000, "comp_views_3m": 0, "comp_views_1m": 0,
+                "own_views_3m": own_views_3m, "own_views_1m": own_views_1m}
+        tokens, _ = tokenizer.tokenize_lead(lead)
+        assert expected in tokens
     
-    def test_competition_intensity(self):
+    @pytest.mark.parametrize("comp_views_3m, comp_views_1m, expected", [
+        (1, 1, "COMP_LOW"),
+        (3, 2, "COMP_MED"),
+        (8, 5, "COMP_HIGH"),
+    ])
+    def test_competition_bucket(self, tokenizer, comp_views_3m, comp_views_1m, expected):
         """Test competition tokenization"""
-        base_lead = {"months_in_role": 5, "funding_amount": 1000000, "own_views_3m": 1, "own_views_1m": 1}
-        
-        # Low
-        lead = {**base_lead, "comp_views_3m": 1, "comp_views_1m": 1}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("COMP_LOW", tokens)
-        
-        # Med
-        lead = {**base_lead, "comp_views_3m": 3, "comp_views_1m": 2}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("COMP_MED", tokens)
-        
-        # High
-        lead = {**base_lead, "comp_views_3m": 8, "comp_views_1m": 5}
-        tokens, _ = self.tokenizer.tokenize_lead(lead)
-        self.assertIn("COMP_HIGH", tokens)
+        lead = {"months_in_role": 5, "funding_amount": 1000000, "own_views_3m": 1, "own_views_1m": 1,
+                "comp_views_3m": comp_views_3m, "comp_views_1m": comp_views_1m}
+        tokens, _ = tokenizer.tokenize_lead(lead)
+        assert expected in tokens
     
-    def test_full_tokenization_no_padding(self):
+    def test_full_tokenization_no_padding(self, tokenizer):
         """Test complete tokenization for sample lead 1"""
         lead = {
             "months_in_role": 39,
@@ -126,17 +87,17 @@ class TestSalesTokenizer(unittest.TestCase):
             "own_views_1m": 0
         }
         
-        tokens, token_ids = self.tokenizer.tokenize_lead(lead)
+        tokens, token_ids = tokenizer.tokenize_lead(lead)
         # Current implementation should NOT have [PAD]
-        self.assertNotIn('[PAD]', tokens)
-        self.assertEqual(tokens[0], "[START]")
-        self.assertEqual(tokens[-1], "[END]")
+        assert '[PAD]' not in tokens
+        assert tokens[0] == "[START]"
+        assert tokens[-1] == "[END]"
         
         expected_tokens = ['[START]', 'TENURE_LONG', 'FUNDING_BOOTSTRAP', 'MOMENTUM_DECLINING', 'COMP_LOW', '[END]']
-        self.assertEqual(tokens, expected_tokens)
-        self.assertEqual(len(token_ids), 6)
+        assert tokens == expected_tokens
+        assert len(token_ids) == 6
     
-    def test_round_trip_conversion(self):
+    def test_round_trip_conversion(self, tokenizer):
         """Test that token -> ID -> token conversion works"""
         lead = {
             "months_in_role": 5,
@@ -147,10 +108,91 @@ class TestSalesTokenizer(unittest.TestCase):
             "own_views_1m": 0
         }
         
-        tokens, token_ids = self.tokenizer.tokenize_lead(lead)
-        reconstructed = self.tokenizer.ids_to_tokens(token_ids)
+        tokens, token_ids = tokenizer.tokenize_lead(lead)
+        reconstructed = tokenizer.ids_to_tokens(token_ids)
         
-        self.assertEqual(tokens, reconstructed)
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+        assert tokens == reconstructed
+    
+    def test_save_and_load_vocab(self, tokenizer):
+        """Test that a saved vocab reloads with a working reverse map"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "vocab.json")
+            tokenizer.save_vocab(path)
+            
+            other = SalesTokenizer()
+            other.vocab = {"[PAD]": 0, "[START]": 1}
+            other.load_vocab(path)
+        
+        assert other.vocab == tokenizer.vocab
+        all_ids = list(range(len(other.vocab)))
+        assert other.ids_to_tokens(all_ids) == tokenizer.ids_to_tokens(all_ids)
+    
+    def test_ids_to_tokens_rejects_unknown_ids(self, tokenizer):
+        """Test that IDs outside the vocab raise instead of wrapping around the list"""
+        for bad in (-1, len(tokenizer.vocab)):
+            with pytest.raises(KeyError):
+                tokenizer.ids_to_tokens([0, bad])
+            with pytest.raises(KeyError):
+                tokenizer.ids_to_tokens([bad])
+    
+    def test_load_vocab_rejects_sparse_ids(self):
+        """Test that a vocab whose IDs are not 0..V-1 is rejected and leaves the tokenizer intact"""
+        other = SalesTokenizer()
+        original = dict(other.vocab)
+        with tempfile.TemporaryDirectory() as tmp:
+            for vocab in ({**original, "EXTRA": 100}, {"[PAD]": 1, "[START]": 2}, {"A": 0, "B": 0}):
+                path = os.path.join(tmp, "vocab.json")
+                with open(path, "w") as f:
+                    json.dump(vocab, f)
+                with pytest.raises(ValueError):
+                    other.load_vocab(path)
+        
+        assert other.vocab == original
+        assert other.ids_to_tokens([0]) == ["[PAD]"]
+    
+    def test_signal_tokens_without_strings(self, tokenizer):
+        """Test signal ID lookup and the IDs-only path"""
+        lead = {"months_in_role": 12, "funding_amount": 5000000}
+        signals = [{"type": "funding_round"}, {"type": "not_a_signal"}, {"type": "Demo_Request"}]
+        
+        tokens, token_ids = tokenizer.tokenize_lead(lead, signals)
+        assert tokens[-3:] == ["SIGNAL_FUNDING_ROUND", "SIGNAL_DEMO_REQUEST", "[END]"]
+        
+        no_strings, ids_only = tokenizer.tokenize_lead(lead, signals, return_strings=False)
+        assert no_strings is None
+        assert ids_only == token_ids
+    
+    def test_tokenize_batch_matches_single(self, tokenizer):
+        """Test that batch tokenization gives the same IDs as tokenize_lead per row"""
+        leads = [
+            {"months_in_role": 2, "funding_amount": 50000, "own_views_3m": 30, "own_views_1m": 5},
+            {"months_in_role": 6, "funding_amount": 1000000, "comp_views_3m": 4, "comp_views_1m": 6,
+             "own_views_3m": 3, "own_views_1m": 1},
+            {"months_in_role": 40, "funding_amount": 2e7, "comp_views_1m": 2, "own_views_1m": 9},
+        ]
+        signals_list = [
+            [{"type": "funding_round"}, {"type": "unknown_signal"}, {"type": "demo_request"}],
+            None,
+            [{"type": "profile_visit"}],
+        ]
+        
+        batch = tokenizer.tokenize_batch(leads, signals_list)
+        
+        assert batch.dtype.name == "int32"
+        for row, lead, signals in zip(batch, leads, signals_list):
+            _, token_ids = tokenizer.tokenize_lead(lead, signals)
+            pad = [tokenizer.vocab["[PAD]"]] * (len(row) - len(token_ids))
+            assert row.tolist() == token_ids + pad
+    
+    def test_activity_bucket_kernel_matches_digitize(self):
+        """Test that the (numba-compilable) bucket kernel agrees with np.digitize"""
+        rng = np.random.default_rng(0)
+        own_1m, own_3m, comp_1m, comp_3m = rng.integers(0, 12, size=(4, 500)).astype(np.float64)
+        momentum_out = np.empty(500, dtype=np.int32)
+        comp_out = np.empty(500, dtype=np.int32)
+        
+        _activity_bucket_kernel(own_1m, own_3m, comp_1m, comp_3m, 10, 20, momentum_out, comp_out)
+        
+        surge = own_1m / (own_3m / 3.0 + 1e-8)
+        assert momentum_out.tolist() == (10 + np.digitize(surge, MOMENTUM_EDGES)).tolist()
+        assert comp_out.tolist() == (20 + np.digitize(comp_1m + comp_3m, COMP_EDGES)).tolist()